@@ -1,40 +1,53 @@
+import logging
 from TransformationRules.transformationutils import generateId, getIdLength, getExistingIds, \
-    findGeneralizationChildClasses, findClassId, findRelatedRelationships, findClassesByPartialName
+    findGeneralizationChildClasses, findClassId, findClassesByPartialName, buildNameToIdMap
 import pandas as pd
 from TransformationRules.constants import (CIM_REAL_TWIN_CLASS_NAME, PHYSICAL_ENTITY_CLASS_NAME,
                                            TEMPORAL_ENTITY_CLASS_NAME, SENSOR_ENTITY_CLASS_NAME,
                                            ACTUATOR_ENTITY_CLASS_NAME, PIM_REAL_TWIN_CLASS_NAME)
 
+# Logger of the warnings about CIM classes the rules expect but cannot find
+logger = logging.getLogger(__name__)
+
 
 def cim2pimTransformation(cimClasses, cimRelations):
     pimRelations = pd.DataFrame(
         columns=["Relationship Type", "From Class ID", "From Class Name", "To Class ID", "To Class Name",
                  "Aggregation"])
     pimClasses = {}
+    # Every PIM class ID is generated against a single set, seeded with the CIM class IDs and shared by all rules
+    existingIds = getExistingIds(cimClasses)
+    idLength = getIdLength(cimClasses)
 
     # RULE 1. mapToPhysicalTwin
-    pimClasses = mapToPhysicalTwin(cimClasses, cimRelations, CIM_REAL_TWIN_CLASS_NAME)
+    pimClasses = mapToPhysicalTwin(cimClasses, cimRelations, CIM_REAL_TWIN_CLASS_NAME, existingIds, idLength)
 
     # RULE 2. digitalizePhysicalEntity
-    pimClasses, pimRelations = digitalizePhysicalEntity(cimClasses, cimRelations, pimClasses, pimRelations)
+    pimClasses, pimRelations = digitalizePhysicalEntity(cimClasses, cimRelations, pimClasses, pimRelations,
+                                                        existingIds, idLength)
 
     #RULE 3. transformTemporalEntity
-    pimClasses, pimRelations = transformTemporalEntity(cimClasses, cimRelations, pimClasses, pimRelations)
+    pimClasses, pimRelations = transformTemporalEntity(cimClasses, cimRelations, pimClasses, pimRelations,
+                                                       existingIds, idLength)
 
     # RULE 4. transformTemporalEntity
-    pimClasses, pimRelations = mergeShadowModelFlow(cimClasses, cimRelations, pimClasses, pimRelations)
+    pimClasses, pimRelations = mergeShadowModelFlow(cimClasses, cimRelations, pimClasses, pimRelations,
+                                                    existingIds, idLength)
 
     # RULE 5. transformSensor
-    pimClasses, pimRelations = transformSensor(cimClasses, cimRelations, pimClasses, pimRelations)
+    pimClasses, pimRelations = transformSensor(cimClasses, cimRelations, pimClasses, pimRelations,
+                                               existingIds, idLength)
 
     # RULE 6. transformActuator
-    pimClasses, pimRelations = transformActuator(cimClasses, cimRelations, pimClasses, pimRelations)
+    pimClasses, pimRelations = transformActuator(cimClasses, cimRelations, pimClasses, pimRelations,
+                                                 existingIds, idLength)
 
     # RULE 7. integrateServiceFeedback
-    pimClasses, pimRelations = integrateServiceFeedback(cimClasses, cimRelations, pimClasses, pimRelations)
+    pimClasses, pimRelations = integrateServiceFeedback(cimClasses, cimRelations, pimClasses, pimRelations,
+                                                        existingIds, idLength)
 
     # RULE 8. integrateDataManager
-    pimClasses, pimRelations = integrateDataManager(pimClasses, pimRelations)
+    pimClasses, pimRelations = integrateDataManager(pimClasses, pimRelations, existingIds, idLength)
 
     return pimClasses, pimRelations
 
@@ -54,8 +67,7 @@ def createPhysicalTwinClasses(childClasses, existingIds, idLength):
     """
     pimClasses = []
 
-    for _, row in childClasses.iterrows():
-        childClassName = row['To Class Name']
+    for childClassName in childClasses['To Class Name']:
 
         # Generate a new unique ID and append 'PhysicalTwin' to the class name
         newId = generateId(existingIds, length=idLength)
@@ -71,7 +83,7 @@ def createPhysicalTwinClasses(childClasses, existingIds, idLength):
         existingIds.add(newId)
 
     return pd.DataFrame(pimClasses)
-def mapToPhysicalTwin(cimClasses, cimRelations, parentClassName):
+def mapToPhysicalTwin(cimClasses, cimRelations, parentClassName, existingIds=None, idLength=None):
     """
     Map a system class from CIM to its respective 'PhysicalTwin' classes in PIM.
 
@@ -80,13 +92,17 @@ def mapToPhysicalTwin(cimClasses, cimRelations, parentClassName):
         cimRelations (pd.DataFrame): DataFrame of CIM relationships.
         parentClassName (str): The name of the parent class from which the child classes are mapped
                                to their 'PhysicalTwin' counterparts.
+        existingIds (set): Optional set of class IDs already in use, shared across rules and updated in place.
+        idLength (int): Optional length of the generated class IDs.
 
     Returns:
         pd.DataFrame: DataFrame of newly created 'PhysicalTwin' classes with unique IDs.
     """
     # Step 1: Get the length of existing class IDs and the list of existing IDs
-    idLength = getIdLength(cimClasses)
-    existingIds = getExistingIds(cimClasses)
+    if idLength is None:
+        idLength = getIdLength(cimClasses)
+    if existingIds is None:
+        existingIds = getExistingIds(cimClasses)
     # Step 2: Find all child classes that have a generalization relationship with the specified parent class
     parentClassId = cimClasses[cimClasses['Class Name'] == parentClassName]['Class ID'].values[0]
     childClasses = findGeneralizationChildClasses(cimRelations, parentClassId)
@@ -140,14 +156,13 @@ def createDigitalModels(cimClasses, cimRelations, existingIds, idLength):
     physicalEntitiesID = searchPhysicalEntityClass(cimClasses, PHYSICAL_ENTITY_CLASS_NAME)
 
     if not physicalEntitiesID:
-        print(f"Warning: No RealSystem class found with name '{PHYSICAL_ENTITY_CLASS_NAME}'.")
+        logger.warning("No RealSystem class found with name '%s'.", PHYSICAL_ENTITY_CLASS_NAME)
         return []
 
     realSystems = searchPhysicalEntities(cimClasses, physicalEntitiesID, cimRelations)
     digitalModels = []
 
-    for _, row in realSystems.iterrows():
-        cimClassName = row['To Class Name']
+    for cimClassName in realSystems['To Class Name']:
         # Generate new ID and create the DigitalModel class
         newId = generateId(existingIds, idLength)
         newClassName = 'Digital' + cimClassName
@@ -203,13 +218,26 @@ def createDigitalRelations(cimClasses, cimRelations, newPimClasses, pimRelations
         pd.DataFrame: Updated PIM relationships with digital model relationships added.
     """
 
-    newRelationships = []
+    # Collect the new relationships as parallel column lists, turned into a DataFrame once at the end
+    newRelationships = {column: [] for column in ['Relationship Type', 'From Class ID', 'From Class Name',
+                                                  'To Class ID', 'To Class Name', 'Aggregation']}
     processedRelationships = set()  # To track already processed relationships and avoid duplicates
 
+    # Bucket the CIM relationships by the classes at both ends once, instead of scanning them for every class
+    relationsByClass = {}
+    for relation in cimRelations[['Relationship Type', 'From Class ID', 'From Class Name', 'To Class ID',
+                                  'To Class Name']].itertuples(index=False, name=None):
+        relationsByClass.setdefault(relation[1], []).append(relation)
+        if relation[3] != relation[1]:
+            relationsByClass.setdefault(relation[3], []).append(relation)
+
+    # Names of the digital model classes by ID and IDs by name, for the two ends of the new relationships
+    digitalClassNames = dict(zip(newPimClasses['Class ID'], newPimClasses['Class Name']))
+    digitalClassIds = buildNameToIdMap(newPimClasses)
+
     # Loop through each new digital model class
-    for _, newPimClassRow in newPimClasses.iterrows():
+    for newPimClassId, digitalClassName in newPimClasses[['Class ID', 'Class Name']].itertuples(index=False, name=None):
         # Extract the original class name by removing 'Model' from the new digital class name
-        digitalClassName = newPimClassRow['Class Name']
         originalClassName = digitalClassName.replace('Digital', '')
 
         # Find the corresponding CIM class with the same original class name
@@ -217,29 +245,27 @@ def createDigitalRelations(cimClasses, cimRelations, newPimClasses, pimRelations
 
         # Skip if no matching CIM class is found
         if cimClass.empty:
-            print(f"Warning: No corresponding CIM class found for {digitalClassName}.")
+            logger.warning("No corresponding CIM class found for %s.", digitalClassName)
             continue
 
         cimClassId = cimClass['Class ID'].values[0]
 
-        # Find all relationships in CIM where the current CIM class is involved (as either 'from' or 'to')
-        relatedCimRelations = findRelatedRelationships(cimRelations, cimClassId)
-
-        # Loop through each related relationship and find the digital counterparts
-        for _, relationRow in relatedCimRelations.iterrows():
+        # Loop through each relationship where the current CIM class is involved (as either 'from' or 'to')
+        # and find the digital counterparts
+        for relationType, relationFromId, relationFromName, relationToId, relationToName in relationsByClass.get(
+                cimClassId, ()):
             fromId, toId = None, None
-            relationType = relationRow['Relationship Type']
             aggregationKind = None  # Default to None unless it's aggregation/composition
 
             # Determine the correct digital model class names for 'from' and 'to'
-            if relationRow['From Class ID'] == cimClassId:
-                fromId = newPimClassRow['Class ID']
-                toClassName = 'Digital' + relationRow['To Class Name']  # Convert CIM class to digital model name
-                toId = findClassId(newPimClasses, toClassName)
-            elif relationRow['To Class ID'] == cimClassId:
-                toId = newPimClassRow['Class ID']
-                fromClassName = 'Digital' + relationRow['From Class Name']
-                fromId = findClassId(newPimClasses, fromClassName)
+            if relationFromId == cimClassId:
+                fromId = newPimClassId
+                toClassName = 'Digital' + relationToName  # Convert CIM class to digital model name
+                toId = findClassId(newPimClasses, toClassName, digitalClassIds)
+            elif relationToId == cimClassId:
+                toId = newPimClassId
+                fromClassName = 'Digital' + relationFromName
+                fromId = findClassId(newPimClasses, fromClassName, digitalClassIds)
 
             # Skip if either of the digital classes isn't found
             if not fromId or not toId:
@@ -266,14 +292,12 @@ def createDigitalRelations(cimClasses, cimRelations, newPimClasses, pimRelations
 
             if relationTuple not in processedRelationships:
                 # Add the new relationship between the digital classes
-                newRelationships.append({
-                    'Relationship Type': relationType,
-                    'From Class ID': fromId,
-                    'From Class Name': newPimClasses[newPimClasses['Class ID'] == fromId]['Class Name'].values[0],
-                    'To Class ID': toId,
-                    'To Class Name': newPimClasses[newPimClasses['Class ID'] == toId]['Class Name'].values[0],
-                    'Aggregation': aggregationKind
-                })
+                newRelationships['Relationship Type'].append(relationType)
+                newRelationships['From Class ID'].append(fromId)
+                newRelationships['From Class Name'].append(digitalClassNames[fromId])
+                newRelationships['To Class ID'].append(toId)
+                newRelationships['To Class Name'].append(digitalClassNames[toId])
+                newRelationships['Aggregation'].append(aggregationKind)
                 processedRelationships.add(relationTuple)
 
     # Append the new relationships to the existing PIM relationships
@@ -333,26 +357,27 @@ def addAggregationModelManager(digitalModelID, digitalModelManagerId, pimRelatio
     newAggregationRelationDf = pd.DataFrame(newAggregationRelation)
     pimRelations = pd.concat([pimRelations, newAggregationRelationDf], ignore_index=True)
     return pimRelations
-def digitalizePhysicalEntity(cimClasses, cimRelations, pimClasses, pimRelations):
-    existingIds = getExistingIds(pimClasses)
-    idLength = getIdLength(pimClasses)
+def digitalizePhysicalEntity(cimClasses, cimRelations, pimClasses, pimRelations, existingIds=None, idLength=None):
+    if existingIds is None:
+        existingIds = getExistingIds(pimClasses)
+    if idLength is None:
+        idLength = getIdLength(pimClasses)
     digitalModels = createDigitalModels(cimClasses, cimRelations, existingIds, idLength)
     newDigitalModels = pd.DataFrame(digitalModels)
-    pimClasses = pd.concat([pimClasses, newDigitalModels], ignore_index=True)
     pimRelations = createDigitalRelations(cimClasses, cimRelations, newDigitalModels, pimRelations)
 
     digitalModelID = addDigitalModel(existingIds, idLength)
-    pimClasses = pd.concat([pimClasses, pd.DataFrame([{'Class ID': digitalModelID, 'Class Name': 'DigitalModel'}])],
-                           ignore_index=True)
     newGeneralizationRelations = addGeneralizationModels(digitalModels, digitalModelID)
     pimRelations = pd.concat([pimRelations, pd.DataFrame(newGeneralizationRelations)], ignore_index=True)
 
     digitalModelManagerID = addDigitalModelManager(existingIds, idLength)
-    pimClasses = pd.concat(
-        [pimClasses, pd.DataFrame([{'Class ID': digitalModelManagerID, 'Class Name': 'DigitalModelManager'}])],
-        ignore_index=True)
     pimRelations = addAggregationModelManager(digitalModelID, digitalModelManagerID, pimRelations)
 
+    # Add the digital models, DigitalModel and DigitalModelManager classes in a single concat
+    newClasses = digitalModels + [{'Class ID': digitalModelID, 'Class Name': 'DigitalModel'},
+                                  {'Class ID': digitalModelManagerID, 'Class Name': 'DigitalModelManager'}]
+    pimClasses = pd.concat([pimClasses, pd.DataFrame(newClasses)], ignore_index=True)
+
     pimClasses = pimClasses.drop_duplicates(subset='Class Name', keep='first', ignore_index=True)
     pimRelations = pimRelations.drop_duplicates(subset=['From Class Name', 'To Class Name', 'Relationship Type'],
                                                 keep='first', ignore_index=True)
@@ -402,8 +427,7 @@ def createDigitalShadows(cimClasses, cimRelations, existingIds, idLength):
     temporalEntities = searchTemporalEntities(cimClasses, temporalEntityId, cimRelations)
     digitalShadows = []
 
-    for _, row in temporalEntities.iterrows():
-        cimClassName = row['To Class Name']
+    for cimClassName in temporalEntities['To Class Name']:
         # Generate new ID and create the shadow class
         newId = generateId(existingIds, idLength)
         newClassName = cimClassName + 'Shadow'
@@ -498,7 +522,7 @@ def addAggregationManager(digitalShadowID, digitalShadowManagerId, pimRelations)
     pimRelations = pd.concat([pimRelations, newAggregationRelationDf], ignore_index=True)
 
     return pimRelations
-def transformTemporalEntity(cimClasses, cimRelations, pimClasses, pimRelations):
+def transformTemporalEntity(cimClasses, cimRelations, pimClasses, pimRelations, existingIds=None, idLength=None):
     """
     Transforms Temporal Entities into Digital Shadows and manages relationships.
 
@@ -507,21 +531,22 @@ def transformTemporalEntity(cimClasses, cimRelations, pimClasses, pimRelations):
         cimRelations (pd.DataFrame): DataFrame of CIM relationships.
         pimClasses (pd.DataFrame): DataFrame of PIM classes.
         pimRelations (pd.DataFrame): DataFrame of PIM relationships.
+        existingIds (set): Optional set of class IDs already in use, shared across rules and updated in place.
+        idLength (int): Optional length of the generated class IDs.
 
     Returns:
         pd.DataFrame, pd.DataFrame: Updated PIM classes and relationships DataFrames.
     """
-    existingIds = getExistingIds(pimClasses)
-    idLength = getIdLength(pimClasses)
+    if existingIds is None:
+        existingIds = getExistingIds(pimClasses)
+    if idLength is None:
+        idLength = getIdLength(pimClasses)
 
-    # Create Digital Shadows and add them to PIM classes
+    # Create Digital Shadows
     digitalShadows = createDigitalShadows(cimClasses, cimRelations, existingIds, idLength)
-    newDigitalShadowsDf = pd.DataFrame(digitalShadows)
-    pimClasses = pd.concat([pimClasses, newDigitalShadowsDf], ignore_index=True)
 
     # Add DigitalShadow class
     digitalShadowID = addDigitalShadow(existingIds, idLength)
-    pimClasses = pd.concat([pimClasses, pd.DataFrame([{'Class ID': digitalShadowID, 'Class Name': 'DigitalShadow'}])], ignore_index=True)
 
     # Add Generalization relationships between DigitalShadows and DigitalShadow class
     newGeneralizationRelations = addGeneralizationShadows(digitalShadows, digitalShadowID)
@@ -529,8 +554,11 @@ def transformTemporalEntity(cimClasses, cimRelations, pimClasses, pimRelations):
 
     # Add DigitalShadowManager and its relationships
     digitalShadowManagerID = addDigitalShadowManager(existingIds, idLength)
-    pimClasses = pd.concat(
-        [pimClasses, pd.DataFrame([{'Class ID': digitalShadowManagerID, 'Class Name': 'DigitalShadowManager'}])], ignore_index=True)
+
+    # Add the Digital Shadows, DigitalShadow and DigitalShadowManager classes to PIM classes in a single concat
+    newClasses = digitalShadows + [{'Class ID': digitalShadowID, 'Class Name': 'DigitalShadow'},
+                                   {'Class ID': digitalShadowManagerID, 'Class Name': 'DigitalShadowManager'}]
+    pimClasses = pd.concat([pimClasses, pd.DataFrame(newClasses)], ignore_index=True)
 
     # Add shared aggregation relationships between DigitalShadows and DigitalShadowManager
     pimRelations = addAggregationManager(digitalShadowID, digitalShadowManagerID, pimRelations)
@@ -664,7 +692,7 @@ def addGeneralizationRepresentation(digitalRepresentationId, digitalShadowID, di
     newGeneralizationRelationDf = pd.DataFrame(newGeneralizationRelations)
     pimRelations = pd.concat([pimRelations, newGeneralizationRelationDf], ignore_index=True)
     return pimRelations
-def mergeShadowModelFlow(cimClasses, cimRelations, pimClasses, pimRelations):
+def mergeShadowModelFlow(cimClasses, cimRelations, pimClasses, pimRelations, existingIds=None, idLength=None):
     """
     This function merges the digital representations of the system by combining the Digital Shadow and Digital Model flows.
 
@@ -684,14 +712,18 @@ def mergeShadowModelFlow(cimClasses, cimRelations, pimClasses, pimRelations):
         cimRelations (pd.DataFrame): The CIM relationships DataFrame for the original system.
         pimClasses (pd.DataFrame): The PIM classes DataFrame to which the new digital classes will be added.
         pimRelations (pd.DataFrame): The PIM relationships DataFrame to which the new relationships will be added.
+        existingIds (set): Optional set of class IDs already in use, shared across rules and updated in place.
+        idLength (int): Optional length of the generated class IDs.
 
     Returns:
         pd.DataFrame: Updated PIM classes with the newly added Digital Twin, Shadow, and Model elements.
         pd.DataFrame: Updated PIM relationships with the newly added generalization and aggregation relationships.
     """
 
-    existingIds = getExistingIds(pimClasses)
-    idLength = getIdLength(pimClasses)
+    if existingIds is None:
+        existingIds = getExistingIds(pimClasses)
+    if idLength is None:
+        idLength = getIdLength(pimClasses)
 
     # Add DigitalTwinManager and DigitalRepresentation
     digitalTwinManagerID = addDigitalTwinManager(existingIds, idLength)
@@ -699,9 +731,9 @@ def mergeShadowModelFlow(cimClasses, cimRelations, pimClasses, pimRelations):
 
     # Add DigitalTwinManager and DigitalRepresentation to pimClasses
     pimClasses = pd.concat(
-        [pimClasses, pd.DataFrame([{'Class ID': digitalTwinManagerID, 'Class Name': 'DigitalTwinManager'}])], ignore_index=True)
-    pimClasses = pd.concat(
-        [pimClasses, pd.DataFrame([{'Class ID': digitalRepresentationID, 'Class Name': 'DigitalRepresentation'}])], ignore_index=True)
+        [pimClasses, pd.DataFrame([{'Class ID': digitalTwinManagerID, 'Class Name': 'DigitalTwinManager'},
+                                   {'Class ID': digitalRepresentationID, 'Class Name': 'DigitalRepresentation'}])],
+        ignore_index=True)
 
     # Get DigitalShadowManager and DigitalModelManager IDs
     digitalShadowManagerID = pimClasses[pimClasses['Class Name'] == 'DigitalShadowManager']['Class ID'].values[0]
@@ -804,7 +836,7 @@ def createDataProviders(cimClasses: pd.DataFrame, cimRelations: pd.DataFrame, ex
     # Search for the sensor entity class in CIM classes
     sensorID = searchSensorEntityClass(cimClasses)
     if not sensorID:
-        print(f"Warning: No Sensor entity class found with name '{SENSOR_ENTITY_CLASS_NAME}'.")
+        logger.warning("No Sensor entity class found with name '%s'.", SENSOR_ENTITY_CLASS_NAME)
         return []
 
     # Search for all child entities of the sensor class
@@ -812,8 +844,7 @@ def createDataProviders(cimClasses: pd.DataFrame, cimRelations: pd.DataFrame, ex
     dataProviders = []
 
     # Create data providers for each sensor entity
-    for _, row in sensorEntities.iterrows():
-        cimClassName = row['To Class Name']
+    for cimClassName in sensorEntities['To Class Name']:
         newId = generateId(existingIds, idLength)
         newClassName = cimClassName + 'DataProvider'
         dataProviders.append({
@@ -936,22 +967,26 @@ def addPhysicalTwinAggregation(pimClasses, dataProviders, pimRelations):
     physicalTwinName = physicalTwin.iloc[0]['Class Name']
 
     # Add an aggregation relationship for each DataProvider
+    newRelations = []
     for provider in dataProviders:
         providerId = provider['Class ID']
         providerName = provider['Class Name']
 
-        newRelation = {
+        newRelations.append({
             'Relationship Type': 'Aggregation',
             'From Class ID': physicalTwinId,
             'From Class Name': physicalTwinName,
             'To Class ID': providerId,
             'To Class Name': providerName,
             'Aggregation': 'Shared'
-        }
-        pimRelations = pd.concat([pimRelations, pd.DataFrame([newRelation])], ignore_index=True)
+        })
+
+    # Append all the new relationships at once
+    if newRelations:
+        pimRelations = pd.concat([pimRelations, pd.DataFrame(newRelations)], ignore_index=True)
 
     return pimRelations
-def transformSensor(cimClasses, cimRelations, pimClasses, pimRelations):
+def transformSensor(cimClasses, cimRelations, pimClasses, pimRelations, existingIds=None, idLength=None):
     """
     Transform Sensor-related CIM classes and relationships into PIM classes and relationships.
 
@@ -960,12 +995,16 @@ def transformSensor(cimClasses, cimRelations, pimClasses, pimRelations):
         cimRelations (pd.DataFrame): DataFrame of CIM relationships.
         pimClasses (pd.DataFrame): DataFrame of PIM classes.
         pimRelations (pd.DataFrame): DataFrame of PIM relationships.
+        existingIds (set): Optional set of class IDs already in use, shared across rules and updated in place.
+        idLength (int): Optional length of the generated class IDs.
 
     Returns:
         tuple: Updated PIM classes and relationships DataFrames.
     """
-    existingIds = getExistingIds(pimClasses)
-    idLength = getIdLength(pimClasses)
+    if existingIds is None:
+        existingIds = getExistingIds(pimClasses)
+    if idLength is None:
+        idLength = getIdLength(pimClasses)
 
     # Step 1: Create DataProvider classes
     dataProviders = createDataProviders(cimClasses, cimRelations, existingIds, idLength)
@@ -1077,7 +1116,7 @@ def createDataReceivers(cimClasses: pd.DataFrame, cimRelations: pd.DataFrame, ex
     # Search for the actuator entity class in CIM classes
     actuatorId = searchActuatorEntityClass(cimClasses)
     if not actuatorId:
-        print(f"Warning: No Actuator entity class found with name '{ACTUATOR_ENTITY_CLASS_NAME}'.")
+        logger.warning("No Actuator entity class found with name '%s'.", ACTUATOR_ENTITY_CLASS_NAME)
         return []
 
     # Search for all child entities of the actuator class
@@ -1085,8 +1124,7 @@ def createDataReceivers(cimClasses: pd.DataFrame, cimRelations: pd.DataFrame, ex
     dataReceivers = []
 
     # Create data receivers for each actuator entity
-    for _, row in actuatorEntities.iterrows():
-        cimClassName = row['To Class Name']
+    for cimClassName in actuatorEntities['To Class Name']:
         newId = generateId(existingIds, idLength)
         newClassName = cimClassName + 'DataReceiver'
         dataReceivers.append({
@@ -1144,7 +1182,7 @@ def addUseReceivers(receiversList: list, adaptersList: list, pimRelations: pd.Da
 
     return pimRelations
 
-def transformActuator(cimClasses: pd.DataFrame, cimRelations: pd.DataFrame, pimClasses: pd.DataFrame, pimRelations: pd.DataFrame) -> tuple:
+def transformActuator(cimClasses: pd.DataFrame, cimRelations: pd.DataFrame, pimClasses: pd.DataFrame, pimRelations: pd.DataFrame, existingIds: set = None, idLength: int = None) -> tuple:
     """
     Transform actuators from the CIM model to data receivers in the PIM model with D2PAdapters.
 
@@ -1158,13 +1196,17 @@ def transformActuator(cimClasses: pd.DataFrame, cimRelations: pd.DataFrame, pimC
         cimRelations (pd.DataFrame): DataFrame containing CIM relationships.
         pimClasses (pd.DataFrame): DataFrame of existing PIM classes.
         pimRelations (pd.DataFrame): DataFrame of existing PIM relationships.
+        existingIds (set): Optional set of class IDs already in use, shared across rules and updated in place.
+        idLength (int): Optional length of the generated class IDs.
 
     Returns:
         tuple: Updated (pimClasses, pimRelations) DataFrames with new classes and relationships.
     """
     # Retrieve existing IDs and determine ID length for new classes
-    existingIds = getExistingIds(pimClasses)
-    idLength = getIdLength(pimClasses)
+    if existingIds is None:
+        existingIds = getExistingIds(pimClasses)
+    if idLength is None:
+        idLength = getIdLength(pimClasses)
 
     # Step 1: Create data receivers for actuator entities
     dataReceivers = createDataReceivers(cimClasses, cimRelations, existingIds, idLength)
@@ -1177,8 +1219,9 @@ def transformActuator(cimClasses: pd.DataFrame, cimRelations: pd.DataFrame, pimC
     adaptersList, pimClasses = addD2PAdapters(dataReceivers, existingIds, idLength, pimClasses)
 
     # Step 4: Check if 'Adapter' superclass already exists; if not, create it
-    if not pimClasses[pimClasses['Class Name'] == 'Adapter'].empty:
-        adapterId = pimClasses[pimClasses['Class Name'] == 'Adapter']['Class ID'].values[0]
+    isAdapter = pimClasses['Class Name'].to_numpy() == 'Adapter'
+    if isAdapter.any():
+        adapterId = pimClasses['Class ID'].to_numpy()[isAdapter.argmax()]
     else:
         # Create 'Adapter' superclass if it doesn't exist
         adapterId = addAdapter(existingIds, idLength)
@@ -1250,11 +1293,11 @@ def createFeedbackProviders(pimClasses: pd.DataFrame, existingIds: set, idLength
     dataReceivers = pimClasses[pimClasses['Class Name'].str.contains('DataReceiver')]
     newFeedbackProviders = []
 
-    for _, receiver in dataReceivers.iterrows():
+    for receiverName in dataReceivers['Class Name']:
         feedbackId = addFeedback(existingIds, idLength)
         newFeedbackProviders.append({
             'Class ID': feedbackId,
-            'Class Name': 'Feedback' + receiver['Class Name'].replace('DataReceiver', '')
+            'Class Name': 'Feedback' + receiverName.replace('DataReceiver', '')
         })
 
     pimClasses = pd.concat([pimClasses, pd.DataFrame(newFeedbackProviders)], ignore_index=True)
@@ -1361,7 +1404,7 @@ def addUseFeedbackProviders(feedbackList: list, pimClasses: pd.DataFrame, pimRel
     newRelationsDf = pd.DataFrame(newRelations)
     pimRelations = pd.concat([pimRelations, newRelationsDf], ignore_index=True)
     return pimRelations
-def integrateServiceFeedback(cimClasses: pd.DataFrame, cimRelations: pd.DataFrame, pimClasses: pd.DataFrame, pimRelations: pd.DataFrame) -> tuple:
+def integrateServiceFeedback(cimClasses: pd.DataFrame, cimRelations: pd.DataFrame, pimClasses: pd.DataFrame, pimRelations: pd.DataFrame, existingIds: set = None, idLength: int = None) -> tuple:
     """
     Integrates the ServiceManager and feedback flow into the PIM model, establishing relationships
     with the DigitalTwinManager and feedback providers.
@@ -1381,13 +1424,17 @@ def integrateServiceFeedback(cimClasses: pd.DataFrame, cimRelations: pd.DataFram
         cimRelations (pd.DataFrame): DataFrame of CIM relationships.
         pimClasses (pd.DataFrame): DataFrame of PIM classes.
         pimRelations (pd.DataFrame): DataFrame of PIM relationships.
+        existingIds (set): Optional set of class IDs already in use, shared across rules and updated in place.
+        idLength (int): Optional length of the generated class IDs.
 
     Returns:
         tuple: Updated (pimClasses, pimRelations) DataFrames with ServiceManager and feedback flow integrated.
     """
     # Step 1: Retrieve existing class IDs and determine the ID length for unique identification
-    existingIds = getExistingIds(pimClasses)
-    idLength = getIdLength(pimClasses)
+    if existingIds is None:
+        existingIds = getExistingIds(pimClasses)
+    if idLength is None:
+        idLength = getIdLength(pimClasses)
     # Step 2: Add the ServiceManager class to the PIM model
     serviceId = addServiceManager(existingIds, idLength)
     pimClasses = pd.concat([pimClasses, pd.DataFrame([{'Class ID': serviceId, 'Class Name': 'ServiceManager'}])], ignore_index=True)
@@ -1520,8 +1567,8 @@ def addUseDataManager(dataManagerId: str, digitalTwinManagerId: str, serviceMana
 
     return pimRelations
 
-def integrateDataManager(pimClasses: pd.DataFrame, pimRelations: pd.DataFrame
-) -> tuple:
+def integrateDataManager(pimClasses: pd.DataFrame, pimRelations: pd.DataFrame, existingIds: set = None,
+                         idLength: int = None) -> tuple:
     """
     Integrate the DataManager and DataModel into the PIM model.
 
@@ -1530,21 +1577,25 @@ def integrateDataManager(pimClasses: pd.DataFrame, pimRelations: pd.DataFrame
     Args:
         pimClasses (pd.DataFrame): DataFrame containing the current PIM classes.
         pimRelations (pd.DataFrame): DataFrame containing the current PIM relationships.
+        existingIds (set): Optional set of class IDs already in use, shared across rules and updated in place.
+        idLength (int): Optional length of the generated class IDs.
 
     Returns:
         tuple: Updated (pimClasses, pimRelations) DataFrames with added DataManager, DataModel, and related relationships.
     """
 
     # Step 1: Get existing IDs and length of IDs
-    existingIds = getExistingIds(pimClasses)
-    idLength = getIdLength(pimClasses)
+    if existingIds is None:
+        existingIds = getExistingIds(pimClasses)
+    if idLength is None:
+        idLength = getIdLength(pimClasses)
 
     # Step 2: Add DataManager and DataModel classes
     dataManagerId = addDataManager(existingIds, idLength)
-    pimClasses = pd.concat([pimClasses, pd.DataFrame([{'Class ID': dataManagerId, 'Class Name': 'DataManager'}])], ignore_index=True)
-
     dataModelId = addDataModel(existingIds, idLength)
-    pimClasses = pd.concat([pimClasses, pd.DataFrame([{'Class ID': dataModelId, 'Class Name': 'DataModel'}])], ignore_index=True)
+    pimClasses = pd.concat([pimClasses, pd.DataFrame([{'Class ID': dataManagerId, 'Class Name': 'DataManager'},
+                                                      {'Class ID': dataModelId, 'Class Name': 'DataModel'}])],
+                           ignore_index=True)
 
     # Step 3: Add 'CompliantWith' relationships between DataManager, DataModel, and adapters
     pimRelations = addUseDataModel(dataModelId, dataManagerId, pimRelations)
@@ -1,37 +1,239 @@
+from collections import namedtuple
+import numpy as np
 import pandas as pd
-from TransformationRules.transformationutils import (findGeneralizationChildClasses, generateId,
-                                                     findClassesByPartialName, getIdLength, getExistingIds)
-from TransformationRules.constants import (PIM_DIGITAL_MODEL_RELATED_CLASS_NAME, PIM_DIGITAL_RELATED_CLASS_NAME,
-                                           PIM_MODEL_MANAGER_CLASS_NAME, PIM_TWIN_MANAGER_CLASS_NAME,
-                                           PIM_DATA_PROVIDER_CLASS_NAME, PIM_REAL_TWIN_CLASS_NAME,
-                                           PIM_DATA_RECEIVER_CLASS_NAME, PIM_ADAPTER_CLASS_NAME)
+from pandas.api.types import CategoricalDtype
+from TransformationRules.transformationutils import (createIdCounter, findClassesByPartialName, getIdLength,
+                                                     getExistingIds)
+from TransformationRules.constants import (PIM_TWIN_MANAGER_CLASS_NAME, PIM_DATA_PROVIDER_CLASS_NAME,
+                                           PIM_REAL_TWIN_CLASS_NAME, PIM_DATA_RECEIVER_CLASS_NAME)
+
+# Partial class names looked up in the PIM by the PIM2PSM rules
+PIM_LOOKUP_PARTIAL_NAMES = [PIM_TWIN_MANAGER_CLASS_NAME, PIM_REAL_TWIN_CLASS_NAME, PIM_DATA_PROVIDER_CLASS_NAME,
+                            PIM_DATA_RECEIVER_CLASS_NAME, 'Feedback']
+
+# Columns of the PSM classes and relations DataFrames
+PSM_CLASS_COLUMNS = ['Class ID', 'Class Name']
+PSM_RELATION_COLUMNS = ["Relationship Type", "From Class ID", "From Class Name", "To Class ID", "To Class Name",
+                        "Aggregation"]
+
+# Positions of the PIM relations grouped by 'From Class ID' (byFrom) and by 'To Class ID' (byTo)
+PimIndex = namedtuple('PimIndex', ['byFrom', 'byTo'])
+
+# A PIM or PSM class as handled inside the rules
+ClassNode = namedtuple('ClassNode', ['id', 'name'])
 
 
 def pim2psmTransformation(pimClasses, pimRelations):
-    psmRelations = pd.DataFrame(
-        columns=["Relationship Type", "From Class ID", "From Class Name", "To Class ID", "To Class Name",
-                 "Aggregation"])
+    # Compare class IDs and names through shared categorical dtypes, so joins and lookups work on integer codes
+    classIdDtype = sharedCategoricalDtype(pimClasses['Class ID'], pimRelations['From Class ID'],
+                                          pimRelations['To Class ID'])
+    classNameDtype = sharedCategoricalDtype(pimClasses['Class Name'], pimRelations['From Class Name'],
+                                            pimRelations['To Class Name'])
+    pimClasses = pimClasses.astype({'Class ID': classIdDtype, 'Class Name': classNameDtype})
+    pimRelations = pimRelations.astype({'From Class ID': classIdDtype, 'To Class ID': classIdDtype,
+                                        'From Class Name': classNameDtype, 'To Class Name': classNameDtype})
+    pimIndex = buildPimIndex(pimRelations)
+
+    # PIM classes do not change during the transformation, so every partial-name lookup the rules need is done once
+    # up front and shared by all rules
+    pimLookupCache = {}
+    pimClassNames = lowerClassNames(pimClasses)
+    for partialName in PIM_LOOKUP_PARTIAL_NAMES:
+        findCachedClassesByPartialName(pimClasses, pimLookupCache, partialName, pimClassNames)
+    # Every PSM class ID is either taken from the PIM or generated by the builder, so a single set tracks them all
+    psmBuilder = PSMBuilder(getExistingIds(pimClasses), getIdLength(pimClasses))
 
     # RULE 1. transformDigitalModel
-    psmClasses, psmRelations = transformDigitalModel(pimClasses, pimRelations, psmRelations)
+    transformDigitalModel(pimClasses, pimRelations, psmBuilder, pimLookupCache)
 
     # RULE 2. createFiwareContext
-    psmClasses, psmRelations = createFiwareContext(psmClasses, psmRelations)
+    fiwareClasses = createFiwareContext(psmBuilder)
 
     # RULE 3. transformAdapter
-    psmClasses, psmRelations = transformAdapter(pimClasses, pimRelations, psmClasses, psmRelations)
+    transformAdapter(pimClasses, pimRelations, psmBuilder, pimLookupCache, fiwareClasses, pimIndex)
 
     # RULE 4. transformService
-    psmClasses, psmRelations = transformService(pimClasses, pimRelations, psmClasses, psmRelations)
+    transformService(pimClasses, pimRelations, psmBuilder, pimLookupCache)
 
     # RULE 5. integrateData
-    psmClasses, psmRelations = integrateData(pimClasses, pimRelations, psmClasses, psmRelations)
+    integrateData(pimClasses, pimRelations, psmBuilder, pimLookupCache, fiwareClasses)
+
+    return psmBuilder.finalize()
+
+
+def sharedCategoricalDtype(*columns):
+    """
+    Build a categorical dtype whose categories are the union of the values of several columns.
+
+    Casting all the columns to the same dtype keeps their integer codes comparable with each other.
+
+    Args:
+        *columns (pd.Series): Columns whose values become the categories.
+
+    Returns:
+        CategoricalDtype: Categorical dtype covering every value of the columns.
+    """
+    return CategoricalDtype(categories=pd.concat(columns).dropna().unique())
+
+
+def buildPimIndex(pimRelations):
+    """
+    Index the positions of the PIM relations by their source and target class IDs.
+
+    Args:
+        pimRelations (pd.DataFrame): DataFrame of PIM relationships with columns ['From Class ID', 'To Class ID'].
+
+    Returns:
+        PimIndex: Dicts mapping each class ID to the positions of its outgoing (byFrom) and incoming (byTo) relations.
+    """
+    return PimIndex(pimRelations.groupby('From Class ID', observed=True).indices,
+                    pimRelations.groupby('To Class ID', observed=True).indices)
+
+
+class PSMBuilder:
+    """
+    Accumulator of the PSM classes and relations created by the PIM2PSM rules.
+
+    Classes and relations are kept as parallel column lists and turned into DataFrames only once, by finalize.
+    New class IDs are drawn from a single counter.
+    """
+
+    def __init__(self, existingIds, idLength):
+        """
+        Args:
+            existingIds (set): Class IDs already in use. The generated IDs are added to it.
+            idLength (int): Length of the generated class IDs.
+        """
+        self.classColumns = {column: [] for column in PSM_CLASS_COLUMNS}
+        self.relationColumns = {column: [] for column in PSM_RELATION_COLUMNS}
+        self.nextId = createIdCounter(existingIds, idLength)
+
+    def addClass(self, classId, className):
+        """
+        Append a class to the PSM classes.
+
+        Args:
+            classId (str): ID of the new class.
+            className (str): Name of the new class.
+        """
+        self.classColumns['Class ID'].append(classId)
+        self.classColumns['Class Name'].append(className)
+
+    def addRelation(self, fromId, fromName, toId, toName, relType, aggregation=False):
+        """
+        Append a relationship to the PSM relations.
+
+        Args:
+            fromId (str): ID of the source class.
+            fromName (str): Name of the source class.
+            toId (str): ID of the target class.
+            toName (str): Name of the target class.
+            relType (str): Type of the relationship.
+            aggregation: Aggregation kind of the relationship. Default is False.
+        """
+        self.relationColumns['Relationship Type'].append(relType)
+        self.relationColumns['From Class ID'].append(fromId)
+        self.relationColumns['From Class Name'].append(fromName)
+        self.relationColumns['To Class ID'].append(toId)
+        self.relationColumns['To Class Name'].append(toName)
+        self.relationColumns['Aggregation'].append(aggregation)
+
+    def findClass(self, partialName):
+        """
+        Find the first PSM class whose name contains a specific substring (case-insensitive).
+
+        Args:
+            partialName (str): Substring to search for in the class names.
+
+        Returns:
+            ClassNode: The first matching class, or None if no class matches.
+        """
+        partialName = partialName.lower()
+        return next((ClassNode(classId, className)
+                     for classId, className in zip(self.classColumns['Class ID'], self.classColumns['Class Name'])
+                     if partialName in className.lower()), None)
+
+    def finalize(self):
+        """
+        Build the PSM DataFrames from the accumulated columns.
+
+        Returns:
+            tuple: A tuple of two DataFrames:
+                - pd.DataFrame: DataFrame of PSM classes.
+                - pd.DataFrame: DataFrame of PSM relations.
+        """
+        return (pd.DataFrame(self.classColumns, columns=PSM_CLASS_COLUMNS),
+                pd.DataFrame(self.relationColumns, columns=PSM_RELATION_COLUMNS))
+
+
+def findCachedClassesByPartialName(pimClasses, pimLookupCache, partialName, pimClassNames=None):
+    """
+    Find PIM classes whose names contain a specific substring, memoizing the result by partial name.
+
+    The matching classes are returned as plain ClassNode tuples, so the rules never slice pimClasses again.
+
+    Args:
+        pimClasses (pd.DataFrame): DataFrame of PIM classes with columns ['Class ID', 'Class Name'].
+        pimLookupCache (dict): Results of previous lookups on the same pimClasses, keyed by partial name.
+                               If None, the lookup is not cached.
+        partialName (str): Substring to search for in the class names.
+        pimClassNames (np.ndarray): Optional lower-cased class names of pimClasses built by lowerClassNames. If
+                                    None, they are computed when the lookup is not cached yet.
+
+    Returns:
+        list: ClassNode of each matching class, in the order of pimClasses.
+    """
+    if pimLookupCache is None:
+        return toClassNodes(findClassesByPartialName(pimClasses, partialName))
+    if partialName not in pimLookupCache:
+        if pimClassNames is None:
+            pimClassNames = lowerClassNames(pimClasses)
+        pimLookupCache[partialName] = toClassNodes(pimClasses[partialNameMask(pimClassNames, partialName)])
+    return pimLookupCache[partialName]
+
+
+def lowerClassNames(classesDf):
+    """
+    Lower-case the class names of a DataFrame of classes for partialNameMask.
+
+    Args:
+        classesDf (pd.DataFrame): DataFrame of classes with a 'Class Name' column.
+
+    Returns:
+        np.ndarray: Lower-cased class names as a numpy string array, in the order of classesDf.
+    """
+    return np.char.lower(classesDf['Class Name'].to_numpy().astype(str))
 
-    return psmClasses, psmRelations
+
+def toClassNodes(classesDf):
+    """
+    Convert a DataFrame of classes into a list of ClassNode.
+
+    Args:
+        classesDf (pd.DataFrame): DataFrame of classes with columns ['Class ID', 'Class Name'].
+
+    Returns:
+        list: ClassNode of each class, in the order of classesDf.
+    """
+    return list(map(ClassNode._make, classesDf[['Class ID', 'Class Name']].itertuples(index=False, name=None)))
+
+
+def partialNameMask(classNames, partialName):
+    """
+    Build a boolean mask of the class names containing a specific substring (case-insensitive).
+
+    Args:
+        classNames (np.ndarray): Lower-cased class names as a numpy string array.
+        partialName (str): Substring to search for in the class names.
+
+    Returns:
+        np.ndarray: Boolean mask, True where the class name contains partialName.
+    """
+    return np.char.find(classNames, partialName.lower()) != -1
 
 
 ############################### RULE1: transformDigitalModel  ##############################
-def transformDigitalModel(pimClasses, pimRelations, psmRelations):
+def transformDigitalModel(pimClasses, pimRelations, psmBuilder, pimLookupCache=None):
     """
     Transform digital-related PIM classes into a SumoSimulator PSM class.
 
@@ -40,162 +242,69 @@ def transformDigitalModel(pimClasses, pimRelations, psmRelations):
         pimRelations (pd.DataFrame): DataFrame of PIM relationships with columns ['Relationship Type', 'From Class ID',
                                                                                   'From Class Name', 'To Class ID',
                                                                                   'To Class Name'].
-        psmRelations (pd.DataFrame): starting dataframe of PSM relations.
-
-    Returns:
-        tuple: A tuple of two DataFrames:
-            - pd.DataFrame: DataFrame of PSM classes.
-            - pd.DataFrame: DataFrame of PSM relations.
+        psmBuilder (PSMBuilder): Accumulator of the PSM classes and relations, updated in place.
+        pimLookupCache (dict): Optional cache of partial-name lookups on pimClasses.
     """
-    # Step 1: Find the DigitalRepresentation class
-    digitalRepresentation = findClassesByPartialName(pimClasses, PIM_DIGITAL_RELATED_CLASS_NAME)
-
-    # Step 2: Find the DigitalModel classes
-    digitalModel = findClassesByPartialName(pimClasses, PIM_DIGITAL_MODEL_RELATED_CLASS_NAME)
-
-    # Step 2.1: Find all children of the DigitalModel classes iteratively
-    allChildren = set()
-    stack = digitalModel['Class ID'].tolist()  # Initialize stack with IDs of DigitalModel classes
-
-    while stack:
-        currentClassId = stack.pop()
-        children = findGeneralizationChildClasses(pimRelations, currentClassId)
-        for _, childRow in children.iterrows():
-            childClassId = childRow['To Class ID']
-            if childClassId not in allChildren:  # Avoid duplicates
-                allChildren.add(childClassId)
-                stack.append(childClassId)  # Add this child to the stack to find its children
-
-    # Map child IDs back to their class names
-    childClassNames = pimClasses[pimClasses['Class ID'].isin(allChildren)]['Class Name'].tolist()
-
-    # Step 3: Find the DigitalModelManager class related to DigitalModel
-    digitalModelManager = findClassesByPartialName(pimClasses, PIM_MODEL_MANAGER_CLASS_NAME)
-    relatedModelManagers = []
-
-    for _, modelRow in digitalModel.iterrows():
-        for _, managerRow in digitalModelManager.iterrows():
-            # Check if there is a relationship between the manager and the model
-            relationExists = not pimRelations[
-                (pimRelations['From Class ID'] == managerRow['Class ID']) &
-                (pimRelations['To Class ID'] == modelRow['Class ID'])
-            ].empty
-            if relationExists:
-                relatedModelManagers.append(managerRow['Class Name'])
-
-    # Step 4: Create the SumoSimulator PSM class
-    existingIds = getExistingIds(pimClasses)
-    idLength = getIdLength(pimClasses)
-    sumoSimulatorId = generateId(existingIds, idLength)
+    # Step 1: Create the SumoSimulator PSM class
+    sumoSimulatorId = psmBuilder.nextId()
 
     # Define the SumoSimulator as a new PSM class
-    sumoSimulatorClass = {
-        'Class ID': sumoSimulatorId,
-        'Class Name': 'SumoSimulator'
-    }
-    psmClasses = pd.DataFrame([sumoSimulatorClass])
+    psmBuilder.addClass(sumoSimulatorId, 'SumoSimulator')
 
-    # Step 5: Find the DigitalTwinManager class and add it to PSM classes
-    digitalTwinManager = findClassesByPartialName(pimClasses, PIM_TWIN_MANAGER_CLASS_NAME)
-    if not digitalTwinManager.empty:
+    # Step 2: Find the DigitalTwinManager class and add it to PSM classes
+    digitalTwinManager = findCachedClassesByPartialName(pimClasses, pimLookupCache, PIM_TWIN_MANAGER_CLASS_NAME)
+    if digitalTwinManager:
         # Only add the DigitalTwinManager's ID and Name
-        digitalTwinManagerSubset = digitalTwinManager[['Class ID', 'Class Name']]
-        psmClasses = pd.concat([psmClasses, digitalTwinManagerSubset], ignore_index=True)
+        for managerId, managerName in digitalTwinManager:
+            psmBuilder.addClass(managerId, managerName)
 
         # Add aggregation relationship between SumoSimulator and DigitalTwinManager
-        aggregationRelation = {
-            "Relationship Type": "Aggregation",
-            "From Class ID": sumoSimulatorId,
-            "From Class Name": "SumoSimulator",
-            "To Class ID": digitalTwinManagerSubset.iloc[0]['Class ID'],
-            "To Class Name": digitalTwinManagerSubset.iloc[0]['Class Name'],
-            "Aggregation": "Shared"
-        }
-        psmRelations = pd.concat([psmRelations, pd.DataFrame([aggregationRelation])], ignore_index=True)
+        psmBuilder.addRelation(sumoSimulatorId, "SumoSimulator", digitalTwinManager[0].id, digitalTwinManager[0].name,
+                               "Aggregation", aggregation="Shared")
 
-    return psmClasses, psmRelations
 
 ############################### RULE2: createFiwareContext  ##############################
-def createFiwareContext(psmClasses, psmRelations):
+def createFiwareContext(psmBuilder):
     """
     Create the Fiware Context including ContextBroker, SubscriptionManager, MongoManager, and TimescaleManager.
 
     Args:
-        psmClasses (pd.DataFrame): DataFrame of PSM classes with columns ['Class ID', 'Class Name'].
-        psmRelations (pd.DataFrame): DataFrame of PIM relationships with columns ['Relationship Type', 'From Class ID',
-                                                                                  'From Class Name', 'To Class ID',
-                                                                                  'To Class Name'].
+        psmBuilder (PSMBuilder): Accumulator of the PSM classes and relations, updated in place.
 
     Returns:
-        tuple: A tuple of two DataFrames:
-            - pd.DataFrame: Updated DataFrame of PSM classes with added Fiware Context classes.
-            - pd.DataFrame: DataFrame of PSM relations defining the relationships among the classes.
+        dict: ClassNode of the created classes, keyed by 'broker', 'subscription', 'mongo' and
+              'timescale'.
     """
-
-
     # Generate unique IDs for new classes
-    existingIds = getExistingIds(psmClasses)
-    idLength = getIdLength(psmClasses)
-    contextBrokerId = generateId(existingIds, idLength)
-    subscriptionManagerId = generateId(existingIds, idLength)
-    mongoManagerId = generateId(existingIds, idLength)
-    timescaleManagerId = generateId(existingIds, idLength)
-
-    # Define the ContextBroker class
-    contextBrokerClass = {
-        'Class ID': contextBrokerId,
-        'Class Name': 'ContextBroker'
-    }
-
-    # Define the SubscriptionManager, MongoManager, and TimescaleManager classes
-    subscriptionManagerClass = {
-        'Class ID': subscriptionManagerId,
-        'Class Name': 'SubscriptionManager'
-    }
-    mongoManagerClass = {
-        'Class ID': mongoManagerId,
-        'Class Name': 'MongoManager'
-    }
-    timescaleManagerClass = {
-        'Class ID': timescaleManagerId,
-        'Class Name': 'TimescaleManager'
-    }
+    contextBrokerId, subscriptionManagerId, mongoManagerId, timescaleManagerId = (psmBuilder.nextId()
+                                                                                  for _ in range(4))
 
-    # Append new classes to psmClasses DataFrame
-    newClasses = pd.DataFrame([contextBrokerClass, subscriptionManagerClass, mongoManagerClass, timescaleManagerClass])
-    psmClasses = pd.concat([psmClasses, newClasses], ignore_index=True)
+    # Add the ContextBroker, SubscriptionManager, MongoManager, and TimescaleManager classes
+    psmBuilder.addClass(contextBrokerId, 'ContextBroker')
+    psmBuilder.addClass(subscriptionManagerId, 'SubscriptionManager')
+    psmBuilder.addClass(mongoManagerId, 'MongoManager')
+    psmBuilder.addClass(timescaleManagerId, 'TimescaleManager')
 
     # Define relationships
     # Association relation between ContextBroker and SubscriptionManager
-    psmRelations = pd.concat([
-        psmRelations,
-        pd.DataFrame([{
-            "Relationship Type": "Association",
-            "From Class ID": contextBrokerId,
-            "From Class Name": "ContextBroker",
-            "To Class ID": subscriptionManagerId,
-            "To Class Name": "SubscriptionManager",
-            "Aggregation": False
-        }])
-    ], ignore_index=True)
+    psmBuilder.addRelation(contextBrokerId, "ContextBroker", subscriptionManagerId, "SubscriptionManager",
+                           "Association", aggregation=False)
 
     # Usage relation between ContextBroker and MongoManager
-    psmRelations = pd.concat([
-        psmRelations,
-        pd.DataFrame([{
-            "Relationship Type": "Usage",
-            "From Class ID": contextBrokerId,
-            "From Class Name": "ContextBroker",
-            "To Class ID": mongoManagerId,
-            "To Class Name": "MongoManager",
-            "Aggregation": False
-        }])
-    ], ignore_index=True)
+    psmBuilder.addRelation(contextBrokerId, "ContextBroker", mongoManagerId, "MongoManager", "Usage",
+                           aggregation=False)
+
+    fiwareClasses = {
+        'broker': ClassNode(contextBrokerId, 'ContextBroker'),
+        'subscription': ClassNode(subscriptionManagerId, 'SubscriptionManager'),
+        'mongo': ClassNode(mongoManagerId, 'MongoManager'),
+        'timescale': ClassNode(timescaleManagerId, 'TimescaleManager')
+    }
 
-    return psmClasses, psmRelations
+    return fiwareClasses
 
 ############################### RULE3: transformAdapter  ##############################
-def transformAdapter(pimClasses, pimRelations, psmClasses, psmRelations):
+def transformAdapter(pimClasses, pimRelations, psmBuilder, pimLookupCache=None, fiwareClasses=None, pimIndex=None):
     """
     Transform Adapter-related PIM classes and relationships into PSM classes and relationships.
 
@@ -210,327 +319,242 @@ def transformAdapter(pimClasses, pimRelations, psmClasses, psmRelations):
         pimRelations (pd.DataFrame): DataFrame of PIM relationships with columns ['From Class ID', 'From Class Name',
                                                                                   'To Class ID', 'To Class Name',
                                                                                   'Relationship Type'].
-        psmClasses (pd.DataFrame): DataFrame of PSM classes with columns ['Class ID', 'Class Name'].
-        psmRelations (pd.DataFrame): DataFrame of PSM relationships with columns ['Relationship Type',
-                                                                                  'From Class ID', 'From Class Name',
-                                                                                  'To Class ID', 'To Class Name',
-                                                                                  'Aggregation'].
-
-    Returns:
-        tuple: Updated PSM classes and relationships DataFrames.
+        psmBuilder (PSMBuilder): Accumulator of the PSM classes and relations, updated in place.
+        pimLookupCache (dict): Optional cache of partial-name lookups on pimClasses.
+        fiwareClasses (dict): Optional Fiware Context classes returned by createFiwareContext. If None, they are
+                              searched by name in psmBuilder.
+        pimIndex (PimIndex): Optional positions of pimRelations by class ID.
     """
 
-    # Helper: Add a new class to PSM
-    def add_class_to_psm(class_id, class_name):
-        new_class = {'Class ID': class_id, 'Class Name': class_name}
-        return pd.concat([psmClasses, pd.DataFrame([new_class])], ignore_index=True)
-
-    # Helper: Add a new relationship to PSM
-    def add_relation_to_psm(from_id, from_name, to_id, to_name, rel_type, aggregation=False):
-        new_relation = {
-            'Relationship Type': rel_type,
-            'From Class ID': from_id,
-            'From Class Name': from_name,
-            'To Class ID': to_id,
-            'To Class Name': to_name,
-            'Aggregation': aggregation
-        }
-        return pd.concat([psmRelations, pd.DataFrame([new_relation])], ignore_index=True)
-
     # 1. Search for the "PhysicalTwin" class in PIM
-    physicalTwin = findClassesByPartialName(pimClasses, PIM_REAL_TWIN_CLASS_NAME)
-    if not physicalTwin.empty:
+    physicalTwin = findCachedClassesByPartialName(pimClasses, pimLookupCache, PIM_REAL_TWIN_CLASS_NAME)
+    if physicalTwin:
         # Transform PhysicalTwin into PSM
-        physicalTwinId = physicalTwin.iloc[0]['Class ID']
-        physicalTwinName = physicalTwin.iloc[0]['Class Name']
-        psmClasses = add_class_to_psm(physicalTwinId, physicalTwinName)
+        physicalTwinId, physicalTwinName = physicalTwin[0]
+        psmBuilder.addClass(physicalTwinId, physicalTwinName)
+
+        # Filter the relations touching the PhysicalTwin once and bucket them by the class at the other end
+        if pimIndex is None:
+            pimIndex = buildPimIndex(pimRelations)
+        physicalTwinPositions = np.union1d(pimIndex.byFrom.get(physicalTwinId, []),
+                                           pimIndex.byTo.get(physicalTwinId, [])).astype(int)
+        physicalTwinRelations = pimRelations.iloc[physicalTwinPositions]
+        # The Aggregation column is optional in PIM relations; without it the relations are not aggregations
+        if 'Aggregation' in physicalTwinRelations.columns:
+            aggregations = physicalTwinRelations['Aggregation'].to_numpy()
+        else:
+            aggregations = np.zeros(len(physicalTwinRelations), dtype=bool)
+        physicalTwinRelationsByPeer = {}
+        for relation, aggregation in zip(physicalTwinRelations[['From Class ID', 'From Class Name', 'To Class ID',
+                                                                'To Class Name', 'Relationship Type']]
+                                         .itertuples(index=False, name=None), aggregations.tolist()):
+            peerId = relation[2] if relation[0] == physicalTwinId else relation[0]
+            physicalTwinRelationsByPeer.setdefault(peerId, []).append(relation + (aggregation,))
 
         # 2. Search for "DataProvider" and "DataReceiver" classes in PIM
-        dataProviders = findClassesByPartialName(pimClasses, PIM_DATA_PROVIDER_CLASS_NAME)
-        dataReceivers = findClassesByPartialName(pimClasses, PIM_DATA_RECEIVER_CLASS_NAME)
+        dataProviders = findCachedClassesByPartialName(pimClasses, pimLookupCache, PIM_DATA_PROVIDER_CLASS_NAME)
+        dataReceivers = findCachedClassesByPartialName(pimClasses, pimLookupCache, PIM_DATA_RECEIVER_CLASS_NAME)
 
         # 3. Add DataProvider and DataReceiver classes to PSM
-        for _, provider in dataProviders.iterrows():
-            providerId = provider['Class ID']
-            providerName = provider['Class Name']
-            psmClasses = add_class_to_psm(providerId, providerName)
+        for providerId, providerName in dataProviders:
+            psmBuilder.addClass(providerId, providerName)
 
             # Add relationships between PhysicalTwin and DataProvider
-            providerRelations = pimRelations[
-                ((pimRelations['From Class ID'] == physicalTwinId) & (pimRelations['To Class ID'] == providerId)) |
-                ((pimRelations['From Class ID'] == providerId) & (pimRelations['To Class ID'] == physicalTwinId))
-            ]
-            for _, rel in providerRelations.iterrows():
-                psmRelations = add_relation_to_psm(
-                    rel['From Class ID'], rel['From Class Name'],
-                    rel['To Class ID'], rel['To Class Name'],
-                    rel['Relationship Type'],
-                    aggregation=rel.get('Aggregation', False)
-                )
-
-        for _, receiver in dataReceivers.iterrows():
-            receiverId = receiver['Class ID']
-            receiverName = receiver['Class Name']
-            psmClasses = add_class_to_psm(receiverId, receiverName)
+            for fromId, fromName, toId, toName, relType, aggregation in physicalTwinRelationsByPeer.get(providerId, ()):
+                psmBuilder.addRelation(fromId, fromName, toId, toName, relType, aggregation=aggregation)
+
+        for receiverId, receiverName in dataReceivers:
+            psmBuilder.addClass(receiverId, receiverName)
 
             # Add relationships between PhysicalTwin and DataReceiver
-            receiverRelations = pimRelations[
-                ((pimRelations['From Class ID'] == physicalTwinId) & (pimRelations['To Class ID'] == receiverId)) |
-                ((pimRelations['From Class ID'] == receiverId) & (pimRelations['To Class ID'] == physicalTwinId))
-            ]
-            for _, rel in receiverRelations.iterrows():
-                psmRelations = add_relation_to_psm(
-                    rel['From Class ID'], rel['From Class Name'],
-                    rel['To Class ID'], rel['To Class Name'],
-                    rel['Relationship Type'],
-                    aggregation=rel.get('Aggregation', False)
-                )
-
-    # 4. Find all classes with "Adapter" in the name in PIM
-    adapterClasses = findClassesByPartialName(pimClasses, PIM_ADAPTER_CLASS_NAME)
-
-    # 5. Add a new "Agent" class to PSM
-    existingIds = getExistingIds(psmClasses)
-    idLength = getIdLength(psmClasses)
-    agentId = generateId(existingIds, idLength)
-    psmClasses = add_class_to_psm(agentId, "Agent")
-
-    # 6. Add relationships between Agent and ContextBroker
-    contextBrokerClass = findClassesByPartialName(psmClasses, "Broker")
-    if not contextBrokerClass.empty:
-        brokerId = contextBrokerClass.iloc[0]['Class ID']
-        brokerName = contextBrokerClass.iloc[0]['Class Name']
-        psmRelations = add_relation_to_psm(agentId, "Agent", brokerId, brokerName, "Association", aggregation=False)
-
-    # 7. Add usage relationships between Agent and DataProviders/DataReceivers
-    for _, provider in dataProviders.iterrows():
-        providerId = provider['Class ID']
-        providerName = provider['Class Name']
-        psmRelations = add_relation_to_psm(providerId, providerName, agentId, "Agent", "Usage", aggregation=False)
-
-    for _, receiver in dataReceivers.iterrows():
-        receiverId = receiver['Class ID']
-        receiverName = receiver['Class Name']
-        psmRelations = add_relation_to_psm(agentId, "Agent", receiverId, receiverName, "Usage", aggregation=False)
-
-    # 8. Add relationships between Agent and MongoManager
-    mongoManagerClass = findClassesByPartialName(psmClasses, "MongoManager")
-    if not mongoManagerClass.empty:
-        mongoManagerId = mongoManagerClass.iloc[0]['Class ID']
-        mongoManagerName = mongoManagerClass.iloc[0]['Class Name']
-        psmRelations = add_relation_to_psm(agentId, "Agent", mongoManagerId, mongoManagerName, "Usage", aggregation=False)
+            for fromId, fromName, toId, toName, relType, aggregation in physicalTwinRelationsByPeer.get(receiverId, ()):
+                psmBuilder.addRelation(fromId, fromName, toId, toName, relType, aggregation=aggregation)
+
+    # 4. Add a new "Agent" class to PSM
+    agentId = psmBuilder.nextId()
+    psmBuilder.addClass(agentId, "Agent")
+
+    # 5. Add relationships between Agent and ContextBroker
+    if fiwareClasses is not None:
+        contextBrokerClass = fiwareClasses['broker']
+    else:
+        contextBrokerClass = psmBuilder.findClass("Broker")
+    if contextBrokerClass is not None:
+        brokerId, brokerName = contextBrokerClass
+        psmBuilder.addRelation(agentId, "Agent", brokerId, brokerName, "Association", aggregation=False)
+
+    # 6. Add usage relationships between Agent and DataProviders/DataReceivers
+    for providerId, providerName in dataProviders:
+        psmBuilder.addRelation(providerId, providerName, agentId, "Agent", "Usage", aggregation=False)
+
+    for receiverId, receiverName in dataReceivers:
+        psmBuilder.addRelation(agentId, "Agent", receiverId, receiverName, "Usage", aggregation=False)
+
+    # 7. Add relationships between Agent and MongoManager
+    if fiwareClasses is not None:
+        mongoManagerClass = fiwareClasses['mongo']
+    else:
+        mongoManagerClass = psmBuilder.findClass("MongoManager")
+    if mongoManagerClass is not None:
+        mongoManagerId, mongoManagerName = mongoManagerClass
+        psmBuilder.addRelation(agentId, "Agent", mongoManagerId, mongoManagerName, "Usage", aggregation=False)
 
-    return psmClasses, psmRelations
 
 ############################### RULE4: transformService  ##############################
-def transformService(pimClasses, pimRelations, psmClasses, psmRelations):
+def transformService(pimClasses, pimRelations, psmBuilder, pimLookupCache=None):
     """
     Transform Service-related PIM classes and relationships into PSM classes and relationships.
 
     Args:
         pimClasses (pd.DataFrame): DataFrame of PIM classes
         pimRelations (pd.DataFrame): DataFrame of PIM relationships
-        psmClasses (pd.DataFrame): DataFrame of PSM classe
-        psmRelations (pd.DataFrame): DataFrame of PSM relationships
-
-    Returns:
-        tuple: Updated PSM classes and relationships DataFrames.
+        psmBuilder (PSMBuilder): Accumulator of the PSM classes and relations, updated in place
+        pimLookupCache (dict): Optional cache of partial-name lookups on pimClasses.
     """
-    # Helper to add a new class to PSM
-    def add_class_to_psm(class_id, class_name):
-        new_class = {'Class ID': class_id, 'Class Name': class_name}
-        return pd.concat([psmClasses, pd.DataFrame([new_class])], ignore_index=True)
-
-    # Helper to add a new relationship to PSM
-    def add_relation_to_psm(from_id, from_name, to_id, to_name, rel_type, aggregation=False):
-        new_relation = {
-            'Relationship Type': rel_type,
-            'From Class ID': from_id,
-            'From Class Name': from_name,
-            'To Class ID': to_id,
-            'To Class Name': to_name,
-            'Aggregation': aggregation
-        }
-        return pd.concat([psmRelations, pd.DataFrame([new_relation])], ignore_index=True)
-
     # 1. Find DigitalTwinManager in PIM classes and its relationships
-    digitalTwinManager = findClassesByPartialName(pimClasses, PIM_TWIN_MANAGER_CLASS_NAME)
-    if digitalTwinManager.empty:
-        return psmClasses, psmRelations  # If no DigitalTwinManager exists, skip this rule
+    digitalTwinManager = findCachedClassesByPartialName(pimClasses, pimLookupCache, PIM_TWIN_MANAGER_CLASS_NAME)
+    if not digitalTwinManager:
+        return  # If no DigitalTwinManager exists, skip this rule
 
-    digitalTwinManagerId = digitalTwinManager.iloc[0]['Class ID']
-    digitalTwinManagerName = digitalTwinManager.iloc[0]['Class Name']
+    digitalTwinManagerId, digitalTwinManagerName = digitalTwinManager[0]
 
     # 2. Add new classes: ScenarioGenerator, Planner, and DigitalTwinHMI
-    existingIds = getExistingIds(psmClasses)
-    idLength = getIdLength(psmClasses)
-
-    scenarioGeneratorId = generateId(existingIds, idLength)
-    plannerId = generateId(existingIds, idLength)
-    digitalTwinHMIId = generateId(existingIds, idLength)
+    scenarioGeneratorId, plannerId, digitalTwinHMIId = (psmBuilder.nextId() for _ in range(3))
 
-    psmClasses = add_class_to_psm(scenarioGeneratorId, 'ScenarioGenerator')
-    psmClasses = add_class_to_psm(plannerId, 'Planner')
-    psmClasses = add_class_to_psm(digitalTwinHMIId, 'DigitalTwinHMI')
+    psmBuilder.addClass(scenarioGeneratorId, 'ScenarioGenerator')
+    psmBuilder.addClass(plannerId, 'Planner')
+    psmBuilder.addClass(digitalTwinHMIId, 'DigitalTwinHMI')
 
     # 3. Find Feedback-related classes in PIM
-    feedbackClasses = findClassesByPartialName(pimClasses, 'Feedback')
+    feedbackClasses = findCachedClassesByPartialName(pimClasses, pimLookupCache, 'Feedback')
 
     # 4. Add Feedback-related classes to PSM
-    for _, feedbackRow in feedbackClasses.iterrows():
-        feedbackClassId = generateId(existingIds, idLength)  # Generate new ID for feedback class
-        feedbackClassName = f"{feedbackRow['Class Name']}"  # Rename feedback class for PSM
-        psmClasses = add_class_to_psm(feedbackClassId, feedbackClassName)
+    for feedbackClass in feedbackClasses:
+        feedbackClassId = psmBuilder.nextId()  # Generate new ID for feedback class
+        feedbackClassName = feedbackClass.name
+        psmBuilder.addClass(feedbackClassId, feedbackClassName)
 
         # 9. Add containment relationship between DigitalTwinManager and Feedback-related classes
-        psmRelations = add_relation_to_psm(
+        psmBuilder.addRelation(
             digitalTwinManagerId, digitalTwinManagerName,
             feedbackClassId, feedbackClassName,
             "Containment", aggregation=False
         )
 
     # 5. Add usage relationship between DigitalTwinManager and DigitalTwinHMI
-    psmRelations = add_relation_to_psm(digitalTwinHMIId, 'DigitalTwinHMI',
+    psmBuilder.addRelation(digitalTwinHMIId, 'DigitalTwinHMI',
         digitalTwinManagerId, digitalTwinManagerName,
         "Usage", aggregation=False
     )
 
     # 6. Add usage relationship between DigitalTwinManager and Planner
-    psmRelations = add_relation_to_psm(
+    psmBuilder.addRelation(
         digitalTwinManagerId, digitalTwinManagerName,
         plannerId, 'Planner',
         "Usage", aggregation=False
     )
 
     # 7. Add aggregation relationship between Planner and ScenarioGenerator
-    psmRelations = add_relation_to_psm(
+    psmBuilder.addRelation(
         plannerId, 'Planner',
         scenarioGeneratorId, 'ScenarioGenerator',
         "Aggregation", aggregation="Shared"
     )
 
     # 8. Add usage relationship between ScenarioGenerator and SumoSimulator
-    sumoSimulator = findClassesByPartialName(psmClasses, 'SumoSimulator')
-    if not sumoSimulator.empty:
-        sumoSimulatorId = sumoSimulator.iloc[0]['Class ID']
-        sumoSimulatorName = sumoSimulator.iloc[0]['Class Name']
-        psmRelations = add_relation_to_psm(
+    sumoSimulator = psmBuilder.findClass('SumoSimulator')
+    if sumoSimulator is not None:
+        sumoSimulatorId, sumoSimulatorName = sumoSimulator
+        psmBuilder.addRelation(
             scenarioGeneratorId, 'ScenarioGenerator',
             sumoSimulatorId, sumoSimulatorName,
             "Usage", aggregation=False
         )
 
-    return psmClasses, psmRelations
 
 
 ############################### RULE5: integrateData  ##############################
-def integrateData(pimClasses, pimRelations, psmClasses, psmRelations):
+def integrateData(pimClasses, pimRelations, psmBuilder, pimLookupCache=None, fiwareClasses=None):
     """
     Transform and integrate data-related classes from PIM to PSM by creating and relating data management classes.
 
     Args:
         pimClasses (pd.DataFrame): DataFrame of PIM classes
         pimRelations (pd.DataFrame): DataFrame of PIM relationships
-        psmClasses (pd.DataFrame): DataFrame of PSM classes
-        psmRelations (pd.DataFrame): DataFrame of PSM relationships
-
-    Returns:
-        tuple: Updated PSM classes and relationships DataFrames.
+        psmBuilder (PSMBuilder): Accumulator of the PSM classes and relations, updated in place
+        pimLookupCache (dict): Optional cache of partial-name lookups on pimClasses.
+        fiwareClasses (dict): Optional Fiware Context classes returned by createFiwareContext. If None, they are
+                              searched by name in psmBuilder.
     """
-    # Helper to add a new class to PSM
-    def add_class_to_psm(class_id, class_name):
-        new_class = {'Class ID': class_id, 'Class Name': class_name}
-        return pd.concat([psmClasses, pd.DataFrame([new_class])], ignore_index=True)
-
-    # Helper to add a new relationship to PSM
-    def add_relation_to_psm(from_id, from_name, to_id, to_name, rel_type, aggregation=False):
-        new_relation = {
-            'Relationship Type': rel_type,
-            'From Class ID': from_id,
-            'From Class Name': from_name,
-            'To Class ID': to_id,
-            'To Class Name': to_name,
-            'Aggregation': aggregation
-        }
-        return pd.concat([psmRelations, pd.DataFrame([new_relation])], ignore_index=True)
-
-    # 1. Search the DataManager class in PIM
-    dataManagerPIM = findClassesByPartialName(pimClasses, 'DataManager')
-
-    # 2. Create the new DataManager class in PSM
-    existingIds = getExistingIds(psmClasses)
-    idLength = getIdLength(psmClasses)
-
-    dataManagerId = generateId(existingIds, idLength)
-    psmClasses = add_class_to_psm(dataManagerId, 'DataManager')
-
-    # 3. Create the DataModelManager and DatabaseManager classes
-    dataModelManagerId = generateId(existingIds, idLength)
-    databaseManagerId = generateId(existingIds, idLength)
-
-    psmClasses = add_class_to_psm(dataModelManagerId, 'DataModelManager')
-    psmClasses = add_class_to_psm(databaseManagerId, 'DatabaseManager')
-
-    # 4. Add generalization relations between DatabaseManager (parent) and MongoManager and TimescaleManager (children)
-    mongoManager = findClassesByPartialName(psmClasses, 'MongoManager')
-    timescaleManager = findClassesByPartialName(psmClasses, 'TimescaleManager')
-
-    if not mongoManager.empty and not timescaleManager.empty:
-        mongoManagerId = mongoManager.iloc[0]['Class ID']
-        mongoManagerName = mongoManager.iloc[0]['Class Name']
-
-        timescaleManagerId = timescaleManager.iloc[0]['Class ID']
-        timescaleManagerName = timescaleManager.iloc[0]['Class Name']
+    # 1. Create the new DataManager class in PSM
+    dataManagerId, dataModelManagerId, databaseManagerId = (psmBuilder.nextId() for _ in range(3))
+    psmBuilder.addClass(dataManagerId, 'DataManager')
+
+    # 2. Create the DataModelManager and DatabaseManager classes
+    psmBuilder.addClass(dataModelManagerId, 'DataModelManager')
+    psmBuilder.addClass(databaseManagerId, 'DatabaseManager')
+
+    # 3. Add generalization relations between DatabaseManager (parent) and MongoManager and TimescaleManager (children)
+    if fiwareClasses is not None:
+        mongoManager = fiwareClasses['mongo']
+        timescaleManager = fiwareClasses['timescale']
+    else:
+        mongoManager = psmBuilder.findClass('MongoManager')
+        timescaleManager = psmBuilder.findClass('TimescaleManager')
+
+    if mongoManager is not None and timescaleManager is not None:
+        mongoManagerId, mongoManagerName = mongoManager
+        timescaleManagerId, timescaleManagerName = timescaleManager
 
         # Add generalization relationships
-        psmRelations = add_relation_to_psm(
+        psmBuilder.addRelation(
             databaseManagerId, 'DatabaseManager',
             mongoManagerId, mongoManagerName,
             "Generalization"
         )
-        psmRelations = add_relation_to_psm(
+        psmBuilder.addRelation(
             databaseManagerId, 'DatabaseManager',
             timescaleManagerId, timescaleManagerName,
             "Generalization"
         )
 
     # Add the usage relation between DataModelManager and ContextBroker class
-    contextBroker = findClassesByPartialName(psmClasses, 'ContextBroker')
-    if not contextBroker.empty:
-        contextBrokerId = contextBroker.iloc[0]['Class ID']
-        contextBrokerName = contextBroker.iloc[0]['Class Name']
-
-        psmRelations = add_relation_to_psm(
+    if fiwareClasses is not None:
+        contextBroker = fiwareClasses['broker']
+    else:
+        contextBroker = psmBuilder.findClass('ContextBroker')
+    if contextBroker is not None:
+        contextBrokerId, contextBrokerName = contextBroker
+
+        psmBuilder.addRelation(
             contextBrokerId, contextBrokerName,
             dataModelManagerId, 'DataModelManager',
             "Usage"
         )
 
     # Add aggregation shared relations between DataManager and DataModelManager, and DatabaseManager
-    psmRelations = add_relation_to_psm(
+    psmBuilder.addRelation(
         dataManagerId, 'DataManager',
         dataModelManagerId, 'DataModelManager',
         "Aggregation", aggregation="Shared"
     )
-    psmRelations = add_relation_to_psm(
+    psmBuilder.addRelation(
         dataManagerId, 'DataManager',
         databaseManagerId, 'DatabaseManager',
         "Aggregation", aggregation="Shared"
     )
 
     # Add the usage relation between the DigitalTwinManager and DataManager
-    digitalTwinManager = findClassesByPartialName(psmClasses, PIM_TWIN_MANAGER_CLASS_NAME)
-    if not digitalTwinManager.empty:
-        digitalTwinManagerId = digitalTwinManager.iloc[0]['Class ID']
-        digitalTwinManagerName = digitalTwinManager.iloc[0]['Class Name']
+    digitalTwinManager = psmBuilder.findClass(PIM_TWIN_MANAGER_CLASS_NAME)
+    if digitalTwinManager is not None:
+        digitalTwinManagerId, digitalTwinManagerName = digitalTwinManager
 
-        psmRelations = add_relation_to_psm(
+        psmBuilder.addRelation(
             digitalTwinManagerId, digitalTwinManagerName,
             dataManagerId, 'DataManager',
             "Usage"
         )
 
-    return psmClasses, psmRelations
 
 
 def updateShadowRelation(pimClasses, pimRelations, psmClasses, psmRelations):
@@ -1,6 +1,16 @@
-CIM_VP_XML_FILE_PATH = "./MDAModelingLevels/01.CIM/VP_GENERATED_XML/project.xml"
-CIM_IMPORTED_CLASSES_FILE_PATH = "./TransformationResults/Classes/imported_cimclasses.csv"
-CIM_IMPORTED_RELATIONS_FILE_PATH = "./TransformationResults/Relations/imported_cimrelations.csv"
+from pathlib import Path
+
+# Base directories of the modeling levels and of the transformation results
+MDA_MODELING_LEVELS_DIR = Path("MDAModelingLevels")
+CIM_DIR = MDA_MODELING_LEVELS_DIR / "01.CIM"
+PIM_DIR = MDA_MODELING_LEVELS_DIR / "02.PIM"
+PSM_DIR = MDA_MODELING_LEVELS_DIR / "03.PSM"
+RESULTS_CLASSES_DIR = Path("TransformationResults") / "Classes"
+RESULTS_RELATIONS_DIR = Path("TransformationResults") / "Relations"
+
+CIM_VP_XML_FILE_PATH = CIM_DIR / "VP_GENERATED_XML" / "project.xml"
+CIM_IMPORTED_CLASSES_FILE_PATH = RESULTS_CLASSES_DIR / "imported_cimclasses.csv"
+CIM_IMPORTED_RELATIONS_FILE_PATH = RESULTS_RELATIONS_DIR / "imported_cimrelations.csv"
 
 # Meta Class representing the Physical Twin that the Digital Twin seeks to replicate.
 CIM_REAL_TWIN_CLASS_NAME = "RealCity"
@@ -13,13 +23,13 @@ SENSOR_ENTITY_CLASS_NAME="Sensor"
 #Meta Class abstracting actuator entities in the Physical Twin.
 ACTUATOR_ENTITY_CLASS_NAME="Actuator"
 
-PIM_M2MT_XML_FILE_PATH = "./MDAModelingLevels/02.PIM/M2MT_GENERATED_XML/pim.xml"
-PIM_VP_XML_FILE_PATH = "./MDAModelingLevels/02.PIM/VP_GENERATED_XML/project.xml"
+PIM_M2MT_XML_FILE_PATH = PIM_DIR / "M2MT_GENERATED_XML" / "pim.xml"
+PIM_VP_XML_FILE_PATH = PIM_DIR / "VP_GENERATED_XML" / "project.xml"
 PIM_PROJECT_NAME = "PlaformIndependentModel"
 PIM_PROJECT_AUTHOR = "PIMAuthor"
 PIM_CLASS_DIAGRAM_NAME = "BolognaMobilityDigitalTwin"
-PIM_GENERATED_CLASSES_FILE_PATH = "./TransformationResults/Classes/generated_pimclasses.csv"
-PIM_GENERATED_RELATIONS_FILE_PATH = "./TransformationResults/Relations/generated_pimrelations.csv"
+PIM_GENERATED_CLASSES_FILE_PATH = RESULTS_CLASSES_DIR / "generated_pimclasses.csv"
+PIM_GENERATED_RELATIONS_FILE_PATH = RESULTS_RELATIONS_DIR / "generated_pimrelations.csv"
 
 PIM_DIGITAL_RELATED_CLASS_NAME = "DigitalRepresentation"
 PIM_DIGITAL_MODEL_RELATED_CLASS_NAME = "DigitalModel"
@@ -32,10 +42,10 @@ PIM_ADAPTER_CLASS_NAME = "Adapter"
 
 
 
-PSM_M2MT_XML_FILE_PATH = "./MDAModelingLevels/03.PSM/M2MT_GENERATED_XML/psm.xml"
-PSM_VP_XML_FILE_PATH = "./MDAModelingLevels/03.PSM/VP_GENERATED_XML/project.xml"
+PSM_M2MT_XML_FILE_PATH = PSM_DIR / "M2MT_GENERATED_XML" / "psm.xml"
+PSM_VP_XML_FILE_PATH = PSM_DIR / "VP_GENERATED_XML" / "project.xml"
 PSM_PROJECT_NAME = "PlatformSpecificModel"
 PSM_PROJECT_AUTHOR = "PSMAuthor"
 PSM_CLASS_DIAGRAM_NAME = "FiwareandSumoBolognaMobilityDigitalTwin"
-PSM_GENERATED_CLASSES_FILE_PATH = "./TransformationResults/Classes/generated_psmclasses.csv"
-PSM_GENERATED_RELATIONS_FILE_PATH = "./TransformationResults/Relations/generated_psmrelations.csv"
\ No newline at end of file
+PSM_GENERATED_CLASSES_FILE_PATH = RESULTS_CLASSES_DIR / "generated_psmclasses.csv"
+PSM_GENERATED_RELATIONS_FILE_PATH = RESULTS_RELATIONS_DIR / "generated_psmrelations.csv"
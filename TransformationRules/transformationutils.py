@@ -1,7 +1,30 @@
-import random
+import os
 import string
+import numpy as np
 import pandas as pd
 
+# Characters used to generate class and element IDs
+ID_ALPHABET = string.ascii_letters + string.digits
+# Random bytes below 248 (= 4 * 62) are mapped uniformly onto ID_ALPHABET; the others are discarded
+ID_BYTE_TABLE = bytes((ID_ALPHABET * 5)[:248], 'ascii') + bytes(8)
+ID_REJECTED_BYTES = bytes(range(248, 256))
+
+def randomId(length: int = 10) -> str:
+    """
+    Generate a random alphanumeric string of specified length.
+
+    Args:
+        length (int): Length of the generated string. Default is 10.
+
+    Returns:
+        str: A random alphanumeric string.
+    """
+    newId = b''
+    while len(newId) < length:
+        # Map a batch of random bytes onto the alphabet in one call, dropping the bytes that would bias it
+        newId += os.urandom(2 * length).translate(ID_BYTE_TABLE, ID_REJECTED_BYTES)
+    return newId[:length].decode('ascii')
+
 def generateId(existingIds: set, length: int = 10) -> str:
     """
     Generate a unique alphanumeric ID of specified length.
@@ -15,12 +38,66 @@ def generateId(existingIds: set, length: int = 10) -> str:
     """
     while True:
         # Generate a random alphanumeric string of the specified length
-        newId = ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+        newId = randomId(length)
 
         # Check if the generated ID is unique within existingIds
         if newId not in existingIds:
             existingIds.add(newId)  # Track the new ID to maintain uniqueness
             return newId  # Return the unique ID
+def generateIds(existingIds: set, length: int = 10, count: int = 1) -> list:
+    """
+    Generate several unique alphanumeric IDs of specified length in one pass.
+
+    Args:
+        existingIds (set): A set of existing IDs to ensure uniqueness. New IDs are added to it.
+        length (int): Length of each generated ID. Default is 10.
+        count (int): Number of IDs to generate. Default is 1.
+
+    Returns:
+        list: The generated IDs, none of which was present in existingIds.
+    """
+    newIds = []
+    while len(newIds) < count:
+        newId = randomId(length)
+        if newId not in existingIds:
+            existingIds.add(newId)
+            newIds.append(newId)
+    return newIds
+def createIdCounter(existingIds: set, length: int = 10):
+    """
+    Create a generator of sequential hexadecimal IDs that do not collide with existing ones.
+
+    The counter starts after the largest existing ID that is a valid hexadecimal number, so no collision check is
+    needed for the generated IDs.
+
+    Args:
+        existingIds (set): A set of existing IDs. New IDs are added to it.
+        length (int): Minimum length of each generated ID, padded with leading zeros. Default is 10.
+
+    Returns:
+        callable: A function with no arguments returning the next unique ID.
+    """
+    counter = max((int(existingId, 16) for existingId in existingIds if isHexId(existingId)), default=0)
+
+    def nextId() -> str:
+        nonlocal counter
+        counter += 1
+        newId = format(counter, f'0{length}x')
+        existingIds.add(newId)  # Track the new ID to maintain uniqueness
+        return newId
+
+    return nextId
+def isHexId(classId) -> bool:
+    """
+    Check whether an ID is a valid hexadecimal number.
+
+    Args:
+        classId: The ID to check.
+
+    Returns:
+        bool: True if the ID only contains hexadecimal digits.
+    """
+    return isinstance(classId, str) and classId != '' and all(c in string.hexdigits for c in classId)
 def getIdLength(classesDf: pd.DataFrame) -> int:
     """
     Get the length of the longest existing class ID to ensure new IDs follow the same pattern.
@@ -47,6 +124,21 @@ def getExistingIds(classesDf: pd.DataFrame) -> set:
         return set()
 
     return set(classesDf['Class ID'])
+def findGeneralizationChildPositions(relationsDf: pd.DataFrame, parentClassId: str) -> np.ndarray:
+    """
+    Find the positions of the generalization relationships whose 'From Class ID' is a given parent class.
+
+    Args:
+        relationsDf (pd.DataFrame): DataFrame of relationships.
+        parentClassId (str): The ID of the parent class in the generalization relationship.
+
+    Returns:
+        np.ndarray: Ascending positions of the matching rows, for use with relationsDf.iloc.
+    """
+    # Compare the underlying arrays, so no intermediate Series is built and aligned
+    mask = (relationsDf['Relationship Type'].values == 'Generalization') & \
+           (relationsDf['From Class ID'].values == parentClassId)
+    return np.flatnonzero(mask)
 def findGeneralizationChildClasses(relationsDf: pd.DataFrame, parentClassId: str) -> pd.DataFrame:
     """
     Find all child classes of a given 'From Class ID' in generalization relationships.
@@ -58,21 +150,54 @@ def findGeneralizationChildClasses(relationsDf: pd.DataFrame, parentClassId: str
     Returns:
         pd.DataFrame: DataFrame of child classes in the generalization relationship.
     """
-    return relationsDf[(relationsDf['Relationship Type'] == 'Generalization') &
-                       (relationsDf['From Class ID'] == parentClassId)]
-def findClassId(dfClasses: pd.DataFrame, className: str) -> str:
+    return relationsDf.iloc[findGeneralizationChildPositions(relationsDf, parentClassId)]
+def buildNameToIdMap(dfClasses: pd.DataFrame) -> dict:
+    """
+    Map the class names to their class IDs.
+
+    Args:
+        dfClasses (pd.DataFrame): DataFrame of classes.
+
+    Returns:
+        dict: Mapping of each class name to the ID of the first class with that name.
+    """
+    classIdsByName = {}
+    for classId, className in zip(dfClasses['Class ID'].to_numpy(), dfClasses['Class Name'].to_numpy()):
+        classIdsByName.setdefault(className, classId)
+    return classIdsByName
+def findClassId(dfClasses: pd.DataFrame, className: str, classIdsByName: dict = None) -> str:
     """
     Find the class ID of a class by its name.
 
     Args:
         dfClasses (pd.DataFrame): DataFrame of classes.
         className (str): The name of the class.
+        classIdsByName (dict): Optional mapping of dfClasses built by buildNameToIdMap. If None, dfClasses is scanned.
 
     Returns:
         str: The class ID or None if not found.
     """
+    if classIdsByName is not None:
+        return classIdsByName.get(className)
     classId = dfClasses[dfClasses['Class Name'] == className]['Class ID'].values
     return classId[0] if len(classId) > 0 else None
+def buildRelationsIndex(relationsDf: pd.DataFrame) -> dict:
+    """
+    Index the positions of the relationships by the IDs of the classes at both ends.
+
+    Args:
+        relationsDf (pd.DataFrame): DataFrame of relationships.
+
+    Returns:
+        dict: Mapping of each class ID to the ascending positions of the relationships involving it.
+    """
+    relationsIndex = {}
+    for position, (fromClassId, toClassId) in enumerate(zip(relationsDf['From Class ID'].to_numpy(),
+                                                            relationsDf['To Class ID'].to_numpy())):
+        relationsIndex.setdefault(fromClassId, []).append(position)
+        if toClassId != fromClassId:
+            relationsIndex.setdefault(toClassId, []).append(position)
+    return relationsIndex
 def findRelatedRelationships(relationsDf: pd.DataFrame, classId: str) -> pd.DataFrame:
     """
     Find relationships (associations, aggregations, compositions) involving a class by its ID.
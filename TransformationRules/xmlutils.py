@@ -1,134 +1,160 @@
+import copy
+import csv
+import functools
+import logging
+import sys
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+import numpy as np
 import pandas as pd
 import os
-from TransformationRules.transformationutils import generateId, getExistingIds, getIdLength
+from TransformationRules.transformationutils import (generateId, generateIds, getExistingIds, getIdLength,
+                                                     buildRelationsIndex)
 from datetime import datetime
 
+# Logger of the save functions; their messages are debug level, so callers can silence them
+logger = logging.getLogger(__name__)
+
+# AggregationKind of the AssociationEnd of each association relationship type in the generated XML
+AGGREGATION_KIND_BY_RELATIONSHIP_TYPE = {'Association': 'None', 'Aggregation': 'Shared', 'Composition': 'Composite'}
+# Id and Name of the primitive data types added to every generated project
+STATIC_DATA_TYPES = (("k2eZzEmGAqAC8QXD", "boolean"), ("G2eZzEmGAqAC8QXE", "byte"), ("G2eZzEmGAqAC8QXF", "char"),
+                     ("G2eZzEmGAqAC8QXG", "double"), ("G2eZzEmGAqAC8QXH", "float"), ("G2eZzEmGAqAC8QXI", "int"),
+                     ("G2eZzEmGAqAC8QXJ", "long"), ("G2eZzEmGAqAC8QXK", "short"), ("G2eZzEmGAqAC8QXL", "void"),
+                     ("G2eZzEmGAqAC8QXM", "string"))
+# Columns of the relationships DataFrame built by SourceXMLParser
+RELATIONSHIP_COLUMNS = ('Relationship Type', 'From Class ID', 'From Class Name', 'To Class ID', 'To Class Name')
+# Relationship type of an association by the AggregationKind of its from end; any other kind is an Association
+RELATIONSHIP_TYPE_BY_AGGREGATION = {"Shared": "Aggregation", "Composite": "Composition"}
+# Size of the chunks in which the source XML is fed to the parser
+SOURCE_XML_CHUNK_SIZE = 1 << 16
+# Buffer size of the generated XML files, so large documents are written in few system calls
+XML_WRITE_BUFFER_SIZE = 1 << 20
+# Number of parsed source XML files whose results SourceXMLParser keeps for repeated calls
+SOURCE_XML_PARSE_CACHE_SIZE = 8
+
 def generateTimestamp():
     return datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
 
-class UMLClass:
-    """Class to store UML Class details."""
-    def __init__(self, class_id, name):
-        self.class_id = class_id
-        self.name = name
-        self.generalizations = []
-        self.specializations = []
-
 ##### VP_GENERATED_XML PARSING #######
-def parseClasses(rootElement):
+class SourceXMLTarget:
     """
-    Parse the VP_GENERATED_XML to extract classes and return a dictionary of class IDs and names.
-
-    Args:
-        rootElement: VP_GENERATED_XML root element.
-
-    Returns:
-        classes: A dictionary of UMLClass objects.
-        dfClasses: DataFrame of class IDs and names.
+    Parser target collecting the UML classes and relationships of a VP_GENERATED_XML while expat reads it,
+    without building the element tree.
     """
-    classes = {}
+    def __init__(self):
+        self.classes = {}
+        self.classNames = set()
+        self.associationEnds = []
+        self.generalizationEnds = []
+        self.tagStack = []
+        self.openAssociations = []  # [from end attributes, to end attributes] of each open Association element
+
+    def start(self, tag, attrib):
+        if tag == "Class":
+            parseClass(attrib, self.classes, self.classNames)
+        elif tag == "Generalization":
+            parseGeneralization(attrib, self.generalizationEnds)
+        elif tag == "Association":
+            self.openAssociations.append([None, None])
+        elif tag == "AssociationEnd" and len(self.tagStack) >= 2 and self.tagStack[-2] == "Association":
+            # Keep the first FromEnd/AssociationEnd and ToEnd/AssociationEnd child of the innermost Association
+            openAssociation = self.openAssociations[-1]
+            if self.tagStack[-1] == "FromEnd" and openAssociation[0] is None:
+                openAssociation[0] = attrib
+            elif self.tagStack[-1] == "ToEnd" and openAssociation[1] is None:
+                openAssociation[1] = attrib
+        self.tagStack.append(tag)
+
+    def end(self, tag):
+        self.tagStack.pop()
+        # The association ends are children of the Association element, so they are complete only at its end
+        if tag == "Association":
+            fromEndAttributes, toEndAttributes = self.openAssociations.pop()
+            parseAssociation(fromEndAttributes, toEndAttributes, self.associationEnds)
+
+    def close(self):
+        return self
 
-    for classElement in rootElement.findall(".//Class"):
-        classId = classElement.get("Id")
-        className = classElement.get("Name")
+##### VP_GENERATED_XML PARSING #######
+def parseClass(classAttributes, classes, seenNames):
+    """
+    Add a class of the VP_GENERATED_XML to the dictionary of parsed classes.
 
-        if classId and classId not in classes and className not in [cls.name for cls in classes.values()]:
-            newClass = UMLClass(class_id=classId, name=className)
-            classes[classId] = newClass
+    Classes without an ID, and classes whose ID or name was already parsed, are skipped.
 
-    classData = {
-        'Class ID': [cls.class_id for cls in classes.values()],
-        'Class Name': [cls.name for cls in classes.values()]
-    }
-
-    dfClasses = pd.DataFrame(classData)
-    return classes, dfClasses
-def findAssociations(rootElement, classDict):
+    Args:
+        classAttributes: Attributes of a Class element of the VP_GENERATED_XML.
+        classes: Dictionary of class names by class ID, updated in place.
+        seenNames: Set of the names of the parsed classes, updated in place.
     """
-    Extract association, aggregation, and composition relationships from the VP_GENERATED_XML.
+    classId = classAttributes.get("Id")
+    className = classAttributes.get("Name")
+
+    if classId and classId not in classes and className not in seenNames:
+        classId = sys.intern(classId)  # Shared with the relationship ends referencing this class
+        classes[classId] = className
+        seenNames.add(className)
+def parseAssociation(fromEndAttributes, toEndAttributes, associationEnds):
+    """
+    Extract an association, aggregation or composition relationship from the ends of an Association element.
 
     Args:
-        rootElement: VP_GENERATED_XML root element.
-        classDict: Dictionary of UMLClass objects.
-
-    Returns:
-        relationships: A list of relationship dictionaries.
+        fromEndAttributes: Attributes of the FromEnd/AssociationEnd element, or None if it is missing.
+        toEndAttributes: Attributes of the ToEnd/AssociationEnd element, or None if it is missing.
+        associationEnds: List of (relationship type, from class ID, to class ID) tuples, updated in place.
     """
-    relationships = []
-
-    for associationElement in rootElement.findall(".//Association"):
-        fromEndElement = associationElement.find(".//FromEnd/AssociationEnd")
-        toEndElement = associationElement.find(".//ToEnd/AssociationEnd")
-
-        if fromEndElement is not None and toEndElement is not None:
-            fromClassId = fromEndElement.get("EndModelElement")
-            toClassId = toEndElement.get("EndModelElement")
-
-            if fromClassId and toClassId:
-                fromClassName = classDict.get(fromClassId, UMLClass(fromClassId, "Unknown")).name
-                toClassName = classDict.get(toClassId, UMLClass(toClassId, "Unknown")).name
-
-                aggregation = fromEndElement.get("AggregationKind", "None")
-                if aggregation == "Shared":
-                    relationshipType = "Aggregation"
-                elif aggregation == "Composite":
-                    relationshipType = "Composition"
-                else:
-                    relationshipType = "Association"
-
-                relationships.append({
-                    'Relationship Type': relationshipType,
-                    'From Class ID': fromClassId,
-                    'From Class Name': fromClassName,
-                    'To Class ID': toClassId,
-                    'To Class Name': toClassName
-                })
-
-    return relationships
-def findGeneralizations(rootElement, classDict, relationshipList):
+    if fromEndAttributes is not None and toEndAttributes is not None:
+        fromClassId = fromEndAttributes.get("EndModelElement")
+        toClassId = toEndAttributes.get("EndModelElement")
+
+        if fromClassId and toClassId:
+            aggregation = fromEndAttributes.get("AggregationKind")
+            relationshipType = RELATIONSHIP_TYPE_BY_AGGREGATION.get(aggregation, "Association")
+            # Interned, so repeated class IDs share a single string object
+            associationEnds.append((relationshipType, sys.intern(fromClassId), sys.intern(toClassId)))
+def parseGeneralization(generalizationAttributes, generalizationEnds):
     """
-    Extract generalization relationships from the VP_GENERATED_XML.
+    Extract a generalization relationship from a Generalization element.
 
     Args:
-        rootElement: VP_GENERATED_XML root element.
-        classDict: Dictionary of UMLClass objects.
-        relationshipList: List of existing relationships (to append to).
-
-    Returns:
-        relationshipList: Updated list of relationships including generalizations.
+        generalizationAttributes: Attributes of a Generalization element of the VP_GENERATED_XML.
+        generalizationEnds: List of (relationship type, from class ID, to class ID) tuples, updated in place.
     """
-    for generalizationElement in rootElement.findall(".//Generalization"):
-        fromClassId = generalizationElement.get("From")
-        toClassId = generalizationElement.get("To")
+    fromClassId = generalizationAttributes.get("From")
+    toClassId = generalizationAttributes.get("To")
 
-        if fromClassId and toClassId:
-            fromClassName = classDict.get(fromClassId, UMLClass(fromClassId, "Unknown")).name
-            toClassName = classDict.get(toClassId, UMLClass(toClassId, "Unknown")).name
-
-            relationshipList.append({
-                'Relationship Type': 'Generalization',
-                'From Class ID': fromClassId,
-                'From Class Name': fromClassName,
-                'To Class ID': toClassId,
-                'To Class Name': toClassName
-            })
-
-    return relationshipList
-def filterUnknownClasses(dataFrame):
+    if fromClassId and toClassId:
+        generalizationEnds.append(('Generalization', sys.intern(fromClassId), sys.intern(toClassId)))
+def resolveRelationships(relationshipEnds, classDict):
     """
-    Filter out rows from a DataFrame that have 'Unknown' in the class names.
+    Attach the class names to the parsed relationships, dropping those with an end named "Unknown".
 
     Args:
-        dataFrame: DataFrame containing relationships.
+        relationshipEnds: List of (relationship type, from class ID, to class ID) tuples.
+        classDict: Dictionary of class names by class ID.
 
     Returns:
-        dataFrame: Filtered DataFrame.
+        relationships: A dictionary of relationship column lists. Relationships whose classes are missing from
+                       classDict are left out.
     """
-    dataFrame = dataFrame[dataFrame['From Class Name'] != 'Unknown']
-    dataFrame = dataFrame[dataFrame['To Class Name'] != 'Unknown']
-    return dataFrame
+    # Append to local column lists, so the loop does no dict lookup by column name
+    relationshipTypes, fromClassIds, fromClassNames, toClassIds, toClassNames = [], [], [], [], []
+
+    for relationshipType, fromClassId, toClassId in relationshipEnds:
+        fromClassName = classDict.get(fromClassId, "Unknown")
+        toClassName = classDict.get(toClassId, "Unknown")
+        # Filter out unknown classes before any DataFrame is built
+        if fromClassName == "Unknown" or toClassName == "Unknown":
+            continue
+
+        relationshipTypes.append(relationshipType)
+        fromClassIds.append(fromClassId)
+        fromClassNames.append(fromClassName)
+        toClassIds.append(toClassId)
+        toClassNames.append(toClassName)
+
+    return dict(zip(RELATIONSHIP_COLUMNS, (relationshipTypes, fromClassIds, fromClassNames, toClassIds,
+                                           toClassNames)))
 def SourceXMLParser(xmlFilePath):
     """
     Parse an VP_GENERATED_XML file to extract UML classes and relationships,
@@ -141,18 +167,44 @@ def SourceXMLParser(xmlFilePath):
         dfClasses: DataFrame containing UML classes.
         dfRelationships: DataFrame containing UML relationships.
     """
-    tree = ET.parse(xmlFilePath)
-    rootElement = tree.getroot()
-    # Step 1: Parse UML classes
-    umlClasses, dfClasses = parseClasses(rootElement)
-    # Step 2: Find UML relationships (associations, aggregations, compositions)
-    umlRelationships = findAssociations(rootElement, umlClasses)
-    # Step 3: Find generalization relationships
-    umlRelationships = findGeneralizations(rootElement, umlClasses, umlRelationships)
-    # Step 4: Convert relationships to DataFrame
-    dfRelationships = pd.DataFrame(umlRelationships)
-    # Step 5: Filter out unknown classes
-    dfRelationships = filterUnknownClasses(dfRelationships)
+    # Reuse the result of a previous parse of the same, unmodified file
+    dfClasses, dfRelationships = parseSourceXml(os.path.abspath(xmlFilePath), os.stat(xmlFilePath).st_mtime_ns)
+    return dfClasses.copy(), dfRelationships.copy()  # Copies, so callers cannot alter the cached result
+@functools.lru_cache(maxsize=SOURCE_XML_PARSE_CACHE_SIZE)
+def parseSourceXml(xmlFilePath, modificationTime):
+    """
+    Parse an VP_GENERATED_XML file into class and relationship DataFrames, caching the results.
+
+    Args:
+        xmlFilePath: Absolute path to the VP_GENERATED_XML file.
+        modificationTime: Modification time of the file in ns. It is only part of the cache key, so a modified file
+                          is parsed again.
+
+    Returns:
+        dfClasses: DataFrame containing UML classes.
+        dfRelationships: DataFrame containing UML relationships.
+    """
+    # Step 1: Read the XML once with the C expat parser, collecting UML classes and relationships in document order
+    parser = ET.XMLParser(target=SourceXMLTarget())
+    with open(xmlFilePath, "rb") as xmlFile:
+        # Stream the file in fixed-size chunks, so memory use does not grow with the size of the XML
+        for chunk in iter(lambda: xmlFile.read(SOURCE_XML_CHUNK_SIZE), b""):
+            parser.feed(chunk)
+    target = parser.close()
+    umlClasses = target.classes
+    associationEnds = target.associationEnds
+    generalizationEnds = target.generalizationEnds
+    # The class dictionary is keyed by class ID in parsing order, so its keys are already the ID column
+    dfClasses = pd.DataFrame({'Class ID': list(umlClasses),
+                              'Class Name': list(umlClasses.values())})
+    # Step 2: Resolve the class names of the relationships (associations, aggregations, compositions, then
+    # generalizations), which may reference classes defined later in the file, and filter out unknown classes
+    umlRelationships = resolveRelationships(associationEnds + generalizationEnds, umlClasses)
+    # Step 3: Convert the relationship columns to DataFrame, storing the small vocabularies of relationship types and
+    # class names as categoricals
+    dfRelationships = pd.DataFrame(umlRelationships).astype({'Relationship Type': 'category',
+                                                             'From Class Name': 'category',
+                                                             'To Class Name': 'category'})
     return dfClasses, dfRelationships
 
 ### SAVE CLASSES AND RELATIONS TO CSV ###
@@ -170,97 +222,37 @@ def saveToCsv(dfClasses, dfRelationships, classesFilePath, relationshipsFilePath
     """
     # Ensure the directory for classesFilePath exists
     classesDir = os.path.dirname(classesFilePath)
-    if classesDir and not os.path.exists(classesDir):
-        os.makedirs(classesDir)
-        print(f"Created directory: {classesDir}")
+    if classesDir:
+        os.makedirs(classesDir, exist_ok=True)
 
     # Ensure the directory for relationshipsFilePath exists
     relationshipsDir = os.path.dirname(relationshipsFilePath)
-    if relationshipsDir and not os.path.exists(relationshipsDir):
-        os.makedirs(relationshipsDir)
-        print(f"Created directory: {relationshipsDir}")
+    if relationshipsDir:
+        os.makedirs(relationshipsDir, exist_ok=True)
 
     # Save DataFrames to CSV, overwriting any existing files
-    dfClasses.to_csv(classesFilePath, index=False)
-    dfRelationships.to_csv(relationshipsFilePath, index=False)
-    print(f"Classes saved to {classesFilePath}")
-    print(f"Relationships saved to {relationshipsFilePath}")
-
+    writeCsv(dfClasses, classesFilePath)
+    writeCsv(dfRelationships, relationshipsFilePath)
+    logger.debug("Classes saved to %s", classesFilePath)
+    logger.debug("Relationships saved to %s", relationshipsFilePath)
 
-### XML GENERATION ##
-def generateXml(inputClasses: pd.DataFrame, inputRelations: pd.DataFrame, projectName: str, fileName: str):
+def writeCsv(dataFrame, filePath):
     """
-    Generate an XML file representing the provided classes and relationships in the PIM model.
-
-    This function creates a structured XML document with class and relationship elements based on
-    the provided DataFrames of classes and relationships.
+    Write a DataFrame to a CSV file with the C csv writer, producing the same file as to_csv(index=False).
 
     Args:
-        inputClasses (pd.DataFrame): DataFrame containing PIM classes with 'Class ID' and 'Class Name' columns.
-        inputRelations (pd.DataFrame): DataFrame containing PIM relationships with 'Relationship Type', 'From Class ID', 'To Class ID', and optional 'Aggregation' columns.
-        projectName (str): The name of the project in which the XML document is included.
-        fileName (str): The name of the file where the XML document will be saved.
+        dataFrame: DataFrame to write.
+        filePath: Path of the CSV file, overwritten if it exists.
     """
-    # Create the root element <Project>
-    project = ET.Element("Project", {
-        "Author": "Generated",
-        "Name": projectName,
-        "UmlVersion": "2.x",
-        "Xml_structure": "simple"
-    })
-
-    # Create the <Models> container under <Project>
-    models = ET.SubElement(project, "Models")
-
-    # Add all classes from inputClasses DataFrame
-    for _, row in inputClasses.iterrows():
-        # Create <Class> element for each row
-        ET.SubElement(models, "Class", {
-            "Id": row["Class ID"],
-            "Name": row["Class Name"]
-        })
+    # Missing values become None, which the csv writer outputs as an empty field like pandas does
+    rows = dataFrame.to_numpy(dtype=object, na_value=None).tolist()
+    with open(filePath, "w", newline="", encoding="utf-8") as csvFile:
+        writer = csv.writer(csvFile, lineterminator=os.linesep)
+        writer.writerow(dataFrame.columns)
+        writer.writerows(rows)
 
-    # Add all relationships from inputRelations DataFrame
-    relationshipContainer = ET.SubElement(models, "ModelRelationshipContainer", {
-        "Id": "Relationships",
-        "Name": "relationships"
-    })
 
-    for _, row in inputRelations.iterrows():
-        relationshipType = row["Relationship Type"]
-        fromClassId = row["From Class ID"]
-        toClassId = row["To Class ID"]
-        aggregation = row.get("Aggregation", None)
-
-        if relationshipType == "Generalization":
-            # Add <Generalization> element
-            ET.SubElement(relationshipContainer, "Generalization", {
-                "From": fromClassId,
-                "To": toClassId
-            })
-        elif relationshipType == "Aggregation":
-            # Add <Association> element with AggregationKind for aggregation
-            association = ET.SubElement(relationshipContainer, "Association", {
-                "From": fromClassId,
-                "To": toClassId
-            })
-            ET.SubElement(association, "FromEnd", {
-                "AggregationKind": aggregation if aggregation else "None"
-            })
-            ET.SubElement(association, "ToEnd", {
-                "AggregationKind": "None"
-            })
-        elif relationshipType == "Usage":
-            # Add <Usage> element
-            ET.SubElement(relationshipContainer, "Usage", {
-                "From": fromClassId,
-                "To": toClassId
-            })
-
-    # Write the XML tree to a file
-    tree = ET.ElementTree(project)
-    tree.write(fileName, encoding="utf-8", xml_declaration=True)
-    print(f"XML file '{fileName}' generated successfully.")
+### XML GENERATION ##
 def saveXml(project: ET.Element, outputXmlPath: str):
     """
     Save the XML tree to the specified file path, creating the directory if it does not exist.
@@ -271,15 +263,14 @@ def saveXml(project: ET.Element, outputXmlPath: str):
     """
     # Ensure the directory for the output file exists; create if it does not
     directory = os.path.dirname(outputXmlPath)
-    if not os.path.exists(directory):
-        os.makedirs(directory)
-        print(f"Directory '{directory}' created.")
+    if directory:
+        os.makedirs(directory, exist_ok=True)
 
     # Save the XML tree to the specified file
     tree = ET.ElementTree(project)
-    with open(outputXmlPath, "wb") as file:
+    with open(outputXmlPath, "wb", buffering=XML_WRITE_BUFFER_SIZE) as file:
         tree.write(file, encoding="UTF-8", xml_declaration=True)
-        print(f"XML file generated successfully at '{outputXmlPath}'.")
+    logger.debug("XML file generated successfully at '%s'.", outputXmlPath)
 def prettify(element: ET.Element) -> str:
     """
     Return a pretty-printed XML string for the Element.
@@ -290,330 +281,340 @@ def prettify(element: ET.Element) -> str:
     Returns:
         str: A pretty-printed XML string for the provided element.
     """
-    roughString = ET.tostring(element, 'utf-8')
-    reparsed = minidom.parseString(roughString)
-    return reparsed.toprettyxml(indent="    ")
+    # Indent a copy in place with ElementTree, so the tree is neither reparsed nor modified
+    indentedElement = copy.deepcopy(element)
+    ET.indent(indentedElement, space="    ")
+    return ET.tostring(indentedElement, encoding="unicode")
 
 ### building the XML shapes ###
-def addStaticProjectOptions(projectInfo):
-    projectOptions = ET.SubElement(projectInfo, "ProjectOptions")
-    diagramOptions = ET.SubElement(projectOptions, "DiagramOptions",
-                                   ActivityDiagramControlFlowDisplayOption="\\u0000",
-                                   ActivityDiagramShowActionCallBehaviorOption="\\u0000",
-                                   ActivityDiagramShowActivityEdgeWeight="true",
-                                   ActivityDiagramShowObjectNodeType="true",
-                                   ActivityDiagramShowPartitionHandle="\\u0000",
-                                   AddDataStoresExtEntitiesToDecomposedDFD="\\u0002",
-                                   AlignColumnProperties="true",
-                                   AllowConfigShowInOutFlowButtonsInDataFlowDiagram="false",
-                                   AutoGenerateRoleName="false",
-                                   AutoSetAttributeType="true",
-                                   AutoSetColumnType="true",
-                                   AutoSyncRoleName="true",
-                                   BpdAutoStretchPools="true",
-                                   BpdConnectGatewayWithFlowObjectInDifferentPool="\\u0000",
-                                   BpdDefaultConnectionPointStyle="\\u0001",
-                                   BpdDefaultConnectorStyle="\\u0005",
-                                   BpdDhowIdOption="\\u0000",
-                                   BpdShowActivitiesTypeIcon="true",
-                                   BusinessProcessDiagramDefaultLanguage="English",
-                                   ClassVisibilityStyle="\\u0001",
-                                   ConnectorLabelOrientation="\\u0000",
-                                   CreateOneMessagePerDirection="true",
-                                   DecisionMergeNodeConnectionPointStyle="\\u0000",
-                                   DefaultAssociationEndNavigable="\\u0001",
-                                   DefaultAssociationEndVisibility="\\u0000",
-                                   DefaultAssociationShowFromMultiplicity="true",
-                                   DefaultAssociationShowFromRoleName="true",
-                                   DefaultAssociationShowFromRoleVisibility="true",
-                                   DefaultAssociationShowStereotypes="true",
-                                   DefaultAssociationShowToMultiplicity="true",
-                                   DefaultAssociationShowToRoleName="true",
-                                   DefaultAssociationShowToRoleVisibility="true",
-                                   DefaultAttributeMultiplicity="false",
-                                   DefaultAttributeType="",
-                                   DefaultAttributeVisibility="\\u0001",
-                                   DefaultClassAttributeMultiplicity="",
-                                   DefaultClassAttributeMultiplicityOrdered="false",
-                                   DefaultClassAttributeMultiplicityUnique="true",
-                                   DefaultClassInterfaceBall="false",
-                                   DefaultClassVisibility="\\u0004",
-                                   DefaultColumnType="integer(10)",
-                                   DefaultConnectionPointStyle="\\u0000",
-                                   DefaultConnectorStyle="\\u0001",
-                                   DefaultDiagramBackground="rgb(255, 255, 255)",
-                                   DefaultDisplayAsRobustnessAnalysisIcon="true",
-                                   DefaultDisplayAsRobustnessAnalysisIconInSequenceDiagram="true",
-                                   DefaultDisplayAsStereotypeIcon="false",
-                                   DefaultFontColor="rgb(0, 0, 0)",
-                                   DefaultGenDiagramTypeFromScenario="\\u0000",
-                                   DefaultHtmlDocFontColor="rgb(0, 0, 0)",
-                                   DefaultLineJumps="\\u0000",
-                                   DefaultOperationVisibility="\\u0004",
-                                   DefaultParameterDirection="\\u0002",
-                                   DefaultShowAttributeInitialValue="true",
-                                   DefaultShowAttributeOption="\\u0001",
-                                   DefaultShowClassMemberStereotype="true",
-                                   DefaultShowDirection="false",
-                                   DefaultShowMultiplicityConstraints="false",
-                                   DefaultShowOperationOption="\\u0001",
-                                   DefaultShowOperationSignature="true",
-                                   DefaultShowOrderedMultiplicityConstraint="true",
-                                   DefaultShowOwnedAssociationEndAsAttribute="true",
-                                   DefaultShowOwner="false",
-                                   DefaultShowOwnerSkipModelInFullyQualifiedOwnerSignature="true",
-                                   DefaultShowReceptionOption="\\u0001",
-                                   DefaultShowTemplateParameter="true",
-                                   DefaultShowTypeOption="\\u0001",
-                                   DefaultShowUniqueMultiplicityConstraint="true",
-                                   DefaultTypeOfSubProcess="\\u0000",
-                                   DefaultWrapClassMember="false",
-                                   DrawTextAnnotationOpenRectangleFollowConnectorEnd="true",
-                                   EnableMinimumSize="true",
-                                   EntityColumnConstraintsPresentation="\\u0002",
-                                   ErdIndexNumOfDigits="-1",
-                                   ErdIndexPattern="{table_name}",
-                                   ErdIndexPatternSyncAutomatically="true",
-                                   ErdManyToManyJoinTableDelimiter="_",
-                                   EtlTableDiagramFontSize="14",
-                                   ExpandedSubProcessDiagramContent="\\u0001",
-                                   ForeignKeyArrowHeadSize="\\u0002",
-                                   ForeignKeyConnectorEndPointAssociatedColumn="false",
-                                   ForeignKeyNamePattern="{reference_table_name}{reference_column_name}",
-                                   ForeignKeyNamePatternCaseHandling="0",
-                                   ForeignKeyRelationshipPattern="{association_name}",
-                                   FractionalMetrics="true",
-                                   GeneralizationSetNotation="\\u0001",
-                                   GraphicAntiAliasing="true",
-                                   GridDiagramFontSize="14",
-                                   LineJumpSize="\\u0000",
-                                   ModelElementNameAlignment="\\u0004",
-                                   MultipleLineClassName="\\u0001",
-                                   PaintConnectorThroughLabel="false",
-                                   PointConnectorEndToCompartmentMember="true",
-                                   PrimaryKeyConstraintPattern="",
-                                   PrimaryKeyNamePattern="ID",
-                                   RenameConstructorAfterRenameClass="\\u0000",
-                                   RenameExtensionPointToFollowExtendUseCase="\\u0000",
-                                   ShapeAutoFitSize="false",
-                                   ShowActivationsInSequenceDiagram="true",
-                                   ShowActivityStateNodeCaption="524287",
-                                   ShowArtifactOption="\\u0002",
-                                   ShowAssociatedDiagramNameOfInteraction="false",
-                                   ShowAssociationRoleStereotypes="true",
-                                   ShowAttributeGetterSetter="false",
-                                   ShowBSElementCode="true",
-                                   ShowClassEmptyCompartments="false",
-                                   ShowColumnDefaultValue="false",
-                                   ShowColumnNullable="true",
-                                   ShowColumnType="true",
-                                   ShowColumnUniqueConstraintName="false",
-                                   ShowColumnUserType="false",
-                                   ShowComponentOption="\\u0002",
-                                   ShowExtraColumnProperties="true",
-                                   ShowInOutFlowButtonsInDataFlowDiagram="false",
-                                   ShowInOutFlowsInSubLevelDiagram="true",
-                                   ShowMessageOperationSignatureForSequenceAndCommunicationDiagram="true",
-                                   ShowMessageStereotypeInSequenceAndCommunicationDiagram="true",
-                                   ShowNumberInCollaborationDiagram="true",
-                                   ShowNumberInSequenceDiagram="true",
-                                   ShowPackageNameStyle="\\u0000",
-                                   ShowParameterNameInOperationSignature="true",
-                                   ShowRowGridLineWithinCompClassDiagram="false",
-                                   ShowRowGridLineWithinCompERD="true",
-                                   ShowRowGridLineWithinORMDiagram="true",
-                                   ShowSchemaNameInERD="true",
-                                   ShowTransitionTrigger="\\u0000",
-                                   ShowUseCaseExtensionPoint="true",
-                                   ShowUseCaseID="false",
-                                   SnapConnectorsAfterZoom="false",
-                                   StateShowParametersOfInternalActivities="false",
-                                   StateShowPrePostConditionAndBodyOfInternalActivities="true",
-                                   StopTargetLifelineOnCreateDestroyMessage="\\u0002",
-                                   SupportHtmlTaggedValue="false",
-                                   SupportMultipleLineAttribute="true",
-                                   SuppressImpliedMultiplicityForAttributeAssociationEnd="false",
-                                   SyncAssociationNameWithAssociationClass="\\u0000",
-                                   SyncAssociationRoleNameWithReferencedAttributeName="true",
-                                   SyncDocOfInterfaceToSubClass="\\u0000",
-                                   TextAntiAliasing="true",
-                                   TextualAnalysisGenerateRequirementTextOption="\\u0001",
-                                   TextualAnalysisHighlightOption="\\u0000",
-                                   UnnamedIndexPattern="{table_name}_{column_name}",
-                                   UseStateNameTab="false",
-                                   WireflowDiagramDevice="0",
-                                   WireflowDiagramShowActiveFlowLabel="true",
-                                   WireflowDiagramTheme="0",
-                                   WireflowDiagramWireflowShowPreview="true",
-                                   WireflowDiagramWireflowShowScreenId="true"
-                                   )
+# Static attributes of the ProjectOptions children, identical in every generated project
+DIAGRAM_OPTIONS = {
+    "ActivityDiagramControlFlowDisplayOption": "\\u0000",
+    "ActivityDiagramShowActionCallBehaviorOption": "\\u0000",
+    "ActivityDiagramShowActivityEdgeWeight": "true",
+    "ActivityDiagramShowObjectNodeType": "true",
+    "ActivityDiagramShowPartitionHandle": "\\u0000",
+    "AddDataStoresExtEntitiesToDecomposedDFD": "\\u0002",
+    "AlignColumnProperties": "true",
+    "AllowConfigShowInOutFlowButtonsInDataFlowDiagram": "false",
+    "AutoGenerateRoleName": "false",
+    "AutoSetAttributeType": "true",
+    "AutoSetColumnType": "true",
+    "AutoSyncRoleName": "true",
+    "BpdAutoStretchPools": "true",
+    "BpdConnectGatewayWithFlowObjectInDifferentPool": "\\u0000",
+    "BpdDefaultConnectionPointStyle": "\\u0001",
+    "BpdDefaultConnectorStyle": "\\u0005",
+    "BpdDhowIdOption": "\\u0000",
+    "BpdShowActivitiesTypeIcon": "true",
+    "BusinessProcessDiagramDefaultLanguage": "English",
+    "ClassVisibilityStyle": "\\u0001",
+    "ConnectorLabelOrientation": "\\u0000",
+    "CreateOneMessagePerDirection": "true",
+    "DecisionMergeNodeConnectionPointStyle": "\\u0000",
+    "DefaultAssociationEndNavigable": "\\u0001",
+    "DefaultAssociationEndVisibility": "\\u0000",
+    "DefaultAssociationShowFromMultiplicity": "true",
+    "DefaultAssociationShowFromRoleName": "true",
+    "DefaultAssociationShowFromRoleVisibility": "true",
+    "DefaultAssociationShowStereotypes": "true",
+    "DefaultAssociationShowToMultiplicity": "true",
+    "DefaultAssociationShowToRoleName": "true",
+    "DefaultAssociationShowToRoleVisibility": "true",
+    "DefaultAttributeMultiplicity": "false",
+    "DefaultAttributeType": "",
+    "DefaultAttributeVisibility": "\\u0001",
+    "DefaultClassAttributeMultiplicity": "",
+    "DefaultClassAttributeMultiplicityOrdered": "false",
+    "DefaultClassAttributeMultiplicityUnique": "true",
+    "DefaultClassInterfaceBall": "false",
+    "DefaultClassVisibility": "\\u0004",
+    "DefaultColumnType": "integer(10)",
+    "DefaultConnectionPointStyle": "\\u0000",
+    "DefaultConnectorStyle": "\\u0001",
+    "DefaultDiagramBackground": "rgb(255, 255, 255)",
+    "DefaultDisplayAsRobustnessAnalysisIcon": "true",
+    "DefaultDisplayAsRobustnessAnalysisIconInSequenceDiagram": "true",
+    "DefaultDisplayAsStereotypeIcon": "false",
+    "DefaultFontColor": "rgb(0, 0, 0)",
+    "DefaultGenDiagramTypeFromScenario": "\\u0000",
+    "DefaultHtmlDocFontColor": "rgb(0, 0, 0)",
+    "DefaultLineJumps": "\\u0000",
+    "DefaultOperationVisibility": "\\u0004",
+    "DefaultParameterDirection": "\\u0002",
+    "DefaultShowAttributeInitialValue": "true",
+    "DefaultShowAttributeOption": "\\u0001",
+    "DefaultShowClassMemberStereotype": "true",
+    "DefaultShowDirection": "false",
+    "DefaultShowMultiplicityConstraints": "false",
+    "DefaultShowOperationOption": "\\u0001",
+    "DefaultShowOperationSignature": "true",
+    "DefaultShowOrderedMultiplicityConstraint": "true",
+    "DefaultShowOwnedAssociationEndAsAttribute": "true",
+    "DefaultShowOwner": "false",
+    "DefaultShowOwnerSkipModelInFullyQualifiedOwnerSignature": "true",
+    "DefaultShowReceptionOption": "\\u0001",
+    "DefaultShowTemplateParameter": "true",
+    "DefaultShowTypeOption": "\\u0001",
+    "DefaultShowUniqueMultiplicityConstraint": "true",
+    "DefaultTypeOfSubProcess": "\\u0000",
+    "DefaultWrapClassMember": "false",
+    "DrawTextAnnotationOpenRectangleFollowConnectorEnd": "true",
+    "EnableMinimumSize": "true",
+    "EntityColumnConstraintsPresentation": "\\u0002",
+    "ErdIndexNumOfDigits": "-1",
+    "ErdIndexPattern": "{table_name}",
+    "ErdIndexPatternSyncAutomatically": "true",
+    "ErdManyToManyJoinTableDelimiter": "_",
+    "EtlTableDiagramFontSize": "14",
+    "ExpandedSubProcessDiagramContent": "\\u0001",
+    "ForeignKeyArrowHeadSize": "\\u0002",
+    "ForeignKeyConnectorEndPointAssociatedColumn": "false",
+    "ForeignKeyNamePattern": "{reference_table_name}{reference_column_name}",
+    "ForeignKeyNamePatternCaseHandling": "0",
+    "ForeignKeyRelationshipPattern": "{association_name}",
+    "FractionalMetrics": "true",
+    "GeneralizationSetNotation": "\\u0001",
+    "GraphicAntiAliasing": "true",
+    "GridDiagramFontSize": "14",
+    "LineJumpSize": "\\u0000",
+    "ModelElementNameAlignment": "\\u0004",
+    "MultipleLineClassName": "\\u0001",
+    "PaintConnectorThroughLabel": "false",
+    "PointConnectorEndToCompartmentMember": "true",
+    "PrimaryKeyConstraintPattern": "",
+    "PrimaryKeyNamePattern": "ID",
+    "RenameConstructorAfterRenameClass": "\\u0000",
+    "RenameExtensionPointToFollowExtendUseCase": "\\u0000",
+    "ShapeAutoFitSize": "false",
+    "ShowActivationsInSequenceDiagram": "true",
+    "ShowActivityStateNodeCaption": "524287",
+    "ShowArtifactOption": "\\u0002",
+    "ShowAssociatedDiagramNameOfInteraction": "false",
+    "ShowAssociationRoleStereotypes": "true",
+    "ShowAttributeGetterSetter": "false",
+    "ShowBSElementCode": "true",
+    "ShowClassEmptyCompartments": "false",
+    "ShowColumnDefaultValue": "false",
+    "ShowColumnNullable": "true",
+    "ShowColumnType": "true",
+    "ShowColumnUniqueConstraintName": "false",
+    "ShowColumnUserType": "false",
+    "ShowComponentOption": "\\u0002",
+    "ShowExtraColumnProperties": "true",
+    "ShowInOutFlowButtonsInDataFlowDiagram": "false",
+    "ShowInOutFlowsInSubLevelDiagram": "true",
+    "ShowMessageOperationSignatureForSequenceAndCommunicationDiagram": "true",
+    "ShowMessageStereotypeInSequenceAndCommunicationDiagram": "true",
+    "ShowNumberInCollaborationDiagram": "true",
+    "ShowNumberInSequenceDiagram": "true",
+    "ShowPackageNameStyle": "\\u0000",
+    "ShowParameterNameInOperationSignature": "true",
+    "ShowRowGridLineWithinCompClassDiagram": "false",
+    "ShowRowGridLineWithinCompERD": "true",
+    "ShowRowGridLineWithinORMDiagram": "true",
+    "ShowSchemaNameInERD": "true",
+    "ShowTransitionTrigger": "\\u0000",
+    "ShowUseCaseExtensionPoint": "true",
+    "ShowUseCaseID": "false",
+    "SnapConnectorsAfterZoom": "false",
+    "StateShowParametersOfInternalActivities": "false",
+    "StateShowPrePostConditionAndBodyOfInternalActivities": "true",
+    "StopTargetLifelineOnCreateDestroyMessage": "\\u0002",
+    "SupportHtmlTaggedValue": "false",
+    "SupportMultipleLineAttribute": "true",
+    "SuppressImpliedMultiplicityForAttributeAssociationEnd": "false",
+    "SyncAssociationNameWithAssociationClass": "\\u0000",
+    "SyncAssociationRoleNameWithReferencedAttributeName": "true",
+    "SyncDocOfInterfaceToSubClass": "\\u0000",
+    "TextAntiAliasing": "true",
+    "TextualAnalysisGenerateRequirementTextOption": "\\u0001",
+    "TextualAnalysisHighlightOption": "\\u0000",
+    "UnnamedIndexPattern": "{table_name}_{column_name}",
+    "UseStateNameTab": "false",
+    "WireflowDiagramDevice": "0",
+    "WireflowDiagramShowActiveFlowLabel": "true",
+    "WireflowDiagramTheme": "0",
+    "WireflowDiagramWireflowShowPreview": "true",
+    "WireflowDiagramWireflowShowScreenId": "true"
+}
+GENERAL_OPTIONS = {
+    "ConfirmSubLevelIdWithDot": "true",
+    "QuickAddGlossaryTermParentModelId": "default"
+}
+INSTANT_REVERSE_OPTIONS = {
+    "CalculateGeneralizationAndRealization": "false",
+    "CreateShapeForParentModelOfDraggedClassPackage": "false",
+    "ReverseGetterSetter": "\\u0000",
+    "ReverseOperationImplementation": "false",
+    "ShowPackageForNewDiagram": "\\u0001",
+    "ShowPackageOwner": "\\u0000"
+}
+MODEL_QUALITY_OPTIONS = {
+    "EnableModelQualityChecking": "false"
+}
+ORM_OPTIONS = {
+    "DecimalPrecision": "19",
+    "DecimalScale": "0",
+    "ExportCommentToDatabase": "true",
+    "FormattedSQL": "false",
+    "GenerateAssociationWithAttribute": "false",
+    "GenerateDiagramFromORMWizards": "true",
+    "GetterSetterVisibility": "\\u0000",
+    "IdGeneratorType": "native",
+    "MappingFileColumnOrder": "\\u0000",
+    "NumericToClassType": "\\u0000",
+    "QuoteSQLIdentifier": "\\u0000",
+    "RecreateShapeWhenSync": "false",
+    "SyncToClassDiagramAttributeName": "\\u0001",
+    "SyncToClassDiagramAttributeNamePrefix": "",
+    "SyncToClassDiagramAttributeNameSuffix": "",
+    "SyncToClassDiagramClassName": "\\u0000",
+    "SyncToClassDiagramClassNamePrefix": "",
+    "SyncToClassDiagramClassNameSuffix": "",
+    "SyncToERDColumnName": "\\u0000",
+    "SyncToERDColumnNamePrefix": "",
+    "SyncToERDColumnNameSuffix": "",
+    "SyncToERDTableName": "\\u0004",
+    "SyncToERDTableNamePrefix": "",
+    "SyncToERDTableNameSuffix": "",
+    "SynchronizeDefaultValueToColumn": "false",
+    "SynchronizeName": "\\u0002",
+    "TablePerSubclassFKMapping": "\\u0000",
+    "UpperCaseSQL": "true",
+    "UseDefaultDecimal": "true",
+    "WrappingServletRequest": "\\u0001"
+}
+REQUIREMENT_DIAGRAM_OPTIONS = {
+    "DefaultWrapMember": "true",
+    "ShowAttributes": "\\u0001",
+    "SupportHTMLAttribute": "false"
+}
+STATE_CODE_ENGINE_OPTIONS = {
+    "AutoCreateInitialStateInStateDiagram": "true",
+    "AutoCreateTransitionMethods": "true",
+    "DefaultInitialStateLocationX": "-1",
+    "DefaultInitialStateLocationY": "-1",
+    "GenerateDebugMessage": "false",
+    "GenerateSample": "true",
+    "GenerateTryCatch": "true",
+    "Language": "\\u0000",
+    "RegenerateTransitionMethods": "false",
+    "SyncTransitionMethods": "true"
+}
+WARNING_OPTIONS = {
+    "CreateORMClassInDefaultPackage": "true"
+}
+PO_USER_ID_FORMATS = (
+    {
+        "Digits": "2",
+        "Guid": "false",
+        "Id": "RBeZzEmGAqAC8QlN",
+        "LastNumericValue": "0",
+        "ModelType": "BPMNElement",
+        "Prefix": "BP",
+        "Suffix": ""
+    },
+    {
+        "Digits": "2",
+        "Guid": "false",
+        "Id": "RBeZzEmGAqAC8QlO",
+        "LastNumericValue": "0",
+        "ModelType": "Actor",
+        "Prefix": "AC",
+        "Suffix": ""
+    },
+    {
+        "Digits": "3",
+        "Guid": "false",
+        "Id": "RBeZzEmGAqAC8QlQ",
+        "LastNumericValue": "0",
+        "ModelType": "Requirement",
+        "Prefix": "REQ",
+        "Suffix": ""
+    },
+    {
+        "Digits": "3",
+        "Guid": "false",
+        "Id": "RBeZzEmGAqAC8QlR",
+        "LastNumericValue": "0",
+        "ModelType": "BusinessRule",
+        "Prefix": "BR",
+        "Suffix": ""
+    },
+    {
+        "Digits": "-1",
+        "Guid": "false",
+        "Id": "RBeZzEmGAqAC8QlS",
+        "LastNumericValue": "0",
+        "ModelType": "BusinessProcessDiagram",
+        "Prefix": "",
+        "Suffix": ""
+    }
+)
+
+def buildProjectOptions():
+    """
+    Build the static ProjectOptions element shared by every generated project.
+
+    Returns:
+        ET.Element: The ProjectOptions element with all its children.
+    """
+    projectOptions = ET.Element("ProjectOptions")
+    ET.SubElement(projectOptions, "DiagramOptions", DIAGRAM_OPTIONS)
 
     # Add additional sub-elements such as GeneralOptions, InstantReverseOptions, etc.
-    ET.SubElement(projectOptions, "GeneralOptions", ConfirmSubLevelIdWithDot="true",
-                  QuickAddGlossaryTermParentModelId="default")
-    ET.SubElement(projectOptions, "InstantReverseOptions", CalculateGeneralizationAndRealization="false",
-                  CreateShapeForParentModelOfDraggedClassPackage="false", ReverseGetterSetter="\\u0000",
-                  ReverseOperationImplementation="false", ShowPackageForNewDiagram="\\u0001",
-                  ShowPackageOwner="\\u0000")
-    ET.SubElement(projectOptions, "ModelQualityOptions", EnableModelQualityChecking="false")
-    ormOptions = ET.SubElement(projectOptions, "ORMOptions",
-                               DecimalPrecision="19",
-                               DecimalScale="0",
-                               ExportCommentToDatabase="true",
-                               FormattedSQL="false",
-                               GenerateAssociationWithAttribute="false",
-                               GenerateDiagramFromORMWizards="true",
-                               GetterSetterVisibility="\\u0000",
-                               IdGeneratorType="native",
-                               MappingFileColumnOrder="\\u0000",
-                               NumericToClassType="\\u0000",
-                               QuoteSQLIdentifier="\\u0000",
-                               RecreateShapeWhenSync="false",
-                               SyncToClassDiagramAttributeName="\\u0001",
-                               SyncToClassDiagramAttributeNamePrefix="",
-                               SyncToClassDiagramAttributeNameSuffix="",
-                               SyncToClassDiagramClassName="\\u0000",
-                               SyncToClassDiagramClassNamePrefix="",
-                               SyncToClassDiagramClassNameSuffix="",
-                               SyncToERDColumnName="\\u0000",
-                               SyncToERDColumnNamePrefix="",
-                               SyncToERDColumnNameSuffix="",
-                               SyncToERDTableName="\\u0004",
-                               SyncToERDTableNamePrefix="",
-                               SyncToERDTableNameSuffix="",
-                               SynchronizeDefaultValueToColumn="false",
-                               SynchronizeName="\\u0002",
-                               TablePerSubclassFKMapping="\\u0000",
-                               UpperCaseSQL="true",
-                               UseDefaultDecimal="true",
-                               WrappingServletRequest="\\u0001")
-
-    # Add requirementDiagramOptions in camelCase
-    requirementDiagramOptions = ET.SubElement(projectOptions, "RequirementDiagramOptions",
-                                              DefaultWrapMember="true",
-                                              ShowAttributes="\\u0001",
-                                              SupportHTMLAttribute="false")
-
-    # Add stateCodeEngineOptions in camelCase
-    stateCodeEngineOptions = ET.SubElement(projectOptions, "StateCodeEngineOptions",
-                                           AutoCreateInitialStateInStateDiagram="true",
-                                           AutoCreateTransitionMethods="true",
-                                           DefaultInitialStateLocationX="-1",
-                                           DefaultInitialStateLocationY="-1",
-                                           GenerateDebugMessage="false",
-                                           GenerateSample="true",
-                                           GenerateTryCatch="true",
-                                           Language="\\u0000",
-                                           RegenerateTransitionMethods="false",
-                                           SyncTransitionMethods="true")
-
-    # Add warningOptions in camelCase
-    warningOptions = ET.SubElement(projectOptions, "WarningOptions", CreateORMClassInDefaultPackage="true")
+    ET.SubElement(projectOptions, "GeneralOptions", GENERAL_OPTIONS)
+    ET.SubElement(projectOptions, "InstantReverseOptions", INSTANT_REVERSE_OPTIONS)
+    ET.SubElement(projectOptions, "ModelQualityOptions", MODEL_QUALITY_OPTIONS)
+    ET.SubElement(projectOptions, "ORMOptions", ORM_OPTIONS)
+    ET.SubElement(projectOptions, "RequirementDiagramOptions", REQUIREMENT_DIAGRAM_OPTIONS)
+    ET.SubElement(projectOptions, "StateCodeEngineOptions", STATE_CODE_ENGINE_OPTIONS)
+    ET.SubElement(projectOptions, "WarningOptions", WARNING_OPTIONS)
 
     # Add poRepository and its children in camelCase
     poRepository = ET.SubElement(projectOptions, "PORepository")
     poUserIdFormats = ET.SubElement(poRepository, "POUserIDFormats")
+    for poUserIdFormat in PO_USER_ID_FORMATS:
+        ET.SubElement(poUserIdFormats, "POUserIDFormat", poUserIdFormat)
+    return projectOptions
+# The ProjectOptions subtree never changes, so it is built once and copied into each project
+PROJECT_OPTIONS_ELEMENT = buildProjectOptions()
+def addStaticProjectOptions(projectInfo):
+    projectInfo.append(copy.deepcopy(PROJECT_OPTIONS_ELEMENT))
+def buildStaticDataTypeAttributes():
+    """
+    Build the attributes of the primitive data types shared by every generated project.
+    PmAuthor and the timestamps are left empty, to be set for each project.
+
+    Returns:
+        tuple: One attribute dictionary per data type, in STATIC_DATA_TYPES order.
+    """
+    return tuple({"BacklogActivityId": "0", "Documentation_plain": "", "Id": dataTypeId, "Name": dataTypeName,
+                  "PmAuthor": "", "PmCreateDateTime": "", "PmLastModified": "", "QualityReason_IsNull": "true",
+                  "QualityScore": "-1", "UserIDLastNumericValue": "0", "UserID_IsNull": "true"}
+                 for dataTypeId, dataTypeName in STATIC_DATA_TYPES)
+# The data type attributes only differ by author and timestamps, so they are built once and copied into each project
+STATIC_DATA_TYPE_ATTRIBUTES = buildStaticDataTypeAttributes()
+def addStaticDataType(models, projectAuthor, timestamp):
+    for dataTypeAttributes in STATIC_DATA_TYPE_ATTRIBUTES:
+        # Updating the existing keys keeps the attribute order of the template
+        ET.SubElement(models, "DataType", dict(dataTypeAttributes, PmAuthor=projectAuthor, PmCreateDateTime=timestamp,
+                                               PmLastModified=timestamp))
+def assignMaskedColumn(dataFrame, mask, column, values):
+    """
+    Assign values to the rows of a DataFrame column selected by a mask, in row order.
+    A missing column is created, empty in the other rows.
 
-    # Add poUserIdFormats child elements in camelCase
-    ET.SubElement(poUserIdFormats, "POUserIDFormat",
-                  Digits="2",
-                  Guid="false",
-                  Id="RBeZzEmGAqAC8QlN",
-                  LastNumericValue="0",
-                  ModelType="BPMNElement",
-                  Prefix="BP",
-                  Suffix="")
-
-    ET.SubElement(poUserIdFormats, "POUserIDFormat",
-                  Digits="2",
-                  Guid="false",
-                  Id="RBeZzEmGAqAC8QlO",
-                  LastNumericValue="0",
-                  ModelType="Actor",
-                  Prefix="AC",
-                  Suffix="")
-
-    ET.SubElement(poUserIdFormats, "POUserIDFormat",
-                  Digits="3",
-                  Guid="false",
-                  Id="RBeZzEmGAqAC8QlQ",
-                  LastNumericValue="0",
-                  ModelType="Requirement",
-                  Prefix="REQ",
-                  Suffix="")
-
-    ET.SubElement(poUserIdFormats, "POUserIDFormat",
-                  Digits="3",
-                  Guid="false",
-                  Id="RBeZzEmGAqAC8QlR",
-                  LastNumericValue="0",
-                  ModelType="BusinessRule",
-                  Prefix="BR",
-                  Suffix="")
-
-    ET.SubElement(poUserIdFormats, "POUserIDFormat",
-                  Digits="-1",
-                  Guid="false",
-                  Id="RBeZzEmGAqAC8QlS",
-                  LastNumericValue="0",
-                  ModelType="BusinessProcessDiagram",
-                  Prefix="",
-                  Suffix="")
-def addStaticDataType(models, projectAuthor):
-    data_types = [
-        {"BacklogActivityId": "0", "Documentation_plain": "", "Id": "k2eZzEmGAqAC8QXD", "Name": "boolean",
-         "PmAuthor": projectAuthor, "PmCreateDateTime": generateTimestamp(),
-         "PmLastModified": generateTimestamp(), "QualityReason_IsNull": "true",
-         "QualityScore": "-1", "UserIDLastNumericValue": "0", "UserID_IsNull": "true"},
-
-        {"BacklogActivityId": "0", "Documentation_plain": "", "Id": "G2eZzEmGAqAC8QXE", "Name": "byte",
-         "PmAuthor": projectAuthor, "PmCreateDateTime": generateTimestamp(),
-         "PmLastModified": generateTimestamp(), "QualityReason_IsNull": "true",
-         "QualityScore": "-1", "UserIDLastNumericValue": "0", "UserID_IsNull": "true"},
-
-        {"BacklogActivityId": "0", "Documentation_plain": "", "Id": "G2eZzEmGAqAC8QXF", "Name": "char",
-         "PmAuthor": projectAuthor, "PmCreateDateTime": generateTimestamp(),
-         "PmLastModified": generateTimestamp(), "QualityReason_IsNull": "true",
-         "QualityScore": "-1", "UserIDLastNumericValue": "0", "UserID_IsNull": "true"},
-
-        {"BacklogActivityId": "0", "Documentation_plain": "", "Id": "G2eZzEmGAqAC8QXG", "Name": "double",
-         "PmAuthor": projectAuthor, "PmCreateDateTime": generateTimestamp(),
-         "PmLastModified": generateTimestamp(), "QualityReason_IsNull": "true",
-         "QualityScore": "-1", "UserIDLastNumericValue": "0", "UserID_IsNull": "true"},
-
-        {"BacklogActivityId": "0", "Documentation_plain": "", "Id": "G2eZzEmGAqAC8QXH", "Name": "float",
-         "PmAuthor": projectAuthor, "PmCreateDateTime": generateTimestamp(),
-         "PmLastModified": generateTimestamp(), "QualityReason_IsNull": "true",
-         "QualityScore": "-1", "UserIDLastNumericValue": "0", "UserID_IsNull": "true"},
-
-        {"BacklogActivityId": "0", "Documentation_plain": "", "Id": "G2eZzEmGAqAC8QXI", "Name": "int",
-         "PmAuthor": projectAuthor, "PmCreateDateTime": generateTimestamp(),
-         "PmLastModified": generateTimestamp(), "QualityReason_IsNull": "true",
-         "QualityScore": "-1", "UserIDLastNumericValue": "0", "UserID_IsNull": "true"},
-
-        {"BacklogActivityId": "0", "Documentation_plain": "", "Id": "G2eZzEmGAqAC8QXJ", "Name": "long",
-         "PmAuthor": projectAuthor, "PmCreateDateTime": generateTimestamp(),
-         "PmLastModified": generateTimestamp(), "QualityReason_IsNull": "true",
-         "QualityScore": "-1", "UserIDLastNumericValue": "0", "UserID_IsNull": "true"},
-
-        {"BacklogActivityId": "0", "Documentation_plain": "", "Id": "G2eZzEmGAqAC8QXK", "Name": "short",
-         "PmAuthor": projectAuthor, "PmCreateDateTime": generateTimestamp(),
-         "PmLastModified": generateTimestamp(), "QualityReason_IsNull": "true",
-         "QualityScore": "-1", "UserIDLastNumericValue": "0", "UserID_IsNull": "true"},
-
-        {"BacklogActivityId": "0", "Documentation_plain": "", "Id": "G2eZzEmGAqAC8QXL", "Name": "void",
-         "PmAuthor": projectAuthor, "PmCreateDateTime": generateTimestamp(),
-         "PmLastModified": generateTimestamp(), "QualityReason_IsNull": "true",
-         "QualityScore": "-1", "UserIDLastNumericValue": "0", "UserID_IsNull": "true"},
-
-        {"BacklogActivityId": "0", "Documentation_plain": "", "Id": "G2eZzEmGAqAC8QXM", "Name": "string",
-         "PmAuthor": projectAuthor, "PmCreateDateTime": generateTimestamp(),
-         "PmLastModified": generateTimestamp(), "QualityReason_IsNull": "true",
-         "QualityScore": "-1", "UserIDLastNumericValue": "0", "UserID_IsNull": "true"}
-    ]
-    for data in data_types:
-        ET.SubElement(models, "DataType", **data)
-def addUsageStereotype(projectAuthor, models, existingIDs, idLength):
+    Args:
+        dataFrame: DataFrame to update in place.
+        mask: Boolean Series selecting the rows to assign.
+        column: Name of the column to assign.
+        values: List of values, one per selected row.
+    """
+    # Assign an indexed Series, so a new column gets NaN and not a coerced string in the unselected rows
+    dataFrame.loc[mask, column] = pd.Series(values, index=dataFrame.index[mask])
+def addUsageStereotype(projectAuthor, models, existingIDs, idLength, timestamp):
     usageStereotypeIdRef = generateId(existingIDs, idLength)
     existingIDs.add(usageStereotypeIdRef)
     ET.SubElement(models, 'Stereotype', {
@@ -626,8 +627,8 @@ def addUsageStereotype(projectAuthor, models, existingIDs, idLength):
         'Leaf': 'false',
         'Name': 'use',
         'PmAuthor': projectAuthor,
-        'PmCreateDateTime': generateTimestamp(),
-        'PmLastModified': generateTimestamp(),
+        'PmCreateDateTime': timestamp,
+        'PmLastModified': timestamp,
         'QualityReason_IsNull': 'true',
         'QualityScore': '-1',
         'Root': 'false',
@@ -635,7 +636,7 @@ def addUsageStereotype(projectAuthor, models, existingIDs, idLength):
         'UserID_IsNull': 'true'
     })
     return usageStereotypeIdRef
-def addUsageRelation(projectAuthor, modelChildrenMCC, fromID, toID, usageShapeID, usageMasterIdRef,usageStereotypeIdRef):
+def addUsageRelation(projectAuthor, modelChildrenMCC, fromID, toID, usageShapeID, usageMasterIdRef,usageStereotypeIdRef, timestamp):
     """
     Function to add a usage relation with sub-elements: Stereotypes and MasterView.
 
@@ -647,6 +648,7 @@ def addUsageRelation(projectAuthor, modelChildrenMCC, fromID, toID, usageShapeID
         usageShapeID: The unique ID for the 'Usage' element.
         usageMasterIdRef: The MasterView reference ID.
         usageStereotypeIdRef: The Stereotype reference ID.
+        timestamp: Creation and last modified timestamp of the elements.
     """
     # Create the Usage element with the necessary attributes
     usage = ET.SubElement(modelChildrenMCC, 'Usage', {
@@ -655,8 +657,8 @@ def addUsageRelation(projectAuthor, modelChildrenMCC, fromID, toID, usageShapeID
         'From': fromID,
         'Id': usageShapeID,
         'PmAuthor': projectAuthor,
-        'PmCreateDateTime': generateTimestamp(),  # Generate creation timestamp
-        'PmLastModified': generateTimestamp(),  # Generate last modified timestamp
+        'PmCreateDateTime': timestamp,  # Creation timestamp
+        'PmLastModified': timestamp,  # Last modified timestamp
         'QualityReason_IsNull': 'true',
         'QualityScore': '-1',
         'To': toID,
@@ -679,7 +681,7 @@ def addUsageRelation(projectAuthor, modelChildrenMCC, fromID, toID, usageShapeID
     })
 
     return modelChildrenMCC
-def addUsageRelationContainer(projectAuthor, modelChildren, pimRelations, pimClasses, usageStereotypeIdRef, existingIDs, idLength):
+def addUsageRelationContainer(projectAuthor, modelChildren, pimRelations, pimClasses, usageStereotypeIdRef, existingIDs, idLength, timestamp):
     """
     Function to add a container of Usage relations based on the pimRelations DataFrame.
 
@@ -688,59 +690,58 @@ def addUsageRelationContainer(projectAuthor, modelChildren, pimRelations, pimCla
         modelChildren: Parent XML element under which the Usage elements will be added.
         pimRelations: DataFrame containing the relationship data.
         pimClasses: DataFrame or list containing the class information.
+        timestamp: Creation and last modified timestamp of the elements.
     """
 
-    # Variable to track if the ModelRelationshipContainer has been created
-    modelChildrenContainer = None
-    modelChildrenMCC = None
-
-    # Iterate through each row in the pimRelations DataFrame
-    for index, row in pimRelations.iterrows():
-        relationType = row["Relationship Type"]
-
-        if relationType == 'Usage':  # Check if the relation is of type 'Usage'
-
-            # Create the ModelRelationshipContainer only once, before adding any Usage relations
-            if modelChildrenContainer is None:
-                # Generate the container ID
-                IDContainer = generateId(existingIDs, idLength)
-                # Add the ModelRelationshipContainer to the modelChildren
-                modelChildrenContainer = ET.SubElement(modelChildren, 'ModelRelationshipContainer',
-                                                       BacklogActivityId="0",
-                                                       Documentation_plain="",
-                                                       Id=IDContainer,
-                                                       Name="Usage",
-                                                       PmAuthor=projectAuthor,
-                                                       PmCreateDateTime=generateTimestamp(),
-                                                       PmLastModified=generateTimestamp(),
-                                                       QualityReason_IsNull="true",
-                                                       QualityScore="-1",
-                                                       UserIDLastNumericValue="0",
-                                                       UserID_IsNull="true")
-                modelChildrenMCC = ET.SubElement(modelChildrenContainer, 'ModelChildren')
-
-            fromClassID = row["From Class ID"]
-            toClassID = row["To Class ID"]
-
-            # Generate a unique Shape ID
-            usageShapeID = generateId(existingIDs, idLength)
-            # Add the new Shape ID to the pimRelations DataFrame
-            pimRelations.at[index, 'ShapeID'] = usageShapeID
-            existingIDs.add(usageShapeID)
-
-            # Generate a unique MasterView reference ID
-            usageMasterIdRef = generateId(existingIDs, idLength)
-            # Add the new Master ID to the pimRelations DataFrame
-            pimRelations.at[index, 'MasterID'] = usageMasterIdRef
-            existingIDs.add(usageMasterIdRef)
-            pimRelations.at[index, 'StereotypeID'] = usageStereotypeIdRef
-
-            # Add the usage relation to the XML
-            modelChildrenMCC = addUsageRelation(projectAuthor, modelChildrenMCC, fromClassID, toClassID, usageShapeID,
-                                                usageMasterIdRef, usageStereotypeIdRef)
+    # Keep only the Usage relations; without any, no container is created
+    mask = pimRelations["Relationship Type"].eq('Usage')
+    if not mask.any():
+        return modelChildren
+
+    # Create the ModelRelationshipContainer holding all the Usage relations
+    # Generate the container ID
+    IDContainer = generateId(existingIDs, idLength)
+    # Add the ModelRelationshipContainer to the modelChildren
+    modelChildrenContainer = ET.SubElement(modelChildren, 'ModelRelationshipContainer',
+                                           BacklogActivityId="0",
+                                           Documentation_plain="",
+                                           Id=IDContainer,
+                                           Name="Usage",
+                                           PmAuthor=projectAuthor,
+                                           PmCreateDateTime=timestamp,
+                                           PmLastModified=timestamp,
+                                           QualityReason_IsNull="true",
+                                           QualityScore="-1",
+                                           UserIDLastNumericValue="0",
+                                           UserID_IsNull="true")
+    modelChildrenMCC = ET.SubElement(modelChildrenContainer, 'ModelChildren')
+
+    # Generate the Shape and MasterView IDs of all the relations in one batch
+    relationIds = iter(generateIds(existingIDs, idLength, 2 * int(mask.sum())))
+    # IDs written back to the pimRelations DataFrame after the loop, one column at a time
+    shapeIds, masterIds = [], []
+    relations = pimRelations.loc[mask, ["From Class ID", "To Class ID"]]
+    # Iterate through each Usage relation in the pimRelations DataFrame
+    for fromClassID, toClassID in zip(relations["From Class ID"].to_numpy(), relations["To Class ID"].to_numpy()):
+        # Take a unique Shape ID from the batch
+        usageShapeID = next(relationIds)
+        shapeIds.append(usageShapeID)
+
+        # Take a unique MasterView reference ID from the batch
+        usageMasterIdRef = next(relationIds)
+        masterIds.append(usageMasterIdRef)
+
+        # Add the usage relation to the XML
+        modelChildrenMCC = addUsageRelation(projectAuthor, modelChildrenMCC, fromClassID, toClassID, usageShapeID,
+                                            usageMasterIdRef, usageStereotypeIdRef, timestamp)
+
+    # Write the new IDs of all the relations back to the pimRelations DataFrame
+    assignMaskedColumn(pimRelations, mask, 'ShapeID', shapeIds)
+    assignMaskedColumn(pimRelations, mask, 'MasterID', masterIds)
+    pimRelations.loc[mask, 'StereotypeID'] = usageStereotypeIdRef
 
     return modelChildren
-def addAssociationRelation(projectAuthor, modelChildrenMCC, fromID, fromName, toID, toName, aggregationKind, fromEndAssociationID, fromEndQualifierID,toEndAssociationID, toEndQualifierID, associationMasterIdRef, associationShapeID):
+def addAssociationRelation(projectAuthor, modelChildrenMCC, fromID, fromName, toID, toName, aggregationKind, fromEndAssociationID, fromEndQualifierID,toEndAssociationID, toEndQualifierID, associationMasterIdRef, associationShapeID, timestamp):
     """
     Function to add an association/aggregation/composition relation with sub-elements: FromEnd, ToEnd, and MasterView.
 
@@ -758,6 +759,7 @@ def addAssociationRelation(projectAuthor, modelChildrenMCC, fromID, fromName, to
         toEndQualifierID: The unique ID for the 'ToEnd' qualifier element.
         associationMasterIdRef: The MasterView reference ID.
         associationShapeID: The unique ID for the 'Association' element.
+        timestamp: Creation and last modified timestamp of the elements.
     """
     # Create the Association element with the necessary attributes
     association = ET.SubElement(modelChildrenMCC, 'Association', {
@@ -772,8 +774,8 @@ def addAssociationRelation(projectAuthor, modelChildrenMCC, fromID, fromName, to
         'Leaf': 'false',
         'OrderingInProfile': '-1',
         'PmAuthor': projectAuthor,
-        'PmCreateDateTime': generateTimestamp(),  # Generate creation timestamp
-        'PmLastModified': generateTimestamp(),  # Generate last modified timestamp
+        'PmCreateDateTime': timestamp,  # Creation timestamp
+        'PmLastModified': timestamp,  # Last modified timestamp
         'QualityReason_IsNull': 'true',
         'QualityScore': '-1',
         'UserIDLastNumericValue': '0',
@@ -798,7 +800,7 @@ def addAssociationRelation(projectAuthor, modelChildrenMCC, fromID, fromName, to
         'Multiplicity': 'Unspecified',
         'Navigable': 'Navigable',
         'PmAuthor': projectAuthor,
-        'PmCreateDateTime': generateTimestamp(),
+        'PmCreateDateTime': timestamp,
         'PmLastModified_IsNull': 'true',
         'ProvidePropertyGetterMethod': 'false',
         'ProvidePropertySetterMethod': 'false',
@@ -818,7 +820,7 @@ def addAssociationRelation(projectAuthor, modelChildrenMCC, fromID, fromName, to
         'Id': fromEndQualifierID,
         'Name': '',
         'PmAuthor': projectAuthor,
-        'PmCreateDateTime': generateTimestamp(),
+        'PmCreateDateTime': timestamp,
         'PmLastModified_IsNull': 'true',
         'QualityReason_IsNull': 'true',
         'QualityScore': '-1',
@@ -850,7 +852,7 @@ def addAssociationRelation(projectAuthor, modelChildrenMCC, fromID, fromName, to
         'Multiplicity': 'Unspecified',
         'Navigable': 'Navigable',
         'PmAuthor': projectAuthor,
-        'PmCreateDateTime': generateTimestamp(),
+        'PmCreateDateTime': timestamp,
         'PmLastModified_IsNull': 'true',
         'ProvidePropertyGetterMethod': 'false',
         'ProvidePropertySetterMethod': 'false',
@@ -871,7 +873,7 @@ def addAssociationRelation(projectAuthor, modelChildrenMCC, fromID, fromName, to
         'Id': toEndQualifierID,
         'Name': '',
         'PmAuthor': projectAuthor,
-        'PmCreateDateTime': generateTimestamp(),
+        'PmCreateDateTime': timestamp,
         'PmLastModified_IsNull': 'true',
         'QualityReason_IsNull': 'true',
         'QualityScore': '-1',
@@ -893,7 +895,7 @@ def addAssociationRelation(projectAuthor, modelChildrenMCC, fromID, fromName, to
     })
 
     return modelChildrenMCC
-def addAssociationRelationContainer(projectAuthor, modelChildren, pimRelations, pimClasses, existingIDs, idLength):
+def addAssociationRelationContainer(projectAuthor, modelChildren, pimRelations, pimClasses, existingIDs, idLength, timestamp):
     """
     Function to add a container of Association/Aggregation/Composition relations based on the pimRelations DataFrame.
 
@@ -902,90 +904,80 @@ def addAssociationRelationContainer(projectAuthor, modelChildren, pimRelations,
         modelChildren: Parent XML element under which the Association elements will be added.
         pimRelations: DataFrame containing the relationship data.
         pimClasses: DataFrame or list containing the class information.
+        timestamp: Creation and last modified timestamp of the elements.
     """
 
-    # Variable to track if the ModelRelationshipContainer has been created
-    modelChildrenContainer = None
-    modelChildrenMCC = None
-    # Iterate through each row in the pimRelations DataFrame
-    for index, row in pimRelations.iterrows():
-        relationType = row["Relationship Type"]
-
-        # Check for association, aggregation (shared), or composition (composite)
-        if relationType in ['Association', 'Aggregation', 'Composition']:
-
-            # Create the ModelRelationshipContainer only once, before adding any association relations
-            if modelChildrenContainer is None:
-                # Generate the container ID
-                IDContainer = generateId(existingIDs, idLength)
-                # Add the ModelRelationshipContainer to the modelChildren
-                modelChildrenContainer = ET.SubElement(modelChildren, 'ModelRelationshipContainer',
-                                                       BacklogActivityId="0",
-                                                       Documentation_plain="",
-                                                       Id=IDContainer,
-                                                       Name="Association",
-                                                       PmAuthor=projectAuthor,
-                                                       PmCreateDateTime=generateTimestamp(),
-                                                       PmLastModified=generateTimestamp(),
-                                                       QualityReason_IsNull="true",
-                                                       QualityScore="-1",
-                                                       UserIDLastNumericValue="0",
-                                                       UserID_IsNull="true")
-                modelChildrenMCC = ET.SubElement(modelChildrenContainer, 'ModelChildren')
-
-            fromClassID = row["From Class ID"]
-            toClassID = row["To Class ID"]
-            fromClassName = row["From Class Name"]
-            toClassName = row["To Class Name"]
-
-            # Generate a unique Shape ID
-            associationShapeID = generateId(existingIDs, idLength)
-            # Add the new Shape ID to the pimRelations DataFrame
-            pimRelations.at[index, 'ShapeID'] = associationShapeID
-            existingIDs.add(associationShapeID)
-
-            # Generate a unique MasterView reference ID
-            associationMasterIdRef = generateId(existingIDs, idLength)
-            # Add the new Master ID to the pimRelations DataFrame
-            pimRelations.at[index, 'MasterID'] = associationMasterIdRef
-            existingIDs.add(associationMasterIdRef)
-
-            # Generate IDs for Association ends and Qualifiers
-            fromEndAssociationID = generateId(existingIDs, idLength)
-            existingIDs.add(fromEndAssociationID)
-            toEndAssociationID = generateId(existingIDs, idLength)
-            existingIDs.add(toEndAssociationID)
-            fromEndQualifierID = generateId(existingIDs, idLength)
-            existingIDs.add(fromEndQualifierID)
-            toEndQualifierID = generateId(existingIDs, idLength)
-            existingIDs.add(toEndQualifierID)
-
-            # Determine the type of aggregation for the AssociationEnd (Shared, Composite, None)
-            aggregationKind = 'None'
-            if relationType == 'Aggregation':
-                aggregationKind = 'Shared'
-            elif relationType == 'Composition':
-                aggregationKind = 'Composite'
-
-            # Add the association relation to the XML
-            modelChildrenMCC = addAssociationRelation(
-                projectAuthor,
-                modelChildrenMCC,
-                fromClassID,
-                fromClassName,
-                toClassID,
-                toClassName,
-                aggregationKind,
-                fromEndAssociationID,
-                fromEndQualifierID,
-                toEndAssociationID,
-                toEndQualifierID,
-                associationMasterIdRef,
-                associationShapeID
-            )
+    # Keep only the Association, Aggregation and Composition relations; without any, no container is created
+    mask = pimRelations["Relationship Type"].isin(['Association', 'Aggregation', 'Composition'])
+    if not mask.any():
+        return modelChildren
+
+    # Create the ModelRelationshipContainer holding all the association relations
+    # Generate the container ID
+    IDContainer = generateId(existingIDs, idLength)
+    # Add the ModelRelationshipContainer to the modelChildren
+    modelChildrenContainer = ET.SubElement(modelChildren, 'ModelRelationshipContainer',
+                                           BacklogActivityId="0",
+                                           Documentation_plain="",
+                                           Id=IDContainer,
+                                           Name="Association",
+                                           PmAuthor=projectAuthor,
+                                           PmCreateDateTime=timestamp,
+                                           PmLastModified=timestamp,
+                                           QualityReason_IsNull="true",
+                                           QualityScore="-1",
+                                           UserIDLastNumericValue="0",
+                                           UserID_IsNull="true")
+    modelChildrenMCC = ET.SubElement(modelChildrenContainer, 'ModelChildren')
+
+    # Generate the Shape, MasterView, end and qualifier IDs of all the relations in one batch
+    relationIds = iter(generateIds(existingIDs, idLength, 6 * int(mask.sum())))
+    # IDs written back to the pimRelations DataFrame after the loop, one column at a time
+    shapeIds, masterIds = [], []
+    relations = pimRelations.loc[mask, list(RELATIONSHIP_COLUMNS)]
+    # Determine the type of aggregation for the AssociationEnd (Shared, Composite, None) of all the relations at once
+    aggregationKinds = relations["Relationship Type"].map(AGGREGATION_KIND_BY_RELATIONSHIP_TYPE).to_numpy()
+    # Iterate through each Association, Aggregation and Composition relation in the pimRelations DataFrame
+    for aggregationKind, fromClassID, fromClassName, toClassID, toClassName in zip(
+            aggregationKinds, *(relations[column].to_numpy() for column in RELATIONSHIP_COLUMNS[1:])):
+        # Take a unique Shape ID from the batch
+        associationShapeID = next(relationIds)
+        shapeIds.append(associationShapeID)
+
+        # Take a unique MasterView reference ID from the batch
+        associationMasterIdRef = next(relationIds)
+        masterIds.append(associationMasterIdRef)
+
+        # Take the IDs for Association ends and Qualifiers
+        fromEndAssociationID = next(relationIds)
+        toEndAssociationID = next(relationIds)
+        fromEndQualifierID = next(relationIds)
+        toEndQualifierID = next(relationIds)
+
+        # Add the association relation to the XML
+        modelChildrenMCC = addAssociationRelation(
+            projectAuthor,
+            modelChildrenMCC,
+            fromClassID,
+            fromClassName,
+            toClassID,
+            toClassName,
+            aggregationKind,
+            fromEndAssociationID,
+            fromEndQualifierID,
+            toEndAssociationID,
+            toEndQualifierID,
+            associationMasterIdRef,
+            associationShapeID,
+            timestamp
+        )
+
+    # Write the new IDs of all the relations back to the pimRelations DataFrame
+    assignMaskedColumn(pimRelations, mask, 'ShapeID', shapeIds)
+    assignMaskedColumn(pimRelations, mask, 'MasterID', masterIds)
 
     return modelChildren
-def addGeneralizationRelation(projectAuthor, modelChildrenMCC, fromID, fromName, toID, toName, generalizationShapeID, generalizationMasterIdRef):
+def addGeneralizationRelation(projectAuthor, modelChildrenMCC, fromID, fromName, toID, toName, generalizationShapeID, generalizationMasterIdRef, timestamp):
     """
     Function to add a generalization relation with sub-elements: Generalization and MasterView.
 
@@ -998,6 +990,7 @@ def addGeneralizationRelation(projectAuthor, modelChildrenMCC, fromID, fromName,
         toName: The name of the 'To' class.
         generalizationShapeID: The unique ID for the 'Generalization' element.
         generalizationMasterIdRef: The MasterView reference ID.
+        timestamp: Creation and last modified timestamp of the elements.
     """
     # Create the Generalization element with the necessary attributes
 
@@ -1008,8 +1001,8 @@ def addGeneralizationRelation(projectAuthor, modelChildrenMCC, fromID, fromName,
         'From': fromID,
         'Id': generalizationShapeID,
         'PmAuthor': projectAuthor,
-        'PmCreateDateTime': generateTimestamp(),  # Generate creation timestamp
-        'PmLastModified': generateTimestamp(),  # Generate last modified timestamp
+        'PmCreateDateTime': timestamp,  # Creation timestamp
+        'PmLastModified': timestamp,  # Last modified timestamp
         'QualityReason_IsNull': 'true',
         'QualityScore': '-1',
         'Substitutable': 'false',
@@ -1026,7 +1019,7 @@ def addGeneralizationRelation(projectAuthor, modelChildrenMCC, fromID, fromName,
     })
 
     return modelChildrenMCC
-def addGeneralizationRelationContainer(projectAuthor, modelChildren, pimRelations, pimClasses, existingIDs, idLength):
+def addGeneralizationRelationContainer(projectAuthor, modelChildren, pimRelations, pimClasses, existingIDs, idLength, timestamp):
     """
     Function to add a container of Generalization relations based on the pimRelations DataFrame.
 
@@ -1035,69 +1028,67 @@ def addGeneralizationRelationContainer(projectAuthor, modelChildren, pimRelation
         modelChildren: Parent XML element under which the Generalization elements will be added.
         pimRelations: DataFrame containing the relationship data.
         pimClasses: DataFrame or list containing the class information.
+        timestamp: Creation and last modified timestamp of the elements.
     """
 
-    # Variable to track if the ModelRelationshipContainer has been created
-    modelChildrenContainer = None
-    modelChildrenMCC = None
-
-    # Iterate through each row in the pimRelations DataFrame
-    for index, row in pimRelations.iterrows():
-        relationType = row["Relationship Type"]
-
-        # Check for generalization relations
-        if relationType == 'Generalization':
-
-            # Create the ModelRelationshipContainer only once, before adding any generalization relations
-            if modelChildrenContainer is None:
-                # Generate the container ID
-                IDContainer = generateId(existingIDs, idLength)
-                # Add the ModelRelationshipContainer to the modelChildren
-                modelChildrenContainer = ET.SubElement(modelChildren, 'ModelRelationshipContainer',
-                                                       BacklogActivityId="0",
-                                                       Documentation_plain="",
-                                                       Id=IDContainer,
-                                                       Name="Generalization",
-                                                       PmAuthor=projectAuthor,
-                                                       PmCreateDateTime=generateTimestamp(),
-                                                       PmLastModified=generateTimestamp(),
-                                                       QualityReason_IsNull="true",
-                                                       QualityScore="-1",
-                                                       UserIDLastNumericValue="0",
-                                                       UserID_IsNull="true")
-                modelChildrenMCC = ET.SubElement(modelChildrenContainer, 'ModelChildren')
-
-            fromClassID = row["From Class ID"]
-            toClassID = row["To Class ID"]
-            fromClassName = row["From Class Name"]
-            toClassName = row["To Class Name"]
-
-            # Generate a unique Shape ID for the generalization
-            generalizationShapeID = generateId(existingIDs, idLength)
-            # Add the new Shape ID to the pimRelations DataFrame
-            pimRelations.at[index, 'ShapeID'] = generalizationShapeID
-            existingIDs.add(generalizationShapeID)
-
-            # Generate a unique MasterView reference ID
-            generalizationMasterIdRef = generateId(existingIDs, idLength)
-            # Add the new Master ID to the pimRelations DataFrame
-            pimRelations.at[index, 'MasterID'] = generalizationMasterIdRef
-            existingIDs.add(generalizationMasterIdRef)
-
-            # Add the generalization relation to the XML
-            modelChildrenMCC = addGeneralizationRelation(
-                projectAuthor,
-                modelChildrenMCC,
-                fromClassID,
-                fromClassName,
-                toClassID,
-                toClassName,
-                generalizationShapeID,
-                generalizationMasterIdRef
-            )
+    # Keep only the Generalization relations; without any, no container is created
+    mask = pimRelations["Relationship Type"].eq('Generalization')
+    if not mask.any():
+        return modelChildren
+
+    # Create the ModelRelationshipContainer holding all the generalization relations
+    # Generate the container ID
+    IDContainer = generateId(existingIDs, idLength)
+    # Add the ModelRelationshipContainer to the modelChildren
+    modelChildrenContainer = ET.SubElement(modelChildren, 'ModelRelationshipContainer',
+                                           BacklogActivityId="0",
+                                           Documentation_plain="",
+                                           Id=IDContainer,
+                                           Name="Generalization",
+                                           PmAuthor=projectAuthor,
+                                           PmCreateDateTime=timestamp,
+                                           PmLastModified=timestamp,
+                                           QualityReason_IsNull="true",
+                                           QualityScore="-1",
+                                           UserIDLastNumericValue="0",
+                                           UserID_IsNull="true")
+    modelChildrenMCC = ET.SubElement(modelChildrenContainer, 'ModelChildren')
+
+    # Generate the Shape and MasterView IDs of all the relations in one batch
+    relationIds = iter(generateIds(existingIDs, idLength, 2 * int(mask.sum())))
+    # IDs written back to the pimRelations DataFrame after the loop, one column at a time
+    shapeIds, masterIds = [], []
+    relations = pimRelations.loc[mask, list(RELATIONSHIP_COLUMNS[1:])]
+    # Iterate through each Generalization relation in the pimRelations DataFrame
+    for fromClassID, fromClassName, toClassID, toClassName in zip(
+            *(relations[column].to_numpy() for column in RELATIONSHIP_COLUMNS[1:])):
+        # Take a unique Shape ID for the generalization from the batch
+        generalizationShapeID = next(relationIds)
+        shapeIds.append(generalizationShapeID)
+
+        # Take a unique MasterView reference ID from the batch
+        generalizationMasterIdRef = next(relationIds)
+        masterIds.append(generalizationMasterIdRef)
+
+        # Add the generalization relation to the XML
+        modelChildrenMCC = addGeneralizationRelation(
+            projectAuthor,
+            modelChildrenMCC,
+            fromClassID,
+            fromClassName,
+            toClassID,
+            toClassName,
+            generalizationShapeID,
+            generalizationMasterIdRef,
+            timestamp
+        )
+
+    # Write the new IDs of all the relations back to the pimRelations DataFrame
+    assignMaskedColumn(pimRelations, mask, 'ShapeID', shapeIds)
+    assignMaskedColumn(pimRelations, mask, 'MasterID', masterIds)
 
     return modelChildren
-def addDependencyRelation(projectAuthor, modelChildrenMCC, fromID, toID, dependencyShapeID, dependencyMasterIdRef):
+def addDependencyRelation(projectAuthor, modelChildrenMCC, fromID, toID, dependencyShapeID, dependencyMasterIdRef, timestamp):
     """
     Function to add a dependency relation with sub-elements: Dependency and MasterView.
 
@@ -1108,6 +1099,7 @@ def addDependencyRelation(projectAuthor, modelChildrenMCC, fromID, toID, depende
         toID: The 'To' attribute for the 'Dependency' element.
         dependencyShapeID: The unique ID for the 'Dependency' element.
         dependencyMasterIdRef: The MasterView reference ID.
+        timestamp: Creation and last modified timestamp of the elements.
     """
     # Create the Dependency element with the necessary attributes
     dependency = ET.SubElement(modelChildrenMCC, 'Dependency', {
@@ -1117,8 +1109,8 @@ def addDependencyRelation(projectAuthor, modelChildrenMCC, fromID, toID, depende
         'Id': dependencyShapeID,
         'Name': '&lt;&lt;compliant with&gt;&gt;',
         'PmAuthor': projectAuthor,
-        'PmCreateDateTime': generateTimestamp(),  # Generate creation timestamp
-        'PmLastModified': generateTimestamp(),  # Generate last modified timestamp
+        'PmCreateDateTime': timestamp,  # Creation timestamp
+        'PmLastModified': timestamp,  # Last modified timestamp
         'QualityReason_IsNull': 'true',
         'QualityScore': '-1',
         'To': toID,
@@ -1135,7 +1127,7 @@ def addDependencyRelation(projectAuthor, modelChildrenMCC, fromID, toID, depende
     })
 
     return modelChildrenMCC
-def addDependencyRelationContainer(projectAuthor, modelChildren, pimRelations, pimClasses, existingIDs, idLength):
+def addDependencyRelationContainer(projectAuthor, modelChildren, pimRelations, pimClasses, existingIDs, idLength, timestamp):
     """
     Function to add a container of Dependency (CompliantWith) relations based on the pimRelations DataFrame.
 
@@ -1144,62 +1136,70 @@ def addDependencyRelationContainer(projectAuthor, modelChildren, pimRelations, p
         modelChildren: Parent XML element under which the Dependency elements will be added.
         pimRelations: DataFrame containing the relationship data.
         pimClasses: DataFrame or list containing the class information.
+        timestamp: Creation and last modified timestamp of the elements.
     """
 
-    # Variable to track if the ModelRelationshipContainer has been created
-    modelChildrenContainer = None
-    modelChildrenMCC = None
-
-    # Iterate through each row in the pimRelations DataFrame
-    for index, row in pimRelations.iterrows():
-        relationType = row["Relationship Type"]
-
-        # Check for compliant with relations
-        if relationType == 'CompliantWith':
-
-            # Create the ModelRelationshipContainer only once, before adding any dependency relations
-            if modelChildrenContainer is None:
-                # Generate the container ID
-                IDContainer = generateId(existingIDs, idLength)
-                # Add the ModelRelationshipContainer to the modelChildren
-                modelChildrenContainer = ET.SubElement(modelChildren, 'ModelRelationshipContainer',
-                                                       BacklogActivityId="0",
-                                                       Documentation_plain="",
-                                                       Id=IDContainer,
-                                                       Name="Dependency",
-                                                       PmAuthor=projectAuthor,
-                                                       PmCreateDateTime=generateTimestamp(),
-                                                       PmLastModified=generateTimestamp(),
-                                                       QualityReason_IsNull="true",
-                                                       QualityScore="-1",
-                                                       UserIDLastNumericValue="0",
-                                                       UserID_IsNull="true")
-                modelChildrenMCC = ET.SubElement(modelChildren, 'ModelChildren')
-
-            fromClassID = row["From Class ID"]
-            toClassID = row["To Class ID"]
-
-            # Generate a unique Shape ID for the dependency
-            dependencyShapeID = generateId(existingIDs, idLength)
-            pimRelations.at[index, 'ShapeID'] = dependencyShapeID
-            existingIDs.add(dependencyShapeID)
-
-            dependencyMasterIdRef = generateId(existingIDs, idLength)
-            pimRelations.at[index, 'MasterID'] = dependencyMasterIdRef
-            existingIDs.add(dependencyMasterIdRef)
-
-            # Add the dependency relation to the XML
-            modelChildrenMCC = addDependencyRelation(
-                projectAuthor,
-                modelChildrenMCC,
-                fromClassID,
-                toClassID,
-                dependencyShapeID,
-                dependencyMasterIdRef
-            )
+    # Keep only the CompliantWith relations; without any, no container is created
+    mask = pimRelations["Relationship Type"].eq('CompliantWith')
+    if not mask.any():
+        return modelChildren
+
+    # Create the ModelRelationshipContainer holding all the dependency relations
+    # Generate the container ID
+    IDContainer = generateId(existingIDs, idLength)
+    # Add the ModelRelationshipContainer to the modelChildren
+    modelChildrenContainer = ET.SubElement(modelChildren, 'ModelRelationshipContainer',
+                                           BacklogActivityId="0",
+                                           Documentation_plain="",
+                                           Id=IDContainer,
+                                           Name="Dependency",
+                                           PmAuthor=projectAuthor,
+                                           PmCreateDateTime=timestamp,
+                                           PmLastModified=timestamp,
+                                           QualityReason_IsNull="true",
+                                           QualityScore="-1",
+                                           UserIDLastNumericValue="0",
+                                           UserID_IsNull="true")
+    modelChildrenMCC = ET.SubElement(modelChildrenContainer, 'ModelChildren')
+
+    # Generate the Shape and MasterView IDs of all the relations in one batch
+    relationIds = iter(generateIds(existingIDs, idLength, 2 * int(mask.sum())))
+    # IDs written back to the pimRelations DataFrame after the loop, one column at a time
+    shapeIds, masterIds = [], []
+    relations = pimRelations.loc[mask, ["From Class ID", "To Class ID"]]
+    # Iterate through each CompliantWith relation in the pimRelations DataFrame
+    for fromClassID, toClassID in zip(relations["From Class ID"].to_numpy(), relations["To Class ID"].to_numpy()):
+        # Take a unique Shape ID for the dependency from the batch
+        dependencyShapeID = next(relationIds)
+        shapeIds.append(dependencyShapeID)
+
+        dependencyMasterIdRef = next(relationIds)
+        masterIds.append(dependencyMasterIdRef)
+
+        # Add the dependency relation to the XML
+        modelChildrenMCC = addDependencyRelation(
+            projectAuthor,
+            modelChildrenMCC,
+            fromClassID,
+            toClassID,
+            dependencyShapeID,
+            dependencyMasterIdRef,
+            timestamp
+        )
+
+    # Write the new IDs of all the relations back to the pimRelations DataFrame
+    assignMaskedColumn(pimRelations, mask, 'ShapeID', shapeIds)
+    assignMaskedColumn(pimRelations, mask, 'MasterID', masterIds)
 
     return modelChildren
-def addClassElement(models, projectAuthor, pimClasses, pimRelations, existingIDs, IdLength):
+# Tag and Name of the FromSimpleRelationships sub-element of a class for each relationship type; add more entries if
+# needed for other relationship types
+FROM_SIMPLE_RELATIONSHIP_ELEMENTS = {
+    'Generalization': ('Generalization', ''),
+    'Usage': ('Usage', ''),
+    'CompliantWith': ('Dependency', '&lt;&lt;compliant with&gt;&gt;')
+}
+def addClassElement(models, projectAuthor, pimClasses, pimRelations, existingIDs, IdLength, timestamp):
     """
     Function to add Class elements based on the pimClasses DataFrame.
 
@@ -1208,14 +1208,21 @@ def addClassElement(models, projectAuthor, pimClasses, pimRelations, existingIDs
         projectAuthor: The author of the project.
         pimClasses: DataFrame containing the class information.
         pimRelations: DataFrame containing the relationship data.
+        timestamp: Creation and last modified timestamp of the elements.
     """
-    # Iterate through each class in pimClasses DataFrame
-    for index, row in pimClasses.iterrows():
-        classID = row["Class ID"]
-        className = row["Class Name"]
-        classIdRef = generateId(existingIDs, IdLength)
-        existingIDs.add(classIdRef)
-        pimClasses.at[index, 'ClassIdRef'] = classIdRef
+    # Group the relation positions by the class at each end once, instead of filtering pimRelations for each class
+    fromRelationPositions = pimRelations.groupby('From Class ID', sort=False, observed=True).indices
+    toRelationPositions = pimRelations.groupby('To Class ID', sort=False, observed=True).indices
+    relationTypes = pimRelations["Relationship Type"].to_numpy()
+    # The ShapeID column (assumed stored in pimRelations) is only added by the relation containers
+    relationShapeIds = pimRelations["ShapeID"].to_numpy() if "ShapeID" in pimRelations.columns else None
+
+    # Generate the ClassIdRef of all the classes at once, and store them in pimClasses after the loop
+    classIdRefs = generateIds(existingIDs, IdLength, len(pimClasses))
+
+    # Iterate through each class in pimClasses DataFrame, reading only the needed columns
+    for classID, className, classIdRef in zip(pimClasses["Class ID"].to_numpy(), pimClasses["Class Name"].to_numpy(),
+                                              classIdRefs):
 
         # Create the Class element with the necessary attributes
         classElement = ET.SubElement(models, 'Class', {
@@ -1230,8 +1237,8 @@ def addClassElement(models, projectAuthor, pimClasses, pimRelations, existingIDs
             'Leaf': 'false',
             'Name': className,
             'PmAuthor': projectAuthor,
-            'PmCreateDateTime': generateTimestamp(),  # Generate creation timestamp
-            'PmLastModified': generateTimestamp(),  # Generate last modified timestamp
+            'PmCreateDateTime': timestamp,  # Creation timestamp
+            'PmLastModified': timestamp,  # Last modified timestamp
             'QualityReason_IsNull': 'true',
             'QualityScore': '-1',
             'Root': 'false',
@@ -1240,36 +1247,24 @@ def addClassElement(models, projectAuthor, pimClasses, pimRelations, existingIDs
             'Visibility': 'public'
         })
 
-        # Filter relations from pimRelations that start from this class (FromSimpleRelationships)
-        fromRelations = pimRelations[pimRelations['From Class ID'] == classID]
+        # Find the relations from pimRelations that start from this class (FromSimpleRelationships)
+        positions = fromRelationPositions.get(classID)
 
-        if not fromRelations.empty:
+        if positions is not None:
             fromSimpleRel = ET.SubElement(classElement, 'FromSimpleRelationships')
-            for _, relRow in fromRelations.iterrows():
-                relType = relRow["Relationship Type"]
-                relIDRef = relRow["ShapeID"]  # Assuming ShapeID is stored in pimRelations
-                relName = ''  # Can be left empty unless specified
-
+            for relType, relIDRef in zip(relationTypes[positions], relationShapeIds[positions]):
                 # Depending on the relationship type, add the corresponding sub-element
-                if relType == 'Generalization':
-                    ET.SubElement(fromSimpleRel, 'Generalization', {'Idref': relIDRef, 'Name': relName})
-                elif relType == 'Usage':
-                    relIDRef = relRow["ShapeID"]  # Assuming ShapeID is stored in pimRelations
-                    relName = ''  # Can be left empty unless specified
-                    ET.SubElement(fromSimpleRel, 'Usage', {'Idref': relIDRef, 'Name': relName})
-                elif relType == 'CompliantWith':
-                    ET.SubElement(fromSimpleRel, 'Dependency',
-                                  {'Idref': relIDRef, 'Name': '&lt;&lt;compliant with&gt;&gt;'})
-                # Add more conditions if needed for other relationship types
-
-        # Filter relations from pimRelations that point to this class (ToSimpleRelationships)
-        toRelations = pimRelations[pimRelations['To Class ID'] == classID]
-
-        if not toRelations.empty:
+                simpleRelationship = FROM_SIMPLE_RELATIONSHIP_ELEMENTS.get(relType)
+                if simpleRelationship is not None:
+                    relTag, relName = simpleRelationship
+                    ET.SubElement(fromSimpleRel, relTag, {'Idref': relIDRef, 'Name': relName})
+
+        # Find the relations from pimRelations that point to this class (ToSimpleRelationships)
+        positions = toRelationPositions.get(classID)
+
+        if positions is not None:
             toSimpleRel = ET.SubElement(classElement, 'ToSimpleRelationships')
-            for _, relRow in toRelations.iterrows():
-                relType = relRow["Relationship Type"]
-                relIDRef = relRow["ShapeID"]  # Assuming ShapeID is stored in pimRelations
+            for relType, relIDRef in zip(relationTypes[positions], relationShapeIds[positions]):
                 relName = ''  # Can be left empty unless specified
 
                 if relType == 'Generalization':
@@ -1279,14 +1274,17 @@ def addClassElement(models, projectAuthor, pimClasses, pimRelations, existingIDs
         masterView = ET.SubElement(classElement, 'MasterView')
         ET.SubElement(masterView, 'Class', {'Idref': classIdRef, 'Name': className})
 
+    pimClasses['ClassIdRef'] = classIdRefs
+
     return models
-def addClassDiagram(diagrams, projectAuthor, classDiagramID, classDiagramName):
+def addClassDiagram(diagrams, projectAuthor, classDiagramID, classDiagramName, timestamp):
     """
     Function to add a ClassDiagram element to the Diagrams section with all the detailed attributes.
 
     Args:
         diagrams: Parent XML element under which the 'ClassDiagram' element will be added.
         projectAuthor: The author of the project.
+        timestamp: Creation and last modified timestamp of the elements.
     """
     # Create the ClassDiagram element with all the specified attributes
     classDiagram = ET.SubElement(diagrams, 'ClassDiagram', {
@@ -1320,8 +1318,8 @@ def addClassDiagram(diagrams, projectAuthor, classDiagramID, classDiagramName):
         'Name': classDiagramName,
         'PaintConnectorThroughLabel': '1',
         'PmAuthor': projectAuthor,
-        'PmCreateDateTime': generateTimestamp(),  # Generate creation timestamp
-        'PmLastModified': generateTimestamp(),  # Generate last modified timestamp
+        'PmCreateDateTime': timestamp,  # Creation timestamp
+        'PmLastModified': timestamp,  # Last modified timestamp
         'PointConnectorEndToCompartmentMember': 'true',
         'QualityScore': '-1',
         'RequestFitSizeWithPromptUser': 'false',
@@ -1400,34 +1398,44 @@ def generateXYValues(pimClasses, pimRelations):
     yPos = 100  # Starting Y coordinate
     zOrderValue = 4  # Starting Z-order value
 
-    # Track placed classes and their positions
-    placedClasses = {}
+    # Track the IDs of the placed classes
+    placedClasses = set()
 
-    # Iterate over each class and assign positions
-    for index, classRow in pimClasses.iterrows():
-        classId = classRow['ClassIdRef']
+    # Index the relationships by class ID once, instead of scanning all of them for each class
+    relationsIndex = buildRelationsIndex(pimRelations)
+    fromClassIds = pimRelations['From Class ID'].to_numpy()
+    toClassIds = pimRelations['To Class ID'].to_numpy()
 
+    # Position of each class in pimClasses, to place related classes without searching the DataFrame
+    classIdRefs = pimClasses['ClassIdRef'].to_numpy()
+    classPositions = {}
+    for position, classIdRef in enumerate(classIdRefs):
+        classPositions.setdefault(classIdRef, position)
+
+    # Coordinates and ZOrder of the classes by position, assigned to pimClasses at the end
+    xValues = np.full(len(pimClasses), np.nan)
+    yValues = np.full(len(pimClasses), np.nan)
+    zOrderValues = np.full(len(pimClasses), np.nan)
+
+    # Iterate over each class and assign positions
+    for position, classId in enumerate(classIdRefs):
         # Check if the class has already been placed (i.e., already has X, Y values)
         if classId in placedClasses:
             continue  # Skip already placed classes
 
         # Assign the initial position for the class if not already placed
-        pimClasses.at[index, 'X'] = xPos
-        pimClasses.at[index, 'Y'] = yPos
-        pimClasses.at[index, 'ZOrder'] = zOrderValue
-        placedClasses[classId] = (xPos, yPos)
+        xValues[position] = xPos
+        yValues[position] = yPos
+        zOrderValues[position] = zOrderValue
+        placedClasses.add(classId)
 
         # Increment ZOrder for the next class
         zOrderValue += 1
 
-        # Fetch all relationships for this class (both as a source and destination)
-        relatedClasses = pimRelations[(pimRelations['From Class ID'] == classId) |
-                                      (pimRelations['To Class ID'] == classId)]
-
-        # For each related class, place it near the current class
-        for _, relation in relatedClasses.iterrows():
-            relatedClassId = relation['To Class ID'] if relation['From Class ID'] == classId else relation[
-                'From Class ID']
+        # For each relationship of this class (both as a source and destination), place the related class near it
+        for relationPosition in relationsIndex.get(classId, []):
+            fromClassId = fromClassIds[relationPosition]
+            relatedClassId = toClassIds[relationPosition] if fromClassId == classId else fromClassId
 
             # Check if the related class has already been placed
             if relatedClassId in placedClasses:
@@ -1437,16 +1445,14 @@ def generateXYValues(pimClasses, pimRelations):
             newXPos = xPos + xOffset
             newYPos = yPos + yOffset
 
-            # Find the index of the related class in pimClasses
-            relatedClassIndex = pimClasses[pimClasses['ClassIdRef'] == relatedClassId].index[0]
-
             # Set the X, Y, and ZOrder values for the related class
-            pimClasses.at[relatedClassIndex, 'X'] = newXPos
-            pimClasses.at[relatedClassIndex, 'Y'] = newYPos
-            pimClasses.at[relatedClassIndex, 'ZOrder'] = zOrderValue
+            relatedClassPosition = classPositions[relatedClassId]
+            xValues[relatedClassPosition] = newXPos
+            yValues[relatedClassPosition] = newYPos
+            zOrderValues[relatedClassPosition] = zOrderValue
 
             # Track the new class placement
-            placedClasses[relatedClassId] = (newXPos, newYPos)
+            placedClasses.add(relatedClassId)
 
             # Increment ZOrder and X/Y for the next related class
             zOrderValue += 1
@@ -1457,7 +1463,123 @@ def generateXYValues(pimClasses, pimRelations):
         xPos += xSpacing
         yPos += ySpacing
 
+    # Assign the coordinates of all the classes at once
+    pimClasses['X'] = xValues
+    pimClasses['Y'] = yValues
+    pimClasses['ZOrder'] = zOrderValues
+
     return pimClasses
+# Attributes of the Class shape of each class in the class diagram; Id, MetaModelElement, Model, Name, X, Y and
+# ZOrder are set for each class, keeping their position
+CLASS_SHAPE_ATTRIBUTES = {
+    "AttributeSortType": "0",
+    "Background": "rgb(245, 245, 245)",
+    "ConnectToPoint": "true",
+    "ConnectionPointType": "2",
+    "CoverConnector": "false",
+    "CreatorDiagramType": "ClassDiagram",
+    "DisplayAsRobustnessAnalysisIcon": "true",
+    "EnumerationLiteralSortType": "0",
+    "Foreground": "rgb(102, 102, 102)",
+    "Height": "40",  # Height is fixed for all classes
+    "Id": "",  # Set for each class
+    "InterfaceBall": "false",
+    "KShDrOp": "false",
+    "KSwCsMbSt": "true",
+    "LShCmMl": "false",
+    "LshRfAts": "0",
+    "MShDrAt": "false",
+    "MSwTpPts": "true",
+    "MetaModelElement": "",  # Set for each class
+    "Model": "",  # Set for each class
+    "ModelElementNameAlignment": "1",
+    "Name": "",  # Set for each class
+    "OperationSortType": "0",
+    "OverrideAppearanceWithStereotypeIcon": "true",
+    "ParentConnectorDTheta": "0.0",
+    "ParentConnectorHeaderLength": "40",
+    "ParentConnectorLineLength": "10",
+    "PresentationOption": "4",
+    "PrimitiveShapeType": "0",
+    "ReceptionSortType": "0",
+    "RequestDefaultSize": "false",
+    "RequestFitSize": "false",
+    "RequestFitSizeFromCenter": "false",
+    "RequestResetCaption": "false",
+    "RequestResetCaptionFitWidth": "false",
+    "RequestResetCaptionSize": "false",
+    "RequestSetSizeOption": "0",
+    "Selectable": "true",
+    "ShowAllocatedFrom": "0",
+    "ShowAllocatedTo": "0",
+    "ShowAttributeType": "1",
+    "ShowAttributesCodeDetails": "0",
+    "ShowAttributesPropertyModifiers": "0",
+    "ShowAttributesType": "0",
+    "ShowClassMemberConstraints": "true",
+    "ShowEllipsisForUnshownMembers": "0",
+    "ShowEmptyCompartments": "0",
+    "ShowEnumerationLiteralType": "1",
+    "ShowInitialAttributeValue": "true",
+    "ShowOperationParameterDirection": "false",
+    "ShowOperationProperties": "false",
+    "ShowOperationRaisedExceptions": "false",
+    "ShowOperationSignature": "true",
+    "ShowOperationTemplateParameters": "false",
+    "ShowOperationType": "1",
+    "ShowOperationsCodeDetails": "0",
+    "ShowOperationsParameters": "0",
+    "ShowOperationsReturnType": "0",
+    "ShowOwnerOption": "3",
+    "ShowParameterNameInOperationSignature": "true",
+    "ShowParametersCodeDetails": "0",
+    "ShowReceptionType": "1",
+    "ShowStereotypeIconName": "0",
+    "ShowTypeOption": "0",
+    "SuppressImplied1MultiplicityForAttribute": "0",
+    "VisibilityStyle": "1",
+    "Width": "163",  # Fixed width for all classes
+    "WpMbs": "false",
+    "X": "",  # Set for each class
+    "Y": "",  # Set for each class
+    "ZOrder": ""  # Set for each class
+
+}
+# Tags and attributes of the sub-elements of every Class shape, which are the same for all classes; the Line also
+# gets an empty Stroke child
+CLASS_SHAPE_SUB_ELEMENTS = (
+    ("ElementFont", {
+        "Color": "rgb(0, 0, 0)",
+        "Name": "Dialog",
+        "Size": "14",
+        "Style": "0"
+    }),
+    ("Line", {
+        "Cap": "0",
+        "Color": "rgb(102, 102, 102)",
+        "Transparency": "0",
+        "Weight": "1.0"
+    }),
+    ("Caption", {
+        "Height": "19",
+        "InternalHeight": "-2147483648",
+        "InternalWidth": "-2147483648",
+        "Side": "FreeMove",
+        "Visible": "true",
+        "Width": "164",
+        "X": "0",
+        "Y": "0"
+    }),
+    ("FillColor", {
+        "Color": "rgb(245, 245, 245)",
+        "Style": "1",
+        "Transparency": "0",
+        "Type": "1"
+    }),
+    ("CompartmentFont", {
+        "Value": "none"
+    }),
+)
 def addClassShapes(shapes, pimClasses, pimRelations):
     """
     Function to add class shapes to the ClassDiagram section of the XML.
@@ -1468,126 +1590,23 @@ def addClassShapes(shapes, pimClasses, pimRelations):
     """
 
     pimClasses = generateXYValues(pimClasses, pimRelations)
-    # Iterate over each row in the pimClasses DataFrame
-    for index, row in pimClasses.iterrows():
-        classIdRef = row['ClassIdRef']
-        className = row['Class Name']
-        xValue = row['X']
-        yValue = row['Y']
-        zOrderValue = row['ZOrder']
+    # Convert the coordinates to strings column-wise, with the same formatting as str() on each value
+    xValues, yValues, zOrderValues = (pimClasses[column].to_numpy().astype(str) for column in ('X', 'Y', 'ZOrder'))
+    # Iterate over each row in the pimClasses DataFrame, reading only the needed columns
+    for classIdRef, className, xValue, yValue, zOrderValue in zip(pimClasses['ClassIdRef'].to_numpy(),
+                                                                  pimClasses['Class Name'].to_numpy(),
+                                                                  xValues, yValues, zOrderValues):
 
         # Add the Class shape for each class
-        classShape = ET.SubElement(shapes, 'Class', {
-            "AttributeSortType": "0",
-            "Background": "rgb(245, 245, 245)",
-            "ConnectToPoint": "true",
-            "ConnectionPointType": "2",
-            "CoverConnector": "false",
-            "CreatorDiagramType": "ClassDiagram",
-            "DisplayAsRobustnessAnalysisIcon": "true",
-            "EnumerationLiteralSortType": "0",
-            "Foreground": "rgb(102, 102, 102)",
-            "Height": "40",  # Height is fixed for all classes
-            "Id": classIdRef,  # The ID from pimClasses
-            "InterfaceBall": "false",
-            "KShDrOp": "false",
-            "KSwCsMbSt": "true",
-            "LShCmMl": "false",
-            "LshRfAts": "0",
-            "MShDrAt": "false",
-            "MSwTpPts": "true",
-            "MetaModelElement": classIdRef,  # Same as ClassIdRef
-            "Model": classIdRef,  # Same as ClassIdRef
-            "ModelElementNameAlignment": "1",
-            "Name": className,  # The class name from pimClasses
-            "OperationSortType": "0",
-            "OverrideAppearanceWithStereotypeIcon": "true",
-            "ParentConnectorDTheta": "0.0",
-            "ParentConnectorHeaderLength": "40",
-            "ParentConnectorLineLength": "10",
-            "PresentationOption": "4",
-            "PrimitiveShapeType": "0",
-            "ReceptionSortType": "0",
-            "RequestDefaultSize": "false",
-            "RequestFitSize": "false",
-            "RequestFitSizeFromCenter": "false",
-            "RequestResetCaption": "false",
-            "RequestResetCaptionFitWidth": "false",
-            "RequestResetCaptionSize": "false",
-            "RequestSetSizeOption": "0",
-            "Selectable": "true",
-            "ShowAllocatedFrom": "0",
-            "ShowAllocatedTo": "0",
-            "ShowAttributeType": "1",
-            "ShowAttributesCodeDetails": "0",
-            "ShowAttributesPropertyModifiers": "0",
-            "ShowAttributesType": "0",
-            "ShowClassMemberConstraints": "true",
-            "ShowEllipsisForUnshownMembers": "0",
-            "ShowEmptyCompartments": "0",
-            "ShowEnumerationLiteralType": "1",
-            "ShowInitialAttributeValue": "true",
-            "ShowOperationParameterDirection": "false",
-            "ShowOperationProperties": "false",
-            "ShowOperationRaisedExceptions": "false",
-            "ShowOperationSignature": "true",
-            "ShowOperationTemplateParameters": "false",
-            "ShowOperationType": "1",
-            "ShowOperationsCodeDetails": "0",
-            "ShowOperationsParameters": "0",
-            "ShowOperationsReturnType": "0",
-            "ShowOwnerOption": "3",
-            "ShowParameterNameInOperationSignature": "true",
-            "ShowParametersCodeDetails": "0",
-            "ShowReceptionType": "1",
-            "ShowStereotypeIconName": "0",
-            "ShowTypeOption": "0",
-            "SuppressImplied1MultiplicityForAttribute": "0",
-            "VisibilityStyle": "1",
-            "Width": "163",  # Fixed width for all classes
-            "WpMbs": "false",
-            "X": str(xValue),  # X value from pimClasses
-            "Y": str(yValue),  # Y value from pimClasses
-            "ZOrder": str(zOrderValue)  # Z value from pimClasses
-        })
+        classShape = ET.SubElement(shapes, 'Class', dict(CLASS_SHAPE_ATTRIBUTES, Id=classIdRef,
+                                                         MetaModelElement=classIdRef, Model=classIdRef,
+                                                         Name=className, X=xValue, Y=yValue, ZOrder=zOrderValue))
 
         # Add additional sub-elements such as ElementFont, Line, Caption, FillColor, etc.
-        ET.SubElement(classShape, "ElementFont", {
-            "Color": "rgb(0, 0, 0)",
-            "Name": "Dialog",
-            "Size": "14",
-            "Style": "0"
-        })
-
-        line = ET.SubElement(classShape, "Line", {
-            "Cap": "0",
-            "Color": "rgb(102, 102, 102)",
-            "Transparency": "0",
-            "Weight": "1.0"
-        })
-        ET.SubElement(line, "Stroke")
-
-        ET.SubElement(classShape, "Caption", {
-            "Height": "19",
-            "InternalHeight": "-2147483648",
-            "InternalWidth": "-2147483648",
-            "Side": "FreeMove",
-            "Visible": "true",
-            "Width": "164",
-            "X": "0",
-            "Y": "0"
-        })
-
-        ET.SubElement(classShape, "FillColor", {
-            "Color": "rgb(245, 245, 245)",
-            "Style": "1",
-            "Transparency": "0",
-            "Type": "1"
-        })
-
-        ET.SubElement(classShape, "CompartmentFont", {
-            "Value": "none"
-        })
+        for tag, attributes in CLASS_SHAPE_SUB_ELEMENTS:
+            subElement = ET.SubElement(classShape, tag, attributes)
+            if tag == "Line":
+                ET.SubElement(subElement, "Stroke")
 
     return shapes
 def addSubElementsToConnector(connector_element, relation_type, from_x, from_y, to_x, to_y):
@@ -1661,6 +1680,49 @@ def addSubElementsToConnector(connector_element, relation_type, from_x, from_y,
     elif relation_type == 'Dependency':
         # Add specific sub-elements for Dependency
         pass  # Dependency only requires the standard elements
+# Attributes shared by all the connectors in the class diagram; Background, From, Height, Id, MetaModelElement, Model,
+# To, Width, X, Y and ZOrder are set for each connector, keeping their position
+CONNECTOR_ATTRIBUTES = {
+    "Background": "",
+    "ConnectorLabelOrientation": "4",
+    "ConnectorLineJumps": "4",
+    "ConnectorStyle": "Follow Diagram",
+    "CreatorDiagramType": "ClassDiagram",
+    "Foreground": "rgb(0, 0, 0)",
+    "From": "",
+    "FromConnectType": "0",
+    "FromPinType": "1",
+    "FromShapeXDiff": "0",
+    "FromShapeYDiff": "0",
+    "Height": "",
+    "Id": "",
+    "MetaModelElement": "",
+    "Model": "",
+    "ModelElementNameAlignment": "9",
+    "PaintThroughLabel": "2",
+    "RequestRebuild": "false",
+    "Selectable": "true",
+    "ShowConnectorName": "2",
+    "To": "",
+    "ToConnectType": "0",
+    "ToPinType": "1",
+    "ToShapeXDiff": "0",
+    "ToShapeYDiff": "0",
+    "UseFromShapeCenter": "true",
+    "UseToShapeCenter": "true",
+    "Width": "",
+    "X": "",
+    "Y": "",
+    "ZOrder": ""
+}
+# Connector tag and extra attributes for each relationship type drawn in the class diagram
+CONNECTOR_ELEMENTS = {
+    'Generalization': ('Generalization', {}),
+    'Aggregation': ('Association', {}),
+    'Association': ('Association', {}),
+    'Usage': ('Usage', {}),
+    'Dependency': ('Dependency', {"Name": "&lt;&lt;compliant with&gt;&gt;"})  # Name field for Dependency relation
+}
 def addConnectorsForRelations(connectors, pimRelations, pimClasses):
     """
     Function to add connectors for relations in the ClassDiagram section, including Dependency relations.
@@ -1673,74 +1735,56 @@ def addConnectorsForRelations(connectors, pimRelations, pimClasses):
 
     zOrderCounter = 100  # Start ZOrder for connectors
 
+    # Without relations there is no connector, nor the ShapeID column added by the relation containers
+    if pimRelations.empty:
+        return connectors
+
+    # Row position in pimClasses of each class ID (first match), instead of filtering pimClasses for each relation
+    class_positions = {}
+    for position, class_id in enumerate(pimClasses['Class ID'].to_numpy()):
+        class_positions.setdefault(class_id, position)
+    from_positions = np.array([class_positions[class_id] for class_id in pimRelations['From Class ID'].to_numpy()],
+                              dtype=np.intp)
+    to_positions = np.array([class_positions[class_id] for class_id in pimRelations['To Class ID'].to_numpy()],
+                            dtype=np.intp)
+
+    # Get X, Y positions and ClassIdRef of the From and To classes of all the relations
+    class_xs = pimClasses['X'].to_numpy()
+    class_ys = pimClasses['Y'].to_numpy()
+    class_id_refs = pimClasses['ClassIdRef'].to_numpy()
+    from_xs, from_ys = class_xs[from_positions], class_ys[from_positions]
+    to_xs, to_ys = class_xs[to_positions], class_ys[to_positions]
+
+    # Generate the midpoints and sizes of all the connectors at once, already formatted as attribute values
+    x_values = ((from_xs + to_xs) / 2).astype(str)
+    y_values = ((from_ys + to_ys) / 2).astype(str)
+    widths = np.abs(from_xs - to_xs).astype(str)
+    heights = np.abs(from_ys - to_ys).astype(str)
+
     # Iterate over each relation in pimRelations DataFrame
-    for _, relation in pimRelations.iterrows():
-        from_class_id = relation['From Class ID']
-        to_class_id = relation['To Class ID']
-        relation_type = relation['Relationship Type']
-        shape_id = relation['ShapeID']
-
-        # Get X, Y positions of From and To classes from pimClasses
-        from_class_position = pimClasses[pimClasses['Class ID'] == from_class_id][['X', 'Y']].values[0]
-        to_class_position = pimClasses[pimClasses['Class ID'] == to_class_id][['X', 'Y']].values[0]
-
-        from_x, from_y = from_class_position
-        to_x, to_y = to_class_position
-
-        # Generate the midpoint for connector X, Y values
-        x_value = (from_x + to_x) / 2
-        y_value = (from_y + to_y) / 2
+    for (relation_type, shape_id, from_class_id, to_class_id, from_x, from_y, to_x, to_y, x_value, y_value, width,
+         height) in zip(pimRelations['Relationship Type'].to_numpy(), pimRelations['ShapeID'].to_numpy(),
+                        class_id_refs[from_positions], class_id_refs[to_positions], from_xs, from_ys, to_xs, to_ys,
+                        x_values, y_values, widths, heights):
         z_order_value = zOrderCounter
         zOrderCounter += 1
 
-        from_class_id = pimClasses[pimClasses['Class ID'] == from_class_id]['ClassIdRef'].values[0]
-        to_class_id = pimClasses[pimClasses['Class ID'] == to_class_id]['ClassIdRef'].values[0]
         # Common attributes for all connectors
-        common_attributes = {
-            "Background": "rgb(255, 255, 255)" if relation_type == 'Generalization' else "rgb(122, 207, 245)",
-            # Different colors for generalization vs others
-            "ConnectorLabelOrientation": "4",
-            "ConnectorLineJumps": "4",
-            "ConnectorStyle": "Follow Diagram",
-            "CreatorDiagramType": "ClassDiagram",
-            "Foreground": "rgb(0, 0, 0)",
-            "From": from_class_id,
-            "FromConnectType": "0",
-            "FromPinType": "1",
-            "FromShapeXDiff": "0",
-            "FromShapeYDiff": "0",
-            "Height": str(abs(from_y - to_y)),
-            "Id": shape_id,
-            "MetaModelElement": shape_id,
-            "Model": shape_id,
-            "ModelElementNameAlignment": "9",
-            "PaintThroughLabel": "2",
-            "RequestRebuild": "false",
-            "Selectable": "true",
-            "ShowConnectorName": "2",
-            "To": to_class_id,
-            "ToConnectType": "0",
-            "ToPinType": "1",
-            "ToShapeXDiff": "0",
-            "ToShapeYDiff": "0",
-            "UseFromShapeCenter": "true",
-            "UseToShapeCenter": "true",
-            "Width": str(abs(from_x - to_x)),
-            "X": str(x_value),
-            "Y": str(y_value),
-            "ZOrder": str(z_order_value)
-        }
+        common_attributes = dict(CONNECTOR_ATTRIBUTES,
+                                 # Different colors for generalization vs others
+                                 Background="rgb(255, 255, 255)" if relation_type == 'Generalization'
+                                 else "rgb(122, 207, 245)",
+                                 From=from_class_id, Height=height, Id=shape_id,
+                                 MetaModelElement=shape_id, Model=shape_id, To=to_class_id,
+                                 Width=width, X=x_value, Y=y_value,
+                                 ZOrder=str(z_order_value))
 
         # Create the connector element based on the relation type
-        if relation_type == 'Generalization':
-            connector_element = ET.SubElement(connectors, 'Generalization', common_attributes)
-        elif relation_type == 'Aggregation' or relation_type == 'Association':
-            connector_element = ET.SubElement(connectors, 'Association', common_attributes)
-        elif relation_type == 'Usage':
-            connector_element = ET.SubElement(connectors, 'Usage', common_attributes)
-        elif relation_type == 'Dependency':  # Add Dependency relation
-            common_attributes["Name"] = "&lt;&lt;compliant with&gt;&gt;"  # Name field for Dependency relation
-            connector_element = ET.SubElement(connectors, 'Dependency', common_attributes)
+        connector = CONNECTOR_ELEMENTS.get(relation_type)
+        if connector is not None:
+            connector_tag, extra_attributes = connector
+            common_attributes.update(extra_attributes)
+            connector_element = ET.SubElement(connectors, connector_tag, common_attributes)
 
         # Add the sub-elements like ElementFont, Line, Caption, Points, and specific elements for each relation type
         addSubElementsToConnector(connector_element, relation_type, from_x, from_y, to_x, to_y)
@@ -1748,6 +1792,8 @@ def addConnectorsForRelations(connectors, pimRelations, pimClasses):
     return connectors
 def TargetXMLCreator(OutputXMLPath: str, projectAuthor: str, projectName: str, classDiagramName: str, inputClasses:
 pd.DataFrame, inputRelations: pd.DataFrame):
+    # All the elements of the project are created in the same run, so they share a single timestamp
+    timestamp = generateTimestamp()
     project = ET.Element("Project", Author=projectAuthor,
                          CommentTableSortAscending="false",
                          CommentTableSortColumn="Date Time",
@@ -1762,12 +1808,12 @@ pd.DataFrame, inputRelations: pd.DataFrame):
     logicalView = ET.SubElement(projectInfo, "LogicalView")
     addStaticProjectOptions(projectInfo)
     models = ET.SubElement(project, 'Models')
-    addStaticDataType(models, projectAuthor)
+    addStaticDataType(models, projectAuthor, timestamp)
     ### MODEL RELATIONS CONTAINER ####
     existingIDs = getExistingIds(inputClasses)
     IdLength = getIdLength(inputClasses)
 
-    usageStereotypeIdRef = addUsageStereotype(projectAuthor, models, existingIDs, IdLength)
+    usageStereotypeIdRef = addUsageStereotype(projectAuthor, models, existingIDs, IdLength, timestamp)
     IDContainer = generateId(existingIDs, IdLength)
     relationContainer = ET.SubElement(models, 'ModelRelationshipContainer',
                                       BacklogActivityId="0",
@@ -1783,20 +1829,20 @@ pd.DataFrame, inputRelations: pd.DataFrame):
                                       UserID_IsNull="true")
 
     modelChildren = ET.SubElement(relationContainer, 'ModelChildren')
-    modelChildren = addUsageRelationContainer(projectAuthor, modelChildren, inputRelations, inputClasses, usageStereotypeIdRef,existingIDs, IdLength)
-    modelChildren = addAssociationRelationContainer(projectAuthor, modelChildren, inputRelations, inputClasses, existingIDs, IdLength)
-    modelChildren = addGeneralizationRelationContainer(projectAuthor, modelChildren, inputRelations, inputClasses, existingIDs, IdLength)
-    modelChildren = addDependencyRelationContainer(projectAuthor, modelChildren, inputRelations, inputClasses, existingIDs, IdLength)
+    modelChildren = addUsageRelationContainer(projectAuthor, modelChildren, inputRelations, inputClasses, usageStereotypeIdRef,existingIDs, IdLength, timestamp)
+    modelChildren = addAssociationRelationContainer(projectAuthor, modelChildren, inputRelations, inputClasses, existingIDs, IdLength, timestamp)
+    modelChildren = addGeneralizationRelationContainer(projectAuthor, modelChildren, inputRelations, inputClasses, existingIDs, IdLength, timestamp)
+    modelChildren = addDependencyRelationContainer(projectAuthor, modelChildren, inputRelations, inputClasses, existingIDs, IdLength, timestamp)
 
     #################################
     ### CLASS  ####
-    models = addClassElement(models, projectAuthor, inputClasses, inputRelations, existingIDs, IdLength)
+    models = addClassElement(models, projectAuthor, inputClasses, inputRelations, existingIDs, IdLength, timestamp)
     ###############
 
     ############## DIAGRAM #############
     diagrams = ET.SubElement(project, 'Diagrams')
     classDiagramID = generateId(existingIDs, IdLength)
-    classDiagram = addClassDiagram(diagrams, projectAuthor, classDiagramID, classDiagramName)
+    classDiagram = addClassDiagram(diagrams, projectAuthor, classDiagramID, classDiagramName, timestamp)
     shapes = ET.SubElement(classDiagram, 'Shapes')
     shapes = addClassShapes(shapes, inputClasses, inputRelations)
     connectors = ET.SubElement(classDiagram, 'Connectors')
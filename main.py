@@ -1,3 +1,4 @@
+import logging
 from TransformationRules.constants import (CIM_VP_XML_FILE_PATH, CIM_IMPORTED_CLASSES_FILE_PATH,
                                            CIM_IMPORTED_RELATIONS_FILE_PATH, PIM_M2MT_XML_FILE_PATH,
                                            PIM_PROJECT_NAME, PIM_CLASS_DIAGRAM_NAME, PIM_PROJECT_AUTHOR,
@@ -9,20 +10,23 @@ from TransformationRules.xmlutils import SourceXMLParser, saveToCsv, TargetXMLCr
 from TransformationRules.CIM2PIM.cim2pim import cim2pimTransformation
 from TransformationRules.PIM2PSM.pim2psm import pim2psmTransformation
 
+# Logger of the intermediate DataFrames; they are only formatted when debug logging is enabled
+logger = logging.getLogger(__name__)
+
 def main():
 
     ############ CIM TO PIM TRANSFORMATION STEP ############
 
     #1. Read classes and relations from VP_GENERATED_XML CIM
     imported_cimClasses, imported_cimRelations = SourceXMLParser(CIM_VP_XML_FILE_PATH)
-    #print(imported_cimClasses)
-    #print(imported_cimRelations)
+    logger.debug("%s", imported_cimClasses)
+    logger.debug("%s", imported_cimRelations)
     saveToCsv(imported_cimClasses, imported_cimRelations, CIM_IMPORTED_CLASSES_FILE_PATH, CIM_IMPORTED_RELATIONS_FILE_PATH)
 
     #2. Apply CIM2PIM transformation rules
     generated_pimClasses, generated_pimRelations = cim2pimTransformation(cimClasses=imported_cimClasses, cimRelations=imported_cimRelations)
-    #print(generated_pimClasses)
-    #print(generated_pimRelations)
+    logger.debug("%s", generated_pimClasses)
+    logger.debug("%s", generated_pimRelations)
     saveToCsv(generated_pimClasses, generated_pimRelations, PIM_GENERATED_CLASSES_FILE_PATH, PIM_GENERATED_RELATIONS_FILE_PATH)
 
     #3. Convert the PIM classes and relations into XML file in PIM/M2MT_GENERATED_XML
@@ -36,7 +40,7 @@ def main():
 
     # 2. Apply PIM2PSM transformation rules
     generated_psmClasses, generated_psmRelations = pim2psmTransformation(generated_pimClasses, generated_pimRelations)
-    print(generated_psmClasses, generated_psmRelations)
+    logger.debug("%s\n%s", generated_psmClasses, generated_psmRelations)
     saveToCsv(generated_psmClasses, generated_psmRelations, PSM_GENERATED_CLASSES_FILE_PATH,
               PSM_GENERATED_RELATIONS_FILE_PATH)
     # 3. Convert the PSM classes and relations into XML file in PSM/M2MT_GENERATED_XML
@@ -45,4 +49,6 @@ def main():
 
 
 if __name__ == "__main__":
+        # Warnings are shown by default; set level=logging.DEBUG to also report the saved files and intermediate data
+        logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(name)s: %(message)s")
         main()
\ No newline at end of file